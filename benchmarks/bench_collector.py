@@ -0,0 +1,139 @@
+"""Per-item overhead and tail latency of the API collector.
+
+Compares the current sentinel-driven collector against the previous one,
+which polled ``asyncio.wait_for(queue.get(), timeout=60 or 5)`` (kept here
+as a reference copy). Two measurements:
+
+* per-item overhead: a prefilled queue of N items drained to completion
+* tail latency for small runs: a fake scraper emits a handful of items and
+  returns; tail is the time from the scraper returning to the API call
+  returning, and time-to-last-item comes from the collector's own stats
+
+    python benchmarks/bench_collector.py
+    python benchmarks/bench_collector.py --items 200000 --json out.json
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+import newswatch.api as api
+
+
+async def _legacy_collect(queue, scrapers_done_event):
+    results = []
+    while True:
+        timeout = 5 if scrapers_done_event.is_set() else 60
+        try:
+            item = await asyncio.wait_for(queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            if scrapers_done_event.is_set():
+                break
+            continue
+        if item is None:
+            break
+        results.append(item)
+    return results
+
+
+async def _current_collect(queue, _done):
+    return await api._collect_queue_results(queue)
+
+
+async def _drain_ns(collect, n_items):
+    queue = asyncio.Queue()
+    for i in range(n_items):
+        queue.put_nowait({"title": "t", "link": f"https://example.com/{i}"})
+    queue.put_nowait(None)
+    done = asyncio.Event()
+    done.set()
+    start = time.perf_counter()
+    results = await collect(queue, done)
+    elapsed = time.perf_counter() - start
+    assert len(results) == n_items
+    return elapsed / n_items * 1e9
+
+
+def _small_run(n_items, runs):
+    scraper_returned = []
+
+    class _Fake:
+        def __init__(self, keywords, start_date=None, queue_=None, **kwargs):
+            self.queue_ = queue_
+
+        async def scrape(self, method="search"):
+            for i in range(n_items):
+                await self.queue_.put({"title": "t", "link": f"https://example.com/{i}"})
+                await asyncio.sleep(0.001)
+            scraper_returned.append(time.perf_counter())
+
+    stats = []
+    real_stats = api._CollectorStats
+
+    def _recording_stats():
+        s = real_stats()
+        stats.append(s)
+        return s
+
+    tails = []
+    with mock.patch.object(
+        api, "get_available_scrapers", lambda method="search": {"fake": {"class": _Fake, "params": {}}}
+    ), mock.patch.object(
+        api, "get_scraper_by_slug", lambda slug: SimpleNamespace(browser_required=False)
+    ), mock.patch.object(api, "_CollectorStats", _recording_stats):
+        for _ in range(runs):
+            api.scrape("bench", "2026-01-01", verbose=True)
+            tails.append(time.perf_counter() - scraper_returned[-1])
+
+    tails.sort()
+    last = [s.as_dict()["time_to_last_item"] for s in stats]
+    return {
+        "tail_ms_p50": round(tails[len(tails) // 2] * 1e3, 3),
+        "tail_ms_max": round(tails[-1] * 1e3, 3),
+        "time_to_last_item_ms_p50": round(sorted(last)[len(last) // 2] * 1e3, 3),
+    }
+
+
+def run(n_items, small_items, runs):
+    results = []
+    for name, collect in (("legacy wait_for", _legacy_collect), ("sentinel", _current_collect)):
+        results.append(
+            {
+                "collector": name,
+                "items": n_items,
+                "per_item_ns": round(asyncio.run(_drain_ns(collect, n_items))),
+            }
+        )
+    small = _small_run(small_items, runs)
+    return {"drain": results, "small_run": {"items": small_items, "runs": runs, **small}}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--small-items", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--json", dest="json_path", default=None)
+    args = parser.parse_args()
+
+    results = run(args.items, args.small_items, args.runs)
+    fmt = "{:<16} {:>10} {:>12}"
+    print(fmt.format("COLLECTOR", "ITEMS", "PER_ITEM_NS"))
+    for r in results["drain"]:
+        print(fmt.format(r["collector"], r["items"], r["per_item_ns"]))
+    small = results["small_run"]
+    print(
+        f"\nsmall API run ({small['items']} items, {small['runs']} runs): "
+        f"tail p50 {small['tail_ms_p50']} ms, max {small['tail_ms_max']} ms, "
+        f"time-to-last-item p50 {small['time_to_last_item_ms_p50']} ms"
+    )
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""DataFrame construction and JSONL export cost for scrape_to_dataframe.
+
+Compares the previous path (stringify publish_date in the collector, build
+from a list of dicts, parse the strings back with ``pd.to_datetime``,
+``iterrows`` + ``json.dumps`` for JSONL) against the column buffers and the
+vectorized ``to_json(lines=True)`` writer.
+
+    python benchmarks/bench_dataframe.py                  # 10k, 100k, 1M rows
+    python benchmarks/bench_dataframe.py --rows 10000 --json out.json
+
+The legacy JSONL writer is only timed up to ``--legacy-jsonl-max`` rows;
+beyond that it takes minutes.
+"""
+
+import argparse
+import gc
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from newswatch.api import _ArticleColumns
+
+_SOURCES = ("kompas", "detik", "cnbcindonesia", "tempo", "kontan", "antaranews")
+_CATEGORIES = ("Ekonomi", "Bisnis", "Nasional", "Market")
+
+
+def _items(n):
+    base = datetime(2026, 1, 1)
+    for i in range(n):
+        yield {
+            "title": f"Judul berita nomor {i}",
+            "publish_date": base + timedelta(minutes=i),
+            "author": f"Penulis {i % 50}",
+            "content": "Isi artikel " * 40,
+            "keyword": ("ihsg", "saham", "rupiah")[i % 3],
+            "category": _CATEGORIES[i % len(_CATEGORIES)],
+            "source": _SOURCES[i % len(_SOURCES)],
+            "link": f"https://example.com/read/{i}",
+        }
+
+
+def _legacy_frame(n):
+    results = []
+    for item in _items(n):
+        item["publish_date"] = item["publish_date"].strftime("%Y-%m-%d %H:%M:%S")
+        results.append(item)
+    df = pd.DataFrame(results, columns=list(_ArticleColumns.COLUMNS))
+    df["publish_date"] = pd.to_datetime(df["publish_date"], errors="coerce")
+    return df
+
+
+def _columnar_frame(n):
+    columns = _ArticleColumns()
+    for item in _items(n):
+        columns.append(item)
+    return columns.to_dataframe()
+
+
+def _legacy_jsonl(df, path):
+    with open(path, mode="w", encoding="utf-8") as f:
+        for _, row in df.iterrows():
+            f.write(json.dumps(row.to_dict(), ensure_ascii=False, default=str) + "\n")
+
+
+def _vectorized_jsonl(df, path):
+    df = df.copy()
+    df["publish_date"] = df["publish_date"].dt.strftime("%Y-%m-%d %H:%M:%S")
+    df.to_json(path, orient="records", lines=True, force_ascii=False)
+
+
+def _timed(fn, *args):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    out = fn(*args)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return out, elapsed, peak
+
+
+def run(row_counts, legacy_jsonl_max):
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "out.jsonl")
+        for n in row_counts:
+            for name, build, write in (
+                ("legacy", _legacy_frame, _legacy_jsonl),
+                ("columnar", _columnar_frame, _vectorized_jsonl),
+            ):
+                df, build_s, peak = _timed(build, n)
+                if name == "legacy" and n > legacy_jsonl_max:
+                    jsonl_s = None
+                else:
+                    _, jsonl_s, _ = _timed(write, df, path)
+                results.append(
+                    {
+                        "path": name,
+                        "rows": n,
+                        "build_seconds": round(build_s, 3),
+                        "build_peak_mb": round(peak / 2**20, 1),
+                        "frame_mb": round(df.memory_usage(deep=True).sum() / 2**20, 1),
+                        "jsonl_seconds": None if jsonl_s is None else round(jsonl_s, 3),
+                    }
+                )
+                del df
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--legacy-jsonl-max", type=int, default=100_000)
+    parser.add_argument("--json", dest="json_path", default=None)
+    args = parser.parse_args()
+
+    results = run(args.rows, args.legacy_jsonl_max)
+    fmt = "{:<9} {:>9} {:>8} {:>8} {:>9} {:>8}"
+    print(fmt.format("PATH", "ROWS", "BUILD_S", "PEAK_MB", "FRAME_MB", "JSONL_S"))
+    for r in results:
+        print(
+            fmt.format(
+                r["path"], r["rows"], r["build_seconds"], r["build_peak_mb"],
+                r["frame_mb"], "-" if r["jsonl_seconds"] is None else r["jsonl_seconds"],
+            )
+        )
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
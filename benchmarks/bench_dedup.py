@@ -0,0 +1,101 @@
+"""Memory and lookup cost of the dedup link set.
+
+Compares the historical ``set`` of URL strings against ``LinkSet`` (sorted
+64-bit keys), with and without its Bloom-filter front, at a realistic dedup
+size. Lookups are half hits and half misses, which is what a run against a
+year of prior output sees.
+
+    python benchmarks/bench_dedup.py                 # 5M links
+    python benchmarks/bench_dedup.py --links 500000 --json out.json
+"""
+
+import argparse
+import gc
+import json
+import random
+import time
+import tracemalloc
+
+from newswatch.dedup import LinkSet
+
+_HOSTS = ("www.kompas.com", "news.detik.com", "www.cnbcindonesia.com", "tirto.id")
+
+
+def _links(n, seed):
+    rng = random.Random(seed)
+    for i in range(n):
+        host = _HOSTS[i % len(_HOSTS)]
+        yield f"https://{host}/read/2026/{i % 12 + 1:02d}/{rng.getrandbits(40):x}/artikel-{i}"
+
+
+def _measure(build):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    obj = build()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, elapsed, current, peak
+
+
+def _lookup_ns(container, probes):
+    start = time.perf_counter()
+    for link in probes:
+        link in container  # noqa: B015
+    return (time.perf_counter() - start) / len(probes) * 1e9
+
+
+def run(n_links, n_probes):
+    probes = list(_links(n_probes // 2, seed=1)) + [
+        f"https://tirto.id/miss-{i}" for i in range(n_probes // 2)
+    ]
+    results = []
+    cases = (
+        ("set[str]", lambda: set(_links(n_links, seed=1))),
+        ("LinkSet", lambda: LinkSet.from_links(_links(n_links, seed=1))),
+        (
+            "LinkSet+bloom",
+            lambda: LinkSet.from_links(_links(n_links, seed=1), bloom_error_rate=0.01),
+        ),
+    )
+    for name, build in cases:
+        container, build_s, held, peak = _measure(build)
+        results.append(
+            {
+                "structure": name,
+                "links": n_links,
+                "build_seconds": round(build_s, 2),
+                "held_mb": round(held / 2**20, 1),
+                "peak_mb": round(peak / 2**20, 1),
+                "lookup_ns": round(_lookup_ns(container, probes)),
+            }
+        )
+        del container
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--links", type=int, default=5_000_000)
+    parser.add_argument("--probes", type=int, default=200_000)
+    parser.add_argument("--json", dest="json_path", default=None)
+    args = parser.parse_args()
+
+    results = run(args.links, args.probes)
+    fmt = "{:<15} {:>10} {:>9} {:>9} {:>10}"
+    print(fmt.format("STRUCTURE", "BUILD_S", "HELD_MB", "PEAK_MB", "LOOKUP_NS"))
+    for r in results:
+        print(
+            fmt.format(
+                r["structure"], r["build_seconds"], r["held_mb"], r["peak_mb"], r["lookup_ns"]
+            )
+        )
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""End-to-end scraping throughput against a local stand-in news server.
+
+Starts ``standin_server.py`` in its own process and runs full scrapes
+through ``main.main`` (the CLI path, writing CSV) and ``api.scrape`` for
+search and latest mode. Each scenario runs in a fresh process so peak RSS
+and CPU time belong to that scenario alone; the server's CPU is not counted.
+Reported per scenario: articles, wall seconds, articles/sec, p50/p95
+article latency (``get_article`` spans: fetch plus parse), peak RSS, CPU
+milliseconds per article, and the requests, 429s and block pages the
+server handed out.
+
+    python benchmarks/bench_e2e.py
+    python benchmarks/bench_e2e.py --latency-ms 80 --rate-429 0.02 --json e2e.json
+    python benchmarks/bench_e2e.py --compare e2e-main.json
+
+With ``--archive DIR`` the registry scrapers themselves run against a
+``--record`` archive through replay instead of the stand-in sites
+(``--scrapers`` picks which; default all), which measures the real parsers.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import csv
+import io
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from argparse import Namespace
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from standin_server import ServerConfig, build_app, make_scrapers  # noqa: E402
+
+from newswatch.utils import nearest_rank_percentile  # noqa: E402
+
+SCENARIOS = ("main/search", "main/latest", "api/search", "api/latest")
+
+
+def _serve(config, port_queue):
+    from aiohttp import web
+
+    async def run():
+        runner = web.AppRunner(build_app(config), access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port_queue.put(runner.addresses[0][1])
+        await asyncio.Event().wait()
+
+    asyncio.run(run())
+
+
+def _server_stats(server_url):
+    import urllib.request
+
+    with urllib.request.urlopen(f"{server_url}/_stats") as response:
+        return json.load(response)
+
+
+def _drive(driver, method, scrapers, start_date, output_path):
+    import newswatch.api as api
+    from newswatch.main import main as run_main
+
+    if driver == "main":
+        with contextlib.redirect_stdout(io.StringIO()):
+            asyncio.run(run_main(Namespace(
+                method=method, keywords="saham", start_date=start_date, scrapers=scrapers,
+                output_path=output_path, output_format="csv", max_concurrent_scrapers=6,
+            )))
+        with open(output_path, newline="", encoding="utf-8") as f:
+            return sum(1 for _ in csv.DictReader(f))
+    results = api.scrape(
+        keywords="saham", start_date=start_date, scrapers=scrapers, method=method, timeout=600,
+    )
+    return len(results)
+
+
+def _run_scenario(scenario, server_url, sites, archive_dir, scrapers):
+    """One scenario in a fresh process; returns its measurements."""
+    from newswatch import archive, tracing
+
+    logging.disable(logging.CRITICAL)
+    driver, method = scenario.split("/")
+    start_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+
+    with contextlib.ExitStack() as stack:
+        tmp = stack.enter_context(tempfile.TemporaryDirectory())
+        if archive_dir:
+            stack.enter_context(archive.replaying(archive_dir))
+        else:
+            standins = make_scrapers(server_url, sites)
+            for module in ("newswatch.main", "newswatch.api"):
+                stack.enter_context(mock.patch(
+                    f"{module}.get_available_scrapers", lambda method="search": standins
+                ))
+        tracer = stack.enter_context(tracing.recording())
+        before = _server_stats(server_url) if server_url else {}
+        cpu_started = time.process_time()
+        started = time.perf_counter()
+        articles = _drive(driver, method, scrapers, start_date, os.path.join(tmp, "out.csv"))
+        seconds = time.perf_counter() - started
+        cpu = time.process_time() - cpu_started
+        after = _server_stats(server_url) if server_url else {}
+
+    latencies = sorted(
+        (span.end_ns - span.start_ns) / 1e6 for span in tracer.spans if span.name == "get_article"
+    )
+    return {
+        "scenario": scenario,
+        "articles": articles,
+        "seconds": round(seconds, 3),
+        "articles_per_sec": round(articles / seconds, 1) if seconds else None,
+        "p50_article_ms": nearest_rank_percentile(latencies, 50),
+        "p95_article_ms": nearest_rank_percentile(latencies, 95),
+        # ru_maxrss is KiB on Linux
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "cpu_ms_per_article": round(cpu * 1000 / articles, 2) if articles else None,
+        **{f"server_{k}": after[k] - before.get(k, 0) for k in after},
+    }
+
+
+def _commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(config, scenarios, archive_dir=None, scrapers="all"):
+    context = multiprocessing.get_context("spawn")
+    server = None
+    server_url = None
+    if not archive_dir:
+        port_queue = context.Queue()
+        server = context.Process(target=_serve, args=(config, port_queue), daemon=True)
+        server.start()
+        server_url = f"http://127.0.0.1:{port_queue.get(timeout=30)}"
+        scrapers = "all"
+    results = []
+    try:
+        for scenario in scenarios:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                result = pool.submit(
+                    _run_scenario, scenario, server_url, config.sites, archive_dir, scrapers
+                ).result()
+            for key in ("p50_article_ms", "p95_article_ms"):
+                if result[key] is not None:
+                    result[key] = round(result[key], 1)
+            results.append(result)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.join()
+    return {
+        "commit": _commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "config": {**asdict(config), "archive": archive_dir, "scrapers": scrapers},
+        "results": results,
+    }
+
+
+def _print(report, baseline=None):
+    fmt = "{:<12} {:>8} {:>8} {:>9} {:>8} {:>8} {:>8} {:>9}"
+    print(fmt.format("SCENARIO", "ARTICLES", "SECONDS", "ART/SEC", "P95_MS", "RSS_MB", "CPU_MS/A", "VS_BASE"))
+    before = {r["scenario"]: r for r in (baseline or {}).get("results", [])}
+    for r in report["results"]:
+        old = before.get(r["scenario"])
+        change = "-"
+        if old and old.get("articles_per_sec") and r["articles_per_sec"]:
+            change = f"{(r['articles_per_sec'] / old['articles_per_sec'] - 1) * 100:+.1f}%"
+        print(fmt.format(
+            r["scenario"], r["articles"], r["seconds"], r["articles_per_sec"] or "-",
+            r["p95_article_ms"] or "-", r["peak_rss_mb"], r["cpu_ms_per_article"] or "-", change,
+        ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    defaults = ServerConfig()
+    for field, value in asdict(defaults).items():
+        parser.add_argument(f"--{field.replace('_', '-')}", type=type(value), default=value)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--archive", default=None, metavar="DIR")
+    parser.add_argument("--scrapers", default="all")
+    parser.add_argument("--compare", default=None, metavar="JSON")
+    parser.add_argument("--json", dest="json_path", default=None)
+    args = parser.parse_args()
+
+    config = ServerConfig(**{k: getattr(args, k) for k in asdict(defaults)})
+    report = run(config, args.scenarios, args.archive, args.scrapers)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    _print(report, baseline)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
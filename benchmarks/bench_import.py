@@ -0,0 +1,176 @@
+"""Startup cost of the package and the CLI, measured with ``-X importtime``.
+
+Each target runs in a fresh interpreter ``--repeat`` times; the table shows
+the median total import time (sum of ``-X importtime`` self times), the
+median wall time of the whole process, how many scraper modules were
+imported, and which of the heavy optional imports (pandas, Playwright,
+dateparser, bs4) were loaded. Those should only appear when a run needs them.
+
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --json import.json
+    python benchmarks/bench_import.py --compare import-main.json --max-regression 20
+    python benchmarks/bench_import.py --top 15 --targets list_scrapers
+
+With ``--max-regression PCT`` the script exits non-zero when any target's
+import time grew by more than PCT percent over the ``--compare`` baseline,
+so it can gate a CI job.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+HEAVY = ("pandas", "playwright", "dateparser", "bs4", "numpy", "aiohttp")
+
+_REPORT = (
+    "import sys, json\n"
+    "mods = sorted(m for m in sys.modules if m.split('.')[0] in {heavy!r} and '.' not in m)\n"
+    "scrapers = [m for m in sys.modules if m.startswith('newswatch.scrapers.')"
+    " and m != 'newswatch.scrapers.basescraper']\n"
+    "sys.stderr.write('@@' + json.dumps({{'heavy': mods, 'scrapers': len(scrapers)}}) + '\\n')\n"
+)
+
+TARGETS = {
+    "import": "import newswatch",
+    "import_api": "import newswatch.api",
+    "import_cli": "import newswatch.cli",
+    "list_scrapers": (
+        "import sys, contextlib, io\n"
+        "sys.argv = ['newswatch', '--list_scrapers']\n"
+        "from newswatch.cli import cli\n"
+        "with contextlib.redirect_stdout(io.StringIO()):\n"
+        "    cli()\n"
+    ),
+    "single_source": (
+        "from newswatch.main import get_available_scrapers\n"
+        "get_available_scrapers('search')['kompas']\n"
+    ),
+    "help": (
+        "import sys, contextlib, io\n"
+        "sys.argv = ['newswatch', '--help']\n"
+        "from newswatch.cli import cli\n"
+        "with contextlib.redirect_stdout(io.StringIO()):\n"
+        "    try:\n"
+        "        cli()\n"
+        "    except SystemExit:\n"
+        "        pass\n"
+    ),
+}
+
+
+def _parse_importtime(stderr):
+    """(total microseconds, {module: (self_us, cumulative_us)}, report dict)."""
+    modules, report = {}, {}
+    for line in stderr.splitlines():
+        if line.startswith("@@"):
+            report = json.loads(line[2:])
+            continue
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return sum(s for s, _ in modules.values()), modules, report
+
+
+def measure(code, repeat):
+    totals, walls, modules, report = [], [], {}, {}
+    program = code + "\n" + _REPORT.format(heavy=HEAVY)
+    for _ in range(repeat):
+        started = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", program],
+            capture_output=True, text=True, check=True,
+            env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        )
+        walls.append((time.perf_counter() - started) * 1000)
+        total, modules, report = _parse_importtime(proc.stderr)
+        totals.append(total / 1000)
+    return {
+        "import_ms": round(statistics.median(totals), 1),
+        "wall_ms": round(statistics.median(walls), 1),
+        "modules": len(modules),
+        "scraper_modules": report.get("scrapers"),
+        "heavy": report.get("heavy", []),
+    }, modules
+
+
+def _commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _print(results, baseline=None):
+    fmt = "{:<14} {:>10} {:>9} {:>8} {:>9} {:>9}  {}"
+    print(fmt.format("TARGET", "IMPORT_MS", "WALL_MS", "MODULES", "SCRAPERS", "VS_BASE", "HEAVY"))
+    before = (baseline or {}).get("results", {})
+    for name, r in results.items():
+        old = before.get(name)
+        change = "-"
+        if old and old.get("import_ms"):
+            change = f"{(r['import_ms'] / old['import_ms'] - 1) * 100:+.1f}%"
+        print(fmt.format(
+            name, r["import_ms"], r["wall_ms"], r["modules"], r["scraper_modules"], change,
+            ",".join(r["heavy"]) or "-",
+        ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--targets", nargs="+", choices=list(TARGETS), default=list(TARGETS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=0,
+                        help="also list the N slowest imports (cumulative) of each target")
+    parser.add_argument("--compare", default=None, metavar="JSON")
+    parser.add_argument("--max-regression", type=float, default=None, metavar="PCT")
+    parser.add_argument("--json", dest="json_path", default=None)
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.targets:
+        results[name], modules = measure(TARGETS[name], args.repeat)
+        if args.top:
+            print(f"{name}: slowest imports (cumulative ms)")
+            slowest = sorted(modules.items(), key=lambda kv: kv[1][1], reverse=True)
+            for module, (_, cumulative) in slowest[: args.top]:
+                print(f"  {cumulative / 1000:8.1f}  {module}")
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    _print(results, baseline)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "commit": _commit(),
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "repeat": args.repeat,
+                "results": results,
+            }, f, indent=2)
+
+    if baseline and args.max_regression is not None:
+        regressed = [
+            name for name, r in results.items()
+            if baseline["results"].get(name, {}).get("import_ms")
+            and r["import_ms"] > baseline["results"][name]["import_ms"] * (1 + args.max_regression / 100)
+        ]
+        if regressed:
+            print(f"Import time regressed by more than {args.max_regression}%: {', '.join(regressed)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Per-article CPU time of article extraction: full soup vs the JSON-LD fast path.
+
+Runs ``HukumonlineScraper.get_article`` on a synthetic article page of
+realistic size (navigation, related-article rails, a long body) with the
+fetch stubbed out, so only parsing is timed. Cases:
+
+- ``soup``: the page parsed with BeautifulSoup and every field read from
+  the DOM, which is what ``get_article`` did for every article before
+  ``page_metadata()``.
+- ``fast, full ld``: JSON-LD carries headline, date, author, section and
+  articleBody; no soup is built.
+- ``fast, no body``: JSON-LD without articleBody; the soup is still built
+  for the body.
+- ``fast, too old``: the article predates ``start_date`` and is dropped
+  from its head metadata.
+
+    python benchmarks/bench_pagemeta.py
+    python benchmarks/bench_pagemeta.py --articles 500 --json out.json
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import time
+from datetime import datetime
+
+from bs4 import BeautifulSoup
+
+from newswatch.scrapers.hukumonline import HukumonlineScraper
+
+_LINK = "https://www.hukumonline.com/berita/a/contoh-artikel-lt0000000000001"
+_PARAGRAPH = (
+    "Mahkamah Konstitusi menggelar sidang lanjutan pengujian undang-undang dengan "
+    "agenda mendengarkan keterangan ahli yang dihadirkan oleh para pemohon perkara. "
+)
+
+
+def _page(with_body=True, published="2026-07-12T10:00:00+07:00"):
+    body = "".join(f"<p>{_PARAGRAPH * 3}</p>" for _ in range(30))
+    ld = {
+        "@context": "https://schema.org",
+        "@graph": [
+            {"@type": "WebSite", "name": "Hukumonline", "url": "https://www.hukumonline.com"},
+            {
+                "@type": "NewsArticle",
+                "headline": "Contoh judul artikel hukum",
+                "datePublished": published,
+                "author": {"@type": "Person", "name": "Redaksi Hukumonline"},
+                "articleSection": "Berita",
+                **({"articleBody": (_PARAGRAPH * 3 + "\n") * 30} if with_body else {}),
+            },
+        ],
+    }
+    nav = "".join(f'<li><a href="/berita/kategori-{i}">Kategori {i}</a></li>' for i in range(150))
+    rail = "".join(
+        f'<div class="related-item"><a href="/berita/a/lain-{i}"><img src="/img/{i}.jpg">'
+        f"<span>Artikel terkait nomor {i}</span></a></div>"
+        for i in range(120)
+    )
+    return (
+        "<!doctype html><html><head>"
+        '<meta charset="utf-8"><title>Contoh judul artikel hukum</title>'
+        '<meta property="og:title" content="Contoh judul artikel hukum">'
+        '<meta name="author" content="Redaksi Hukumonline">'
+        f'<meta property="article:published_time" content="{published}">'
+        + "".join(f'<link rel="preload" href="/static/{i}.js" as="script">' for i in range(40))
+        + f'<script type="application/ld+json">{json.dumps(ld)}</script>'
+        "</head><body>"
+        f"<header><nav><ul>{nav}</ul></nav></header>"
+        f"<main><article>{body}</article><aside class='sidebar'>{rail}</aside></main>"
+        "<footer>" + "<p>Footer</p>" * 50 + "</footer></body></html>"
+    )
+
+
+def _soup_path(scraper, page):
+    soup = BeautifulSoup(page, "html.parser")
+    scraper._extract_title(soup)
+    scraper._extract_date(soup, _LINK)
+    scraper._extract_author_section(soup)
+    scraper._extract_content(soup)
+
+
+def _get_article(page, start_date=None):
+    scraper = HukumonlineScraper(keywords="hukum", start_date=start_date, queue_=asyncio.Queue())
+
+    async def fetch(*args, **kwargs):
+        return page
+
+    async def article():
+        await scraper.get_article(_LINK, "hukum")
+        while not scraper.queue_.empty():
+            scraper.queue_.get_nowait()
+
+    scraper.fetch = fetch
+    return lambda: asyncio.run(article())
+
+
+def _cpu_ms(func, n):
+    func()  # warm-up: imports, regex compilation
+    gc.collect()  # not the previous case's garbage
+    start = time.process_time()
+    for _ in range(n):
+        func()
+    return (time.process_time() - start) / n * 1000
+
+
+def run(n_articles):
+    full, bare = _page(), _page(with_body=False)
+    cases = (
+        ("soup", full, lambda: _soup_path(HukumonlineScraper(keywords="hukum"), full)),
+        ("fast, full ld", full, _get_article(full)),
+        ("fast, no body", bare, _get_article(bare)),
+        ("fast, too old", full, _get_article(full, start_date=datetime(2026, 8, 1))),
+    )
+    return [
+        {
+            "case": name,
+            "page_kb": round(len(page.encode()) / 1024),
+            "articles": n_articles,
+            "cpu_ms_per_article": round(_cpu_ms(func, n_articles), 3),
+        }
+        for name, page, func in cases
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=200)
+    parser.add_argument("--json", dest="json_path", default=None)
+    args = parser.parse_args()
+
+    results = run(args.articles)
+    fmt = "{:<15} {:>8} {:>9} {:>12}"
+    print(fmt.format("CASE", "PAGE_KB", "ARTICLES", "CPU_MS/ART"))
+    for r in results:
+        print(fmt.format(r["case"], r["page_kb"], r["articles"], r["cpu_ms_per_article"]))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""Local stand-in for publisher endpoints, and scrapers that read it.
+
+Serves, under one path prefix per simulated site:
+
+    /<site>/search?q=...&page=N   search result page (HTML)
+    /<site>/sitemap.xml           news sitemap of the latest articles
+    /<site>/rss.xml               RSS feed of the latest articles
+    /<site>/read/<id>             article page (HTML)
+
+with configurable latency, a share of 429 responses and a share of
+anti-bot block pages. ``make_scrapers`` returns BaseScraper subclasses
+that parse these pages with BeautifulSoup and dateparser the way the
+registry scrapers do, one per site; sites alternate between sitemap and
+RSS for latest mode.
+
+    python benchmarks/standin_server.py --port 8765 --latency-ms 50
+
+starts the server on its own for poking at by hand.
+"""
+
+import argparse
+import asyncio
+import random
+import warnings
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from urllib.parse import urlencode
+from xml.sax.saxutils import escape
+
+from aiohttp import web
+from bs4 import BeautifulSoup, XMLParsedAsHTMLWarning
+
+from newswatch.scrapers.basescraper import BaseScraper
+
+BLOCK_PAGE = (
+    "<!doctype html><html><head><title>Just a moment...</title></head>"
+    "<body>Checking your browser before accessing the site.</body></html>"
+)
+_WORDS = (
+    "pasar saham indeks harga sektor investor bank rupiah ekonomi kebijakan "
+    "pemerintah laporan kuartal laba penjualan emiten analis proyeksi"
+).split()
+
+
+@dataclass
+class ServerConfig:
+    sites: int = 6
+    pages: int = 3
+    articles_per_page: int = 10
+    latest_articles: int = 30
+    article_kb: int = 8
+    latency_ms: float = 20.0
+    jitter_ms: float = 10.0
+    rate_429: float = 0.0
+    block_rate: float = 0.0
+    seed: int = 1
+
+
+def _paragraphs(rng, kb):
+    out, size = [], 0
+    while size < kb * 1024:
+        text = " ".join(rng.choice(_WORDS) for _ in range(60)).capitalize() + "."
+        out.append(f"<p>{text}</p>")
+        size += len(text) + 7
+    return "".join(out)
+
+
+def _published(article_id: str) -> datetime:
+    page, _, index = article_id.partition("-")
+    minutes = int(page) * 100 + int(index or 0) if page.isdigit() else 0
+    return datetime.now().replace(microsecond=0) - timedelta(minutes=minutes)
+
+
+def build_app(config: ServerConfig) -> web.Application:
+    rng = random.Random(config.seed)
+    stats = {"requests": 0, "status_429": 0, "blocked": 0}
+
+    @web.middleware
+    async def network(request, handler):
+        if request.path == "/_stats":
+            return await handler(request)
+        stats["requests"] += 1
+        delay = config.latency_ms + rng.uniform(-config.jitter_ms, config.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        roll = rng.random()
+        if roll < config.rate_429:
+            stats["status_429"] += 1
+            return web.Response(status=429, text="Too Many Requests")
+        if roll < config.rate_429 + config.block_rate:
+            stats["blocked"] += 1
+            return web.Response(text=BLOCK_PAGE, content_type="text/html")
+        return await handler(request)
+
+    def base(request):
+        return f"{request.scheme}://{request.host}/{request.match_info['site']}"
+
+    async def search(request):
+        page = int(request.query.get("page", 1))
+        links = ""
+        if page <= config.pages:
+            links = "".join(
+                f'<div class="result"><a class="headline" href="{base(request)}/read/{page}-{i}">'
+                f"Berita {page}-{i}</a><span class=\"date\">baru saja</span></div>"
+                for i in range(config.articles_per_page)
+            )
+        body = (
+            "<html><head><title>Hasil pencarian</title></head><body>"
+            "<nav>" + "".join(f'<a href="/kanal/{w}">{w}</a>' for w in _WORDS) + "</nav>"
+            f'<main class="search">{links}</main><footer>(c) stand-in</footer></body></html>'
+        )
+        return web.Response(text=body, content_type="text/html")
+
+    def latest_ids():
+        return [f"0-{i}" for i in range(config.latest_articles)]
+
+    async def sitemap(request):
+        urls = "".join(
+            f"<url><loc>{base(request)}/read/{article_id}</loc>"
+            f"<lastmod>{_published(article_id).isoformat()}+07:00</lastmod></url>"
+            for article_id in latest_ids()
+        )
+        body = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{urls}</urlset>'
+        )
+        return web.Response(text=body, content_type="application/xml")
+
+    async def rss(request):
+        items = "".join(
+            f"<item><title>Berita {article_id}</title><link>{base(request)}/read/{article_id}</link>"
+            f"<pubDate>{_published(article_id):%a, %d %b %Y %H:%M:%S} +0700</pubDate></item>"
+            for article_id in latest_ids()
+        )
+        body = f'<?xml version="1.0"?><rss version="2.0"><channel>{items}</channel></rss>'
+        return web.Response(text=body, content_type="application/rss+xml")
+
+    async def article(request):
+        article_id = request.match_info["article_id"]
+        article_rng = random.Random(f"{request.match_info['site']}/{article_id}")
+        published = _published(article_id)
+        body = (
+            f"<html><head><title>Berita {escape(article_id)}</title>"
+            f'<meta property="article:published_time" content="{published.isoformat()}+07:00">'
+            "</head><body>"
+            "<nav>" + "".join(f'<a href="/kanal/{w}">{w}</a>' for w in _WORDS) + "</nav>"
+            f'<ul class="breadcrumb"><li>Home</li><li>{article_rng.choice(_WORDS).title()}</li></ul>'
+            f"<h1>Berita {escape(article_id)}</h1>"
+            f'<div class="byline">Penulis {article_rng.randint(1, 40)}</div>'
+            f'<div class="date">{published:%d/%m/%Y, %H:%M} WIB</div>'
+            f'<div class="content">{_paragraphs(article_rng, config.article_kb)}'
+            '<div class="baca-juga">Baca juga: berita lain</div></div>'
+            "<footer>(c) stand-in</footer></body></html>"
+        )
+        return web.Response(text=body, content_type="text/html")
+
+    async def get_stats(request):
+        return web.json_response(stats)
+
+    app = web.Application(middlewares=[network])
+    app.router.add_get("/_stats", get_stats)
+    app.router.add_get("/{site}/search", search)
+    app.router.add_get("/{site}/sitemap.xml", sitemap)
+    app.router.add_get("/{site}/rss.xml", rss)
+    app.router.add_get("/{site}/read/{article_id}", article)
+    return app
+
+
+class _StandInScraper(BaseScraper):
+    """A scraper for one stand-in site; subclasses set ``latest_feed``."""
+
+    latest_feed = "sitemap.xml"
+
+    def __init__(self, keywords, concurrency=12, start_date=None, queue_=None, base_url=""):
+        super().__init__(keywords, concurrency, queue_)
+        self.base_url = base_url
+        self.start_date = start_date
+
+    async def build_search_url(self, keyword, page):
+        return await self.fetch(f"{self.base_url}/search?{urlencode({'q': keyword, 'page': page})}")
+
+    def parse_article_links(self, response_text):
+        soup = BeautifulSoup(response_text, "html.parser")
+        links = [a.get("href") for a in soup.select("main.search a.headline") if a.get("href")]
+        return links or None
+
+    async def build_latest_url(self, page):
+        return await self.fetch(f"{self.base_url}/{self.latest_feed}")
+
+    def parse_latest_article_links(self, response_text):
+        with warnings.catch_warnings():
+            # feeds go through html.parser so lxml is not needed
+            warnings.simplefilter("ignore", XMLParsedAsHTMLWarning)
+            soup = BeautifulSoup(response_text, "html.parser")
+        tag = "loc" if self.latest_feed == "sitemap.xml" else "link"
+        links = [t.get_text(strip=True) for t in soup.find_all(tag)]
+        return [link for link in links if "/read/" in link] or None
+
+    async def get_article(self, link, keyword):
+        response_text = await self.fetch(link)
+        if not response_text:
+            return
+        soup = BeautifulSoup(response_text, "html.parser")
+        content_div = soup.select_one("div.content")
+        for tag in content_div.select(".baca-juga"):
+            tag.extract()
+        publish_date = self.parse_date(
+            soup.select_one("div.date").get_text(strip=True).replace("WIB", ""),
+            locales=["id"],
+        )
+        if self.start_date and publish_date and publish_date < self.start_date:
+            self.continue_scraping = False
+            return
+        await self.queue_.put({
+            "title": soup.select_one("h1").get_text(strip=True),
+            "publish_date": publish_date,
+            "author": soup.select_one("div.byline").get_text(strip=True),
+            "content": content_div.get_text(separator="\n", strip=True),
+            "keyword": keyword,
+            "category": soup.select("ul.breadcrumb li")[-1].get_text(strip=True),
+            "source": self.base_url.rsplit("/", 1)[-1],
+            "link": link,
+        })
+
+
+def make_scrapers(server_url: str, sites: int) -> dict:
+    """Registry-shaped ``{slug: {"class", "params"}}`` for the stand-in sites."""
+    scrapers = {}
+    for i in range(sites):
+        feed = "sitemap.xml" if i % 2 == 0 else "rss.xml"
+        cls = type(f"StandIn{i}Scraper", (_StandInScraper,), {"latest_feed": feed})
+        scrapers[f"standin{i}"] = {"class": cls, "params": {"base_url": f"{server_url}/site{i}"}}
+    return scrapers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    for field, value in asdict(ServerConfig()).items():
+        parser.add_argument(f"--{field.replace('_', '-')}", type=type(value), default=value)
+    args = parser.parse_args()
+    config = ServerConfig(**{k: getattr(args, k) for k in asdict(ServerConfig())})
+    web.run_app(build_app(config), port=args.port)
+
+
+if __name__ == "__main__":
+    main()
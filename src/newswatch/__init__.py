@@ -1,30 +1,77 @@
 __version__ = "1.2.5"
 
-# health report
-from .health import health_report as health_report
-from .health import health_report_to_dataframe as health_report_to_dataframe
-from .health import health_report_to_file as health_report_to_file
-
-# main api functions
-from .api import latest as latest
-from .api import latest_to_dataframe as latest_to_dataframe
-from .api import latest_to_file as latest_to_file
-from .api import list_scrapers as list_scrapers
-from .api import quick_scrape as quick_scrape
-from .api import scrape as scrape
-from .api import scrape_to_dataframe as scrape_to_dataframe
-from .api import scrape_to_file as scrape_to_file
-
-# registry access
+import importlib
+from typing import TYPE_CHECKING
+
+# registry access (metadata only; importing it loads no scraper module)
 from .registry import SCRAPERS as SCRAPERS
 from .registry import get_scraper_by_slug as get_scraper_by_slug
 from .registry import get_stable_slugs as get_stable_slugs
 from .registry import get_stable_scrapers as get_stable_scrapers
 
+# The api and health functions pull in aiohttp, and through them the rest of
+# the scraping stack; they are loaded on first attribute access so that
+# `import newswatch` and `newswatch --list_scrapers` stay fast.
+_LAZY_ATTRIBUTES = {
+    # health report
+    "health_report": "health",
+    "health_report_to_dataframe": "health",
+    "health_report_to_file": "health",
+    "health_trends": "health",
+    # main api functions
+    "ascrape": "api",
+    "iter_scrape": "api",
+    "latest": "api",
+    "latest_to_dataframe": "api",
+    "latest_to_file": "api",
+    "list_scrapers": "api",
+    "quick_scrape": "api",
+    "scrape": "api",
+    "scrape_to_dataframe": "api",
+    "scrape_to_file": "api",
+    "awatch": "api",
+    "watch": "api",
+}
+
+if TYPE_CHECKING:
+    from .api import ascrape as ascrape
+    from .api import iter_scrape as iter_scrape
+    from .api import latest as latest
+    from .api import latest_to_dataframe as latest_to_dataframe
+    from .api import latest_to_file as latest_to_file
+    from .api import list_scrapers as list_scrapers
+    from .api import quick_scrape as quick_scrape
+    from .api import scrape as scrape
+    from .api import scrape_to_dataframe as scrape_to_dataframe
+    from .api import scrape_to_file as scrape_to_file
+    from .api import awatch as awatch
+    from .api import watch as watch
+    from .health import health_report as health_report
+    from .health import health_report_to_dataframe as health_report_to_dataframe
+    from .health import health_report_to_file as health_report_to_file
+    from .health import health_trends as health_trends
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
 __all__ = [
     "health_report",
     "health_report_to_dataframe",
     "health_report_to_file",
+    "health_trends",
+    "ascrape",
+    "iter_scrape",
     "latest",
     "latest_to_dataframe",
     "latest_to_file",
@@ -33,6 +80,8 @@ __all__ = [
     "scrape",
     "scrape_to_dataframe",
     "scrape_to_file",
+    "awatch",
+    "watch",
     "SCRAPERS",
     "get_scraper_by_slug",
     "get_stable_scrapers",
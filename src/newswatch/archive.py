@@ -0,0 +1,274 @@
+"""Append-only archive of the HTTP responses a run received.
+
+Scrapers that mis-parse a page can only be fixed against the page they saw,
+and publishers change or remove pages. While ``recording(directory)`` is
+active, every response that comes through ``AsyncScraper.fetch`` -- the
+aiohttp request and the rnet and Playwright fallbacks -- is archived:
+
+    DIR/index.jsonl                  one line per response, in arrival order
+    DIR/objects/ab/ab12...ef.gz      gzip-compressed body, named by its sha256
+
+Bodies are content-addressed, so a listing page fetched a hundred times
+unchanged is stored once. Index lines carry the request (url, method and a
+hash of any POST body), the transport, the status, the body hash and size,
+and when and how fast it was fetched. Failed requests are indexed too, with
+no body, so a run can be replayed including its errors.
+
+Hashing, compression and disk writes happen on a background thread; the
+event loop only hands off the text, so recording does not slow the crawl.
+One process should write to a directory at a time.
+
+``replaying(directory)`` is the other half: ``AsyncScraper.fetch`` then
+answers every request from the archive and never touches the network.
+Repeated requests for the same url get the recorded responses in order
+(the last one repeats), so a retried 503 replays as it happened. Requests
+the archive has no answer for fail like a connection error.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import queue
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "index.jsonl"
+OBJECTS_DIR = "objects"
+
+_active_recorder = None
+_active_replay = None
+_STOP = object()
+
+
+def request_hash(data) -> str | None:
+    """Stable hash of a request body (None for requests without one)."""
+    if data is None:
+        return None
+    if isinstance(data, dict):
+        data = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(bytes(data)).hexdigest()
+
+
+def object_path(directory, sha256: str) -> Path:
+    """Where the body with this hash is stored."""
+    return Path(directory) / OBJECTS_DIR / sha256[:2] / f"{sha256}.gz"
+
+
+class ArchiveRecorder:
+    """Write responses to an archive directory from a background thread.
+
+    Use as a context manager, or call ``start()``/``close()``. ``record`` only
+    enqueues; ``close`` waits until everything queued is on disk.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.responses = 0
+        self.objects_written = 0
+        self.bytes_stored = 0
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+
+    def start(self) -> "ArchiveRecorder":
+        (self.directory / OBJECTS_DIR).mkdir(parents=True, exist_ok=True)
+        self._thread = threading.Thread(
+            target=self._run, name="newswatch-archive", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def record(
+        self,
+        url: str,
+        method: str,
+        data,
+        transport: str,
+        status: str,
+        text: str | None,
+        elapsed: float,
+        content_type: str | None = None,
+        source: str | None = None,
+    ) -> None:
+        """Queue one response (``text`` None when there was no body)."""
+        self._queue.put((
+            {
+                "url": url,
+                "method": method,
+                "request_sha256": request_hash(data),
+                "transport": transport,
+                "status": status,
+                "content_type": content_type,
+                "source": source,
+                "fetched_at": datetime.now().isoformat(timespec="milliseconds"),
+                "elapsed_ms": round(elapsed * 1000, 1),
+            },
+            text,
+        ))
+
+    def _store(self, text: str) -> tuple[str, int]:
+        body = text.encode("utf-8", "surrogatepass")
+        sha256 = hashlib.sha256(body).hexdigest()
+        path = object_path(self.directory, sha256)
+        if not path.exists():
+            path.parent.mkdir(exist_ok=True)
+            tmp = path.with_name(f".{path.name}.tmp")
+            with open(tmp, "wb") as f:
+                f.write(gzip.compress(body, compresslevel=6))
+            os.replace(tmp, path)
+            self.objects_written += 1
+            self.bytes_stored += path.stat().st_size
+        return sha256, len(body)
+
+    def _run(self) -> None:
+        with open(self.directory / INDEX_NAME, "a", encoding="utf-8") as index:
+            while True:
+                entry = self._queue.get()
+                if entry is _STOP:
+                    return
+                record, text = entry
+                try:
+                    if text is None:
+                        record["sha256"], record["size"] = None, 0
+                    else:
+                        record["sha256"], record["size"] = self._store(text)
+                    index.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    index.flush()
+                    self.responses += 1
+                except OSError as e:
+                    logger.warning(f"Failed to archive {record['url']}: {e}")
+
+
+def get_recorder() -> ArchiveRecorder | None:
+    """The active recorder, or None when no run is being recorded."""
+    return _active_recorder
+
+
+@contextmanager
+def recording(directory):
+    """Archive every fetched response for the duration of the block.
+
+    Args:
+        directory: archive directory; created if missing, appended to if it
+            already holds an archive.
+
+    Yields:
+        The ArchiveRecorder; its counters are final once the block exits.
+    """
+    global _active_recorder
+    previous = _active_recorder
+    recorder = ArchiveRecorder(directory).start()
+    _active_recorder = recorder
+    try:
+        yield recorder
+    finally:
+        _active_recorder = previous
+        recorder.close()
+
+
+class ResponseArchive:
+    """Serve recorded responses by request, in the order they were recorded.
+
+    Args:
+        directory: an archive written by ``ArchiveRecorder``.
+        latency: None to answer at once, seconds to wait before every
+            answer, or ``"recorded"`` to wait as long as the original
+            request took.
+    """
+
+    def __init__(self, directory, latency: float | str | None = None):
+        self.directory = Path(directory)
+        if latency not in (None, "recorded") and not isinstance(latency, (int, float)):
+            raise ValueError(f"latency must be None, seconds or 'recorded', not {latency!r}")
+        self.latency = latency
+        self.served = 0
+        self.misses = 0
+        self._records = defaultdict(list)
+        self._cursors = {}
+        index = self.directory / INDEX_NAME
+        if not index.exists():
+            raise FileNotFoundError(f"No response archive at {self.directory}")
+        with open(index, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping corrupt archive index line in {index}")
+                    continue
+                key = (record["transport"], record["method"], record["url"], record["request_sha256"])
+                self._records[key].append(record)
+
+    def __len__(self) -> int:
+        return sum(len(records) for records in self._records.values())
+
+    def lookup(self, url: str, method: str = "GET", data=None, transport: str = "aiohttp") -> dict | None:
+        """The next recorded response for this request, or None if there is none."""
+        key = (transport, method, url, request_hash(data))
+        records = self._records.get(key)
+        if not records:
+            self.misses += 1
+            return None
+        position = self._cursors.get(key, 0)
+        self._cursors[key] = position + 1
+        self.served += 1
+        return records[min(position, len(records) - 1)]
+
+    def read_text(self, record: dict) -> str | None:
+        """The body of a looked-up record (None when it had none)."""
+        if record["sha256"] is None:
+            return None
+        body = gzip.decompress(object_path(self.directory, record["sha256"]).read_bytes())
+        return body.decode("utf-8", "surrogatepass")
+
+    def delay(self, record: dict | None) -> float:
+        """Seconds to wait before answering with ``record``."""
+        if self.latency == "recorded":
+            return record["elapsed_ms"] / 1000 if record else 0.0
+        return self.latency or 0.0
+
+
+def get_replay() -> ResponseArchive | None:
+    """The archive being replayed, or None when requests go to the network."""
+    return _active_replay
+
+
+@contextmanager
+def replaying(directory, latency: float | str | None = None):
+    """Answer every fetch from an archive for the duration of the block.
+
+    Args:
+        directory: an archive written by ``recording()``.
+        latency: simulated network latency; see ``ResponseArchive``.
+
+    Yields:
+        The ResponseArchive, with ``served`` and ``misses`` counters.
+    """
+    global _active_replay
+    previous = _active_replay
+    replay = ResponseArchive(directory, latency)
+    _active_replay = replay
+    try:
+        yield replay
+    finally:
+        _active_replay = previous
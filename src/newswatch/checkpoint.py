@@ -0,0 +1,235 @@
+"""Checkpoint and resume for long search runs (``--checkpoint``, ``--resume``).
+
+A multi-month backfill -- a kompas window walk, an NBC archive walk, a detik
+index walk -- that dies at 80% used to restart from scratch. With
+``--checkpoint`` a run gets an id and a directory under ``--checkpoint-dir``
+holding its arguments (``run.json``) and an append-only journal
+(``journal.jsonl``) of:
+
+- completed units: ``(source, keyword, unit)``. A unit is whatever a scraper
+  walks one at a time -- a listing page, a kompas date window, an NBC month,
+  a detik day -- plus ``*`` for a whole keyword. Scrapers ask
+  ``_unit_done()`` before a unit and call ``_finish_unit()`` after it.
+- emitted links: every link the writer has put in the output file.
+
+A unit is journaled only once the writer has dealt with every article
+queued before it finished, so a crash can never mark a unit done whose
+articles were still waiting in the queue; at worst a unit is walked again
+and its already-written links are skipped before fetching.
+
+``--resume RUN_ID`` reloads the run's arguments, promotes output a crashed
+writer left in its ``.tmp`` file (dropping a half-written last line), skips
+finished units, and appends to the existing output.
+"""
+
+import json
+import os
+import secrets
+from datetime import datetime
+from pathlib import Path
+
+from .dedup import LinkSet, iter_output_links
+
+# run arguments a resumed run takes from run.json rather than the command line
+RUN_ARGUMENTS = (
+    "method",
+    "keywords",
+    "start_date",
+    "scrapers",
+    "output_format",
+    "output_path",
+    "max_pages",
+    "limit",
+    "time_range",
+    "dedup_file",
+)
+
+
+def new_run_id() -> str:
+    return f"{datetime.now():%Y%m%d-%H%M%S}-{secrets.token_hex(2)}"
+
+
+def recover_output(path: str | Path, output_format: str) -> bool:
+    """Promote the ``.tmp`` file a crashed writer left next to ``path``.
+
+    A writer that was killed mid-run leaves everything it wrote in
+    ``<path>.tmp``; as writers resume by copying the output first, that file
+    is always at least as complete as ``path``. A row cut off mid-write is
+    dropped. Returns True if a file was promoted.
+    """
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    if not tmp.exists():
+        return False
+    # csv rows end in \r\n while newlines inside quoted fields are bare \n
+    terminator = b"\r\n" if output_format == "csv" else b"\n"
+    data = tmp.read_bytes()
+    if data and not data.endswith(terminator):
+        cut = data.rfind(terminator)
+        with open(tmp, "r+b") as f:
+            f.truncate(cut + len(terminator) if cut >= 0 else 0)
+    tmp.replace(path)
+    return True
+
+
+class RunCheckpoint:
+    """The journal of one checkpointed run.
+
+    Args:
+        directory: the checkpoint directory (``--checkpoint-dir``).
+        run_id: the run's id; its files live in ``directory/run_id``.
+    """
+
+    def __init__(self, directory: str | Path, run_id: str):
+        self.run_id = run_id
+        self.path = Path(directory) / run_id
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.done: set[tuple[str, str, str]] = set()
+        self.emitted = LinkSet()
+        journal = self.path / "journal.jsonl"
+        if journal.exists():
+            with open(journal, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # a line cut off by a crash
+                    if "link" in record:
+                        self.emitted.add(record["link"])
+                    elif "unit" in record:
+                        self.done.add((record["source"], record["keyword"], record["unit"]))
+        self._journal = open(journal, "a", encoding="utf-8")
+        self._queue = None
+        self._pending: list[tuple[int, dict]] = []
+
+    # ── Run arguments ────────────────────────────────────────────────────
+
+    @classmethod
+    def exists(cls, directory: str | Path, run_id: str) -> bool:
+        return (Path(directory) / run_id / "run.json").exists()
+
+    def save_arguments(self, args) -> None:
+        values = {name: getattr(args, name, None) for name in RUN_ARGUMENTS}
+        with open(self.path / "run.json", "w", encoding="utf-8") as f:
+            json.dump(values, f, indent=2)
+
+    def load_arguments(self, args) -> None:
+        with open(self.path / "run.json", encoding="utf-8") as f:
+            values = json.load(f)
+        for name, value in values.items():
+            setattr(args, name, value)
+
+    def load_emitted_from(self, output_path: str | Path) -> None:
+        """Count every link already in the output as emitted.
+
+        Covers rows a crashed writer flushed before their link reached the
+        journal.
+        """
+        if os.path.exists(output_path):
+            for link in iter_output_links(output_path):
+                self.emitted.add(link)
+
+    # ── Units ────────────────────────────────────────────────────────────
+
+    def attach(self, queue) -> None:
+        """Tie unit completion to what the writer has taken off ``queue``."""
+        self._queue = queue
+
+    def is_done(self, source: str, keyword: str, unit: str) -> bool:
+        return (source, keyword, unit) in self.done
+
+    def finish(self, source: str, keyword: str, unit: str) -> None:
+        """Record a finished unit, durable once the writer catches up with it."""
+        record = {"source": source, "keyword": keyword, "unit": str(unit)}
+        if self._queue is None:
+            self._write(record)
+            return
+        # every article this unit queued was put before now
+        self._pending.append((self._queue.puts, record))
+        self._settle(self._queue.gets)
+
+    def _settle(self, handled: int | None) -> None:
+        still_pending = []
+        for ticket, record in self._pending:
+            if handled is None or ticket <= handled:
+                self._write(record)
+            else:
+                still_pending.append((ticket, record))
+        self._pending = still_pending
+
+    def settle(self) -> None:
+        """Journal every pending unit the writer has caught up with.
+
+        Called once the writer has stopped: units whose last articles it
+        skipped (duplicates, out of the time range) are settled here, as no
+        later write would settle them.
+        """
+        self._settle(self._queue.gets if self._queue is not None else None)
+
+    def for_source(self, source: str) -> "SourceCheckpoint":
+        """The view a scraper is given: ``scraper.checkpoint = run.for_source(slug)``."""
+        return SourceCheckpoint(self, source)
+
+    # ── Emitted links ────────────────────────────────────────────────────
+
+    def links(self, seen_store=None) -> "_EmittedLinks":
+        """A stand-in for the writer's ``seen_store`` that journals each link."""
+        return _EmittedLinks(self, seen_store)
+
+    def _emit(self, link: str) -> None:
+        self.emitted.add(link)
+        self._write({"link": link})
+        if self._queue is not None:
+            # the writer calls this right after writing the article it took
+            # off the queue last, so everything up to it has been handled
+            self._settle(self._queue.gets)
+
+    def _write(self, record: dict) -> None:
+        if "unit" in record:
+            self.done.add((record["source"], record["keyword"], record["unit"]))
+        self._journal.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._journal.flush()
+
+    def close(self) -> None:
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class SourceCheckpoint:
+    """One source's slice of a ``RunCheckpoint``."""
+
+    def __init__(self, run: RunCheckpoint, source: str):
+        self.run = run
+        self.source = source
+
+    def is_done(self, keyword: str, unit: str) -> bool:
+        return self.run.is_done(self.source, keyword, unit)
+
+    def finish(self, keyword: str, unit: str) -> None:
+        self.run.finish(self.source, keyword, unit)
+
+
+class _EmittedLinks:
+    def __init__(self, run: RunCheckpoint, seen_store=None):
+        self.run = run
+        self.seen_store = seen_store
+
+    def __contains__(self, link) -> bool:
+        return self.seen_store is not None and link in self.seen_store
+
+    def add(self, link: str) -> None:
+        if self.seen_store is not None:
+            self.seen_store.add(link)
+        if link:
+            self.run._emit(link)
+
+    def update(self, links) -> None:
+        for link in links:
+            self.add(link)
@@ -1,19 +1,79 @@
 import argparse
 import asyncio
+import contextlib
 import logging
 import os
 from datetime import datetime
 
-from .config import get_health_history_path
-from .main import get_available_scrapers
-from .main import main as run_main
-from .health import append_health_history, health_report, health_report_to_file, _print_health_summary
+from . import archive, metrics, profiling, tracing
+
+from .config import (
+    get_checkpoint_dir,
+    get_crawl_state_path,
+    get_health_history_path,
+    get_health_store_path,
+    get_seen_store_path,
+)
+from .registry import get_method_slugs, get_scraper_by_slug
+
+
+def _print_recording(recorder):
+    """Say what --record archived (no-op without it)."""
+    if recorder is None:
+        return
+    print(
+        f"Recorded {recorder.responses} response(s) to {recorder.directory} "
+        f"({recorder.objects_written} new body file(s))"
+    )
+
+
+def _print_replay(replay):
+    """Say what --replay served (no-op without it)."""
+    if replay is None:
+        return
+    print(
+        f"Replayed {replay.served} response(s) from {replay.directory} "
+        f"({replay.misses} request(s) not in the archive)"
+    )
+
+
+def _replayable_scrapers(parser, selected, method):
+    """``--scrapers`` for a --replay run: browser-driven sources left out.
+
+    Those sources load their pages in their own Chromium session, which is
+    neither recorded nor replayed, so under --replay they would fetch live
+    pages. "auto" and "all" skip them; naming one is an error.
+    """
+    def browser(slug):
+        entry = get_scraper_by_slug(slug)
+        return entry is not None and entry.browser_required
+
+    if selected.lower() in ("all", "auto"):
+        slugs = get_method_slugs(method)
+        skipped = [slug for slug in slugs if browser(slug)]
+        if skipped:
+            print(f"--replay: skipping browser-driven scraper(s) {', '.join(skipped)}")
+        return ",".join(slug for slug in slugs if not browser(slug))
+    named = [slug for slug in (s.strip().lower() for s in selected.split(",")) if browser(slug)]
+    if named:
+        parser.error(
+            f"--replay cannot serve browser-driven scraper(s) {', '.join(named)}: "
+            "their pages load in Chromium, outside the archive"
+        )
+    return selected
+
+
+def _print_profile(session):
+    """Print the profile summary and where the files went (no-op without --profile)."""
+    if session is None:
+        return
+    print(session.summary_text)
+    if session.files:
+        print(f"Profiles written to {session.directory}")
 
 
 def cli():
-    scraper_classes = get_available_scrapers(method="search")
-    available_scrapers = list(scraper_classes.keys())
-    available_scrapers_str = ",".join(available_scrapers)
+    available_scrapers_str = ",".join(get_method_slugs("search"))
 
     # main description with platform-specific notes
     description = (
@@ -120,6 +180,71 @@ def cli():
         default=None,
         help="Path to a previous output file (JSON/JSONL/CSV). Articles with matching links are skipped.",
     )
+    parser.add_argument(
+        "--seen-store",
+        type=str,
+        default=None,
+        help="Persistent seen-link store (SQLite file) shared across runs. Links already in it are skipped before "
+        "their article is fetched; every written link is added. Also set via NEWSWATCH_SEEN_STORE env.",
+    )
+    parser.add_argument(
+        "--seen-store-bloom",
+        action="store_true",
+        help="Front seen-store lookups with a Bloom filter (saved next to the store) so unseen links skip SQLite.",
+    )
+    parser.add_argument(
+        "--seen-store-build",
+        nargs="+",
+        metavar="FILE",
+        default=None,
+        help="Import links from existing output files (CSV/JSON/JSONL) into --seen-store, then exit.",
+    )
+    parser.add_argument(
+        "--seen-store-compact",
+        action="store_true",
+        help="Compact --seen-store (drop entries older than --seen-store-max-age, reclaim space), then exit.",
+    )
+    parser.add_argument(
+        "--seen-store-max-age",
+        type=int,
+        default=None,
+        metavar="DAYS",
+        help="With --seen-store-compact, forget links first seen more than DAYS days ago.",
+    )
+    parser.add_argument(
+        "--crawl-state",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Incremental crawl state (SQLite file): per source, keyword and method, the links, newest publish date "
+        "and page depth of the last completed run. Known links are skipped before fetching and pagination stops once "
+        "a listing page is mostly known. Also set via NEWSWATCH_CRAWL_STATE env.",
+    )
+    parser.add_argument(
+        "--crawl-state-reset",
+        action="store_true",
+        help="Forget the --crawl-state of the selected scrapers (all of them with 'auto'/'all') before running, so this run is a full crawl.",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        action="store_true",
+        help="Make this search run resumable: journal finished (keyword, page/window) units and written links under "
+        "--checkpoint-dir and print a run ID for --resume. Needs -of csv or jsonl.",
+    )
+    parser.add_argument(
+        "--resume",
+        type=str,
+        default=None,
+        metavar="RUN_ID",
+        help="Resume a --checkpoint run: reuse its arguments, skip the units it finished and append to its output file.",
+    )
+    parser.add_argument(
+        "--checkpoint-dir",
+        type=str,
+        default=None,
+        metavar="DIR",
+        help="Where --checkpoint runs keep their journals (default: ./newswatch-runs). Also set via NEWSWATCH_CHECKPOINT_DIR env.",
+    )
     parser.add_argument(
         "--health-report",
         action="store_true",
@@ -129,7 +254,139 @@ def cli():
         "--health-history",
         type=str,
         default=None,
-        help="Append each per-source health record to this JSONL file (append-only). Also set via NEWSWATCH_HEALTH_HISTORY env.",
+        help="Append each per-source health record to this JSONL file (append-only) as soon as its probe finishes. Also set via NEWSWATCH_HEALTH_HISTORY env.",
+    )
+    parser.add_argument(
+        "--health-store",
+        type=str,
+        default=None,
+        help="SQLite health history store, indexed by source and time. --health-report writes records into it as probes finish. Also set via NEWSWATCH_HEALTH_STORE env.",
+    )
+    parser.add_argument(
+        "--health-trends",
+        action="store_true",
+        help="Print per-source health trends (success rate, p50/p95 time, failing-since, flapping) from --health-store, then exit. Syncs --health-history into the store first.",
+    )
+    parser.add_argument(
+        "--health-window",
+        type=float,
+        default=7,
+        metavar="DAYS",
+        help="Rolling window in days for --health-trends (default: 7).",
+    )
+    parser.add_argument(
+        "--health-budget",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="With --health-report, stop the whole probe run after SECONDS. Probes still running are recorded as timeouts, unstarted ones as skipped.",
+    )
+    parser.add_argument(
+        "--trace",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Record tracing spans (listing pages, article fetches, retries and fallbacks, queue waits, writes) and write them to PATH: Chrome trace-event JSON viewable in Perfetto, or JSONL when PATH ends in .jsonl.",
+    )
+    parser.add_argument(
+        "--record",
+        type=str,
+        default=None,
+        metavar="DIR",
+        help="Archive every HTTP response of the run (aiohttp and the rnet/Playwright fallbacks) to DIR: gzip bodies stored once by content hash, plus an index.jsonl by URL. Writes happen off the event loop.",
+    )
+    parser.add_argument(
+        "--replay",
+        type=str,
+        default=None,
+        metavar="DIR",
+        help="Serve every request from a --record archive in DIR instead of the network. Requests the archive has no answer for fail like connection errors. Browser-driven scrapers cannot be replayed: 'auto'/'all' skip them and naming one is an error.",
+    )
+    parser.add_argument(
+        "--replay-latency",
+        type=str,
+        default=None,
+        metavar="SECONDS",
+        help="With --replay, wait SECONDS before each answer, or 'recorded' to wait as long as the original request took. Default: answer at once and skip retry backoff.",
+    )
+    parser.add_argument(
+        "--profile",
+        type=str,
+        default=None,
+        metavar="DIR",
+        help="Profile each scraper's parsing and other on-loop work separately, print the top scrapers and functions, and write pstats, collapsed-stack and speedscope files for the run to DIR.",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Write Prometheus metrics (requests by host/status/transport, retries, blocked pages, articles per source, queue depth, writer lag, event-loop lag) to PATH for the node_exporter textfile collector, every --metrics-interval seconds and at exit.",
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        type=float,
+        default=15,
+        metavar="SECONDS",
+        help="How often --metrics-file is rewritten (default: 15).",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        metavar="PORT",
+        help="Serve Prometheus metrics at http://localhost:PORT/metrics while the run lasts.",
+    )
+    parser.add_argument(
+        "--loop-monitor",
+        action="store_true",
+        help="Measure event-loop lag during the run and add it to the run summary, with the scrapers whose listing or get_article steps held the loop longest.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and poll each source's latest listing on its own adaptive schedule, appending new articles to rotating JSONL files in --watch-dir. Implies --method latest; stop with Ctrl-C or --watch-duration.",
+    )
+    parser.add_argument(
+        "--watch-dir",
+        type=str,
+        default=".",
+        metavar="DIR",
+        help="Directory for --watch output files (default: current directory).",
+    )
+    parser.add_argument(
+        "--watch-rotate",
+        choices=["hour", "day"],
+        default="hour",
+        help="Start a new --watch output file every hour (default) or every day.",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=120,
+        metavar="SECONDS",
+        help="Initial poll interval per source in --watch mode (default: 120). It then adapts to how often each source publishes.",
+    )
+    parser.add_argument(
+        "--watch-min-interval",
+        type=float,
+        default=30,
+        metavar="SECONDS",
+        help="Shortest adaptive poll interval in --watch mode (default: 30).",
+    )
+    parser.add_argument(
+        "--watch-max-interval",
+        type=float,
+        default=1800,
+        metavar="SECONDS",
+        help="Longest adaptive poll interval in --watch mode (default: 1800).",
+    )
+    parser.add_argument(
+        "--watch-duration",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Stop --watch mode after SECONDS (default: run until interrupted).",
     )
     parser.add_argument(
         "--proxy",
@@ -143,11 +400,7 @@ def cli():
     if args.proxy:
         os.environ["NEWSWATCH_PROXY"] = args.proxy
 
-    scraper_classes = get_available_scrapers(
-        method=args.method
-    )
-    available_scrapers = list(scraper_classes.keys())
-    available_scrapers_str = ",".join(available_scrapers)
+    available_scrapers_str = ",".join(get_method_slugs(args.method))
 
     if args.list_scrapers:
         print(
@@ -156,30 +409,186 @@ def cli():
         )
         return
 
+    # everything below runs or maintains a scrape; --help and --list_scrapers
+    # above stay clear of aiohttp, numpy and the rest of the runtime
+    from .dedup import SeenLinkStore
+    from .health import (
+        health_report,
+        health_report_to_file,
+        health_trends,
+        _print_health_summary,
+        _print_health_trends,
+    )
+    from .main import _build_output_label, main as run_main
+
+    if args.record and args.replay:
+        parser.error("--record and --replay cannot be combined")
+
+    args.seen_store = args.seen_store or get_seen_store_path()
+    args.crawl_state = args.crawl_state or get_crawl_state_path()
+    if args.crawl_state_reset and not args.crawl_state:
+        parser.error("--crawl-state-reset needs --crawl-state or NEWSWATCH_CRAWL_STATE")
+
+    # Seen-store maintenance mode
+    if args.seen_store_build or args.seen_store_compact:
+        if not args.seen_store:
+            parser.error("--seen-store-build/--seen-store-compact need --seen-store or NEWSWATCH_SEEN_STORE")
+        with SeenLinkStore(args.seen_store, bloom=args.seen_store_bloom) as store:
+            if args.seen_store_build:
+                added = store.build_from(args.seen_store_build)
+                print(f"Added {added} link(s) to {args.seen_store}")
+            if args.seen_store_compact:
+                removed = store.compact(max_age_days=args.seen_store_max_age)
+                print(f"Compacted {args.seen_store}: removed {removed} link(s), {len(store)} remain")
+        return
+
+    history_path = args.health_history or get_health_history_path()
+    store_path = args.health_store or get_health_store_path()
+
+    # Health trends mode
+    if args.health_trends:
+        if not store_path:
+            parser.error("--health-trends needs --health-store or NEWSWATCH_HEALTH_STORE")
+        trends = health_trends(
+            store_path, history_path=history_path, window_days=args.health_window
+        )
+        _print_health_trends(trends)
+        if args.output_path:
+            health_report_to_file(trends, args.output_path, args.output_format)
+            print(f"Health trends written to {args.output_path}")
+        return
+
+    trace = tracing.recording(args.trace) if args.trace else contextlib.nullcontext()
+    profile = profiling.profile(args.profile) if args.profile else contextlib.nullcontext()
+    exporters = contextlib.ExitStack()
+    recorder = exporters.enter_context(archive.recording(args.record)) if args.record else None
+    replay = None
+    if args.replay:
+        args.scrapers = _replayable_scrapers(
+            parser, args.scrapers, "latest" if args.watch else args.method
+        )
+        replay_latency = args.replay_latency
+        if replay_latency not in (None, "recorded"):
+            try:
+                replay_latency = float(replay_latency)
+            except ValueError:
+                parser.error("--replay-latency must be a number of seconds or 'recorded'")
+        try:
+            replay = exporters.enter_context(archive.replaying(args.replay, replay_latency))
+        except FileNotFoundError as e:
+            parser.error(str(e))
+    if args.metrics_file:
+        exporters.enter_context(
+            metrics.TextfileExporter(args.metrics_file, args.metrics_interval)
+        )
+    if args.metrics_port is not None:
+        server = metrics.start_http_server(args.metrics_port)
+        exporters.callback(server.server_close)
+        exporters.callback(server.shutdown)
+
     # Health report mode
     if args.health_report:
-        report = health_report(
-            method=args.method,
-            scrapers=args.scrapers,
-            scraper_timeout=args.scraper_timeout if args.scraper_timeout is not None else 30,
-            max_pages=args.max_pages if args.max_pages is not None else 1,
-            limit=args.limit if args.limit is not None else 1,
-        )
+        with exporters, trace, profile as session:
+            report = health_report(
+                method=args.method,
+                scrapers=args.scrapers,
+                scraper_timeout=args.scraper_timeout if args.scraper_timeout is not None else 30,
+                max_pages=args.max_pages if args.max_pages is not None else 1,
+                limit=args.limit if args.limit is not None else 1,
+                max_concurrent_scrapers=args.max_concurrent_scrapers,
+                total_budget=args.health_budget,
+                history_path=history_path,
+                store_path=store_path,
+            )
         _print_health_summary(report)
         if args.output_path:
             health_report_to_file(report, args.output_path, args.output_format)
             print(f"Health report written to {args.output_path}")
-        history_path = args.health_history or get_health_history_path()
         if history_path:
-            n = append_health_history(report, history_path)
-            print(f"Appended {n} health record(s) to {history_path}")
+            print(f"Appended {len(report)} health record(s) to {history_path}")
+        if store_path:
+            print(f"Recorded {len(report)} health record(s) in {store_path}")
+        if args.trace:
+            print(f"Trace written to {args.trace}")
+        _print_recording(recorder)
+        _print_replay(replay)
+        _print_profile(session)
         return
 
     # By default, suppress all logging unless verbose or progress is specified
     if not args.verbose and not args.progress:
         logging.disable(logging.CRITICAL)
 
-    asyncio.run(run_main(args))
+    # Watch mode
+    if args.watch:
+        from .watch import RotatingJsonlSink, print_watch_summary, run_watch, watcher_from_args
+
+        if not 0 < args.watch_min_interval <= args.watch_max_interval:
+            parser.error("--watch-min-interval must be positive and at most --watch-max-interval")
+        args.method = "latest"
+        with contextlib.ExitStack() as stack:
+            store = (
+                stack.enter_context(SeenLinkStore(args.seen_store, bloom=args.seen_store_bloom))
+                if args.seen_store
+                else None
+            )
+            watcher = watcher_from_args(args, seen_store=store)
+            sink = stack.enter_context(RotatingJsonlSink(args.watch_dir, rotate=args.watch_rotate))
+            with exporters, trace, profile as session:
+                try:
+                    asyncio.run(run_watch(watcher, sink))
+                except KeyboardInterrupt:
+                    print("\nWatch stopped.")
+        print_watch_summary(watcher, sink)
+        if args.trace:
+            print(f"Trace written to {args.trace}")
+        _print_recording(recorder)
+        _print_replay(replay)
+        _print_profile(session)
+        return
+
+    # Resumable run
+    args.run_checkpoint = None
+    if args.checkpoint or args.resume:
+        from .checkpoint import RunCheckpoint, new_run_id, recover_output
+
+        checkpoint_dir = args.checkpoint_dir or get_checkpoint_dir()
+        if args.resume:
+            if not RunCheckpoint.exists(checkpoint_dir, args.resume):
+                parser.error(f"no checkpointed run '{args.resume}' in {checkpoint_dir}")
+            args.run_checkpoint = RunCheckpoint(checkpoint_dir, args.resume)
+            args.run_checkpoint.load_arguments(args)
+            if args.replay:
+                args.scrapers = _replayable_scrapers(parser, args.scrapers, args.method)
+            recover_output(args.output_path, args.output_format)
+            args.run_checkpoint.load_emitted_from(args.output_path)
+            print(
+                f"Resuming run {args.resume}: {len(args.run_checkpoint.done)} unit(s) done, "
+                f"{len(args.run_checkpoint.emitted)} link(s) already in {args.output_path}"
+            )
+        else:
+            if args.method != "search" or args.output_format not in ("csv", "jsonl"):
+                parser.error("--checkpoint needs --method search and -of csv or jsonl")
+            if not args.output_path:
+                label = _build_output_label(args.keywords, args.method)
+                args.output_path = f"news-watch-{label}-{datetime.now():%Y%m%d_%H}.{args.output_format}"
+            # a resumed run may start elsewhere; pin the file it appends to
+            args.output_path = os.path.abspath(args.output_path)
+            run_id = new_run_id()
+            args.run_checkpoint = RunCheckpoint(checkpoint_dir, run_id)
+            args.run_checkpoint.save_arguments(args)
+            print(f"Checkpointing as run {run_id}; resume with --resume {run_id}")
+
+    with contextlib.ExitStack() as stack:
+        if args.run_checkpoint is not None:
+            stack.enter_context(args.run_checkpoint)
+        with exporters, trace, profile as session:
+            asyncio.run(run_main(args))
+    if args.trace:
+        print(f"Trace written to {args.trace}")
+    _print_recording(recorder)
+    _print_replay(replay)
+    _print_profile(session)
 
 
 if __name__ == "__main__":
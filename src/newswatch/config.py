@@ -72,3 +72,51 @@ def get_health_history_path() -> str | None:
     if not value:
         return None
     return value
+
+
+def get_seen_store_path() -> str | None:
+    """Path for the persistent seen-link store, or None.
+
+    Reads ``NEWSWATCH_SEEN_STORE``. Empty string is treated as unset. When
+    set, links already written by an earlier run are skipped before their
+    article page is fetched, and every newly written link is recorded.
+    """
+    value = os.environ.get("NEWSWATCH_SEEN_STORE")
+    if not value:
+        return None
+    return value
+
+
+def get_crawl_state_path() -> str | None:
+    """Path for the incremental crawl state store, or None.
+
+    Reads ``NEWSWATCH_CRAWL_STATE``. Empty string is treated as unset. When
+    set, each source's run starts from where its previous completed run left
+    off instead of re-walking listing pages it already collected.
+    """
+    value = os.environ.get("NEWSWATCH_CRAWL_STATE")
+    if not value:
+        return None
+    return value
+
+
+def get_checkpoint_dir() -> str:
+    """Directory holding ``--checkpoint`` run journals.
+
+    Reads ``NEWSWATCH_CHECKPOINT_DIR``; unset or empty means
+    ``newswatch-runs`` in the working directory.
+    """
+    return os.environ.get("NEWSWATCH_CHECKPOINT_DIR") or "newswatch-runs"
+
+
+def get_health_store_path() -> str | None:
+    """Path for the indexed SQLite health history store, or None.
+
+    Reads ``NEWSWATCH_HEALTH_STORE``. Empty string is treated as unset. When
+    set, health probe records are written into the store as they complete
+    and ``--health-trends`` queries it.
+    """
+    value = os.environ.get("NEWSWATCH_HEALTH_STORE")
+    if not value:
+        return None
+    return value
@@ -0,0 +1,223 @@
+"""Incremental crawl state: where each source's previous run left off.
+
+Every search or latest run walks a listing from page 1 and stops on
+``start_date`` or after ``STALE_PAGE_TOLERANCE`` pages with nothing new, so a
+daily job re-reads the pages it read yesterday and fetches their articles
+again. ``CrawlStateStore`` keeps, per (source, keyword, method), a frontier of
+what the last completed run collected:
+
+- ``links``: the listing links whose article it collected, newest first
+  (capped at ``MAX_FRONTIER_LINKS``). A link whose fetch failed -- a
+  timeout, a block page, a parse error -- is left out and tried again. The next run skips them before fetching, and a
+  listing page on which at least ``CAUGHT_UP_OVERLAP`` of the links are
+  among them means the run has reached collected territory: that page's new
+  links are still fetched, then pagination stops.
+- ``covers_from``: the oldest ``start_date`` the collected runs walked back
+  to (None when unknown). A run asked to go back further -- a backfill --
+  skips known links but does not stop at them, as the pages it wants lie
+  beyond the frontier.
+
+State is saved only when a scraper's run completes, so a timed-out or
+cancelled run leaves the previous frontier in place. It lives in SQLite next
+to the seen-link store and health store (``--crawl-state PATH`` or
+``NEWSWATCH_CRAWL_STATE``); ``--crawl-state-reset`` forgets the selected
+sources so their next run is a full crawl.
+"""
+
+import json
+import logging
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from .dedup import LinkSet
+
+MAX_FRONTIER_LINKS = 500
+CAUGHT_UP_OVERLAP = 0.5
+
+
+@dataclass
+class CrawlState:
+    """The frontier of one (source, keyword, method)."""
+
+    links: list[str] = field(default_factory=list)
+    covers_from: datetime | None = None
+    updated_at: datetime | None = None
+
+
+class CrawlStateStore:
+    """SQLite store of ``CrawlState`` rows keyed by (source, keyword, method)."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS crawl_state ("
+            "source TEXT NOT NULL, keyword TEXT NOT NULL, method TEXT NOT NULL, "
+            "covers_from TEXT, links TEXT NOT NULL, updated_at TEXT NOT NULL, "
+            "PRIMARY KEY (source, keyword, method))"
+        )
+        self._conn.commit()
+
+    def get(self, source: str, keyword: str, method: str) -> CrawlState | None:
+        row = self._conn.execute(
+            "SELECT links, covers_from, updated_at FROM crawl_state "
+            "WHERE source = ? AND keyword = ? AND method = ?",
+            (source, keyword, method),
+        ).fetchone()
+        if row is None:
+            return None
+        links, covers_from, updated_at = row
+        return CrawlState(
+            links=json.loads(links),
+            covers_from=datetime.fromisoformat(covers_from) if covers_from else None,
+            updated_at=datetime.fromisoformat(updated_at),
+        )
+
+    def put(self, source: str, keyword: str, method: str, state: CrawlState) -> None:
+        covers_from = state.covers_from
+        self._conn.execute(
+            "INSERT OR REPLACE INTO crawl_state VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                source, keyword, method,
+                covers_from.isoformat() if covers_from else None,
+                json.dumps(state.links[:MAX_FRONTIER_LINKS]),
+                (state.updated_at or datetime.now()).isoformat(timespec="seconds"),
+            ),
+        )
+        self._conn.commit()
+
+    def reset(self, sources: list[str] | None = None) -> int:
+        """Forget the state of ``sources`` (every source when None); returns rows removed."""
+        if sources is None:
+            cursor = self._conn.execute("DELETE FROM crawl_state")
+        else:
+            cursor = self._conn.executemany(
+                "DELETE FROM crawl_state WHERE source = ?", [(s,) for s in sources]
+            )
+        self._conn.commit()
+        return cursor.rowcount
+
+    def for_source(self, source: str) -> "SourceCrawlState":
+        """The view a scraper is given: ``scraper.crawl_state = store.for_source(slug)``."""
+        return SourceCrawlState(self, source)
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM crawl_state").fetchone()[0]
+
+    def close(self) -> None:
+        if self._conn is None:
+            return
+        self._conn.close()
+        self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class SourceCrawlState:
+    """One source's slice of a ``CrawlStateStore``."""
+
+    def __init__(self, store: CrawlStateStore, source: str):
+        self.store = store
+        self.source = source
+
+    def get(self, keyword: str, method: str) -> CrawlState | None:
+        return self.store.get(self.source, keyword, method)
+
+    def put(self, keyword: str, method: str, state: CrawlState) -> None:
+        self.store.put(self.source, keyword, method, state)
+
+    def session(self, method: str, start: datetime | None = None) -> "CrawlSession":
+        return CrawlSession(self, method, start)
+
+
+class _KeywordRun:
+    def __init__(self, previous: CrawlState | None, start: datetime | None):
+        self.previous = previous
+        self.known = LinkSet.from_links(previous.links) if previous else None
+        self.links: list[str] = []
+        self.collected: set[str] = set()
+        self.caught_up = False
+        # the frontier only marks where to stop if it reaches back as far as
+        # this run was asked to go
+        self.backfill = (
+            previous is not None
+            and start is not None
+            and (previous.covers_from is None or start < previous.covers_from)
+        )
+
+
+class CrawlSession:
+    """Crawl state for one ``scrape()`` call of one scraper.
+
+    ``BaseScraper.process_page`` passes every listing page through
+    ``page()``, and each listed link whose article reaches the queue is
+    reported to ``collected()``; ``save()`` records the new frontier once the
+    run is done.
+    ``start`` is the run's start date (None for an unbounded or latest run).
+    """
+
+    def __init__(self, source_state: SourceCrawlState, method: str, start: datetime | None = None):
+        self.source_state = source_state
+        self.method = method
+        self.start = start
+        self._runs: dict[str, _KeywordRun] = {}
+
+    def _run(self, keyword: str) -> _KeywordRun:
+        run = self._runs.get(keyword)
+        if run is None:
+            run = self._runs[keyword] = _KeywordRun(
+                self.source_state.get(keyword, self.method), self.start
+            )
+            if run.backfill:
+                covered = run.previous.covers_from
+                logging.info(
+                    "%s '%s': crawl state covers %s; walking back to %s past known pages",
+                    self.source_state.source, keyword,
+                    f"from {covered:%Y-%m-%d}" if covered else "an unknown range",
+                    f"{self.start:%Y-%m-%d}",
+                )
+        return run
+
+    def page(self, keyword: str, links: list[str]) -> list[str]:
+        """Record one listing page; returns the links not collected before."""
+        run = self._run(keyword)
+        run.links.extend(links)
+        if run.known is None or not links:
+            return links
+        new = [link for link in links if link not in run.known]
+        if not run.backfill and len(links) - len(new) >= CAUGHT_UP_OVERLAP * len(links):
+            run.caught_up = True
+        return new
+
+    def collected(self, keyword: str, link: str) -> None:
+        """Mark a listed link as collected: its article was emitted."""
+        self._run(keyword).collected.add(link)
+
+    def caught_up(self, keyword: str) -> bool:
+        """True once a page of ``keyword`` was mostly collected by the last run."""
+        run = self._runs.get(keyword)
+        return run is not None and run.caught_up
+
+    def save(self) -> None:
+        """Write the frontier of every keyword that listed a page."""
+        for keyword, run in self._runs.items():
+            # this run's collected links first, then the frontier it caught up
+            # with, so a run that only found a handful of new links keeps the
+            # old ones
+            links = [link for link in dict.fromkeys(run.links) if link in run.collected]
+            if run.previous is not None:
+                seen = LinkSet.from_links(links)
+                links += [link for link in run.previous.links if link not in seen]
+            # a run that caught up with the old frontier covers what it
+            # covered; any other run covers back to its own start date
+            self.source_state.put(keyword, self.method, CrawlState(
+                links=links[:MAX_FRONTIER_LINKS],
+                covers_from=run.previous.covers_from if run.caught_up else self.start,
+            ))
@@ -1,4 +1,8 @@
-"""Per-run source health report — lightweight, no dashboard, no DB."""
+"""Per-run source health report — lightweight, no dashboard.
+
+History is an append-only JSONL file, optionally mirrored into the indexed
+SQLite store in ``healthstore`` for trend queries.
+"""
 
 import asyncio
 import csv
@@ -7,16 +11,21 @@ import logging
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Union
-
-import pandas as pd
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Union
 
+from .healthstore import HealthHistoryStore
+from .loopmonitor import LAG_COLUMNS, LoopMonitor
 from .main import get_available_scrapers
+from .utils import FETCH_STAT_COLUMNS, ArticleQueue
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 _DEFAULT_PROBE_TIMEOUT = 30
 _DEFAULT_MAX_PAGES = 1
 _DEFAULT_LIMIT = 1
+_DEFAULT_MAX_CONCURRENT = 6
 
 async def _run_health_scraper(
     scraper, name: str, method: str, timeout: int, progress: bool
@@ -68,14 +77,98 @@ async def _run_health_scraper(
             "error_message": str(e),
         }
 
+async def _probe_source(
+    slug: str, entry, scraper_info: Dict, method: str, scraper_timeout: int,
+    max_pages: int, limit: int,
+) -> Dict:
+    """Probe one source and return its health record."""
+    scraper_class = scraper_info["class"]
+    scraper_params = dict(scraper_info.get("params", {}))
+    scraper_instance = scraper_class(
+        keywords="latest" if method == "latest" else entry.smoke_keyword,
+        queue_=ArticleQueue(),
+        **scraper_params,
+    )
+    scraper_instance.max_latest_pages = max_pages
+    instance_queue = scraper_instance.queue_
+
+    start = asyncio.get_event_loop().time()
+
+    # Phase 1: Run scraper - items go into queue during scraping
+    run_result = await _run_health_scraper(scraper_instance, slug, method, scraper_timeout, False)
+    elapsed_seconds = round(asyncio.get_event_loop().time() - start, 2)
+
+    # Phase 2: Put sentinel (scraper.scrape() doesn't put it, only main.main() does)
+    await instance_queue.put(None)
+
+    # Phase 3: Drain queue until sentinel or limit. The scraper has
+    # returned and the sentinel is already queued behind its items,
+    # so this never waits.
+    items_collected = []
+    while True:
+        item = instance_queue.get_nowait()
+        if item is None:  # sentinel
+            break
+        items_collected.append(item)
+        if limit is not None and len(items_collected) >= limit:
+            break
+
+    # Determine final status: prefer collected count, else preserve timeout/error
+    if items_collected:
+        status = "ok"
+        error_type = None
+        error_message = None
+    else:
+        status = run_result.get("status", "no_results")
+        error_type = run_result.get("error_type")
+        error_message = run_result.get("error_message")
+
+    record = {
+        "slug": slug,
+        "status": status,
+        "article_count": len(items_collected),
+        "elapsed_seconds": elapsed_seconds,
+        "error_type": error_type,
+        "error_message": error_message,
+    }
+    fetch_stats = getattr(scraper_instance, "fetch_stats", None)
+    if fetch_stats is not None:
+        record.update(fetch_stats.summary())
+    return _with_registry_metadata(record, entry, method)
+
+
+def _with_registry_metadata(record: Dict, entry, method: str) -> Dict:
+    """Add registry metadata and the check time to a probe record."""
+    record["name"] = entry.name
+    record["method"] = method
+    record["browser_required"] = entry.browser_required
+    record["strict_search"] = entry.strict_search
+    record["supports_search"] = entry.supports_search
+    record["supports_latest"] = entry.supports_latest
+    record["smoke_keyword"] = entry.smoke_keyword
+    record["checked_at"] = datetime.now().isoformat()
+    return record
+
+
 async def _async_health_report(
     method: str = "latest",
     scrapers: str = "auto",
     scraper_timeout: int = _DEFAULT_PROBE_TIMEOUT,
     max_pages: int = _DEFAULT_MAX_PAGES,
     limit: int = _DEFAULT_LIMIT,
+    *,
+    max_concurrent_scrapers: int = _DEFAULT_MAX_CONCURRENT,
+    total_budget: Optional[float] = None,
+    on_record: Optional[Callable[[Dict], None]] = None,
 ) -> List[Dict]:
-    """Run health probes and return list of report records."""
+    """Run health probes concurrently and return list of report records.
+
+    Probes share the general/browser pool split used by ``main.main``; each
+    probe's elapsed time starts once it holds a pool slot, so time spent
+    queued behind other probes is not charged to the source. ``on_record``
+    is called with each record as soon as it is final. Records are returned
+    in the order the slugs were requested.
+    """
     from .registry import get_stable_scrapers
 
     # Suppress logging during health probes
@@ -88,11 +181,18 @@ async def _async_health_report(
     else:
         slugs_to_run = [s.strip().lower() for s in scrapers.split(",")]
 
-    results: List[Dict] = []
-    for slug in slugs_to_run:
+    results: List[Optional[Dict]] = [None] * len(slugs_to_run)
+
+    def _finish(index: int, record: Dict) -> None:
+        results[index] = record
+        if on_record is not None:
+            on_record(record)
+
+    probes = []
+    for index, slug in enumerate(slugs_to_run):
         scraper_info = scraper_classes.get(slug)
         if not scraper_info:
-            results.append({
+            _finish(index, {
                 "slug": slug,
                 "status": "unsupported",
                 "article_count": 0,
@@ -104,7 +204,7 @@ async def _async_health_report(
 
         entry = get_stable_scrapers().get(slug)
         if not entry:
-            results.append({
+            _finish(index, {
                 "slug": slug,
                 "status": "skipped",
                 "article_count": 0,
@@ -114,77 +214,62 @@ async def _async_health_report(
             })
             continue
 
-        scraper_class = scraper_info["class"]
-        scraper_params = dict(scraper_info.get("params", {}))
-        scraper_instance = scraper_class(
-            keywords="latest" if method == "latest" else entry.smoke_keyword,
-            queue_=asyncio.Queue(),
-            **scraper_params,
-        )
-        scraper_instance.max_latest_pages = max_pages
-        instance_queue = scraper_instance.queue_
-
-        items_collected = []
-        elapsed_seconds = 0.0
-
-        async def _run_and_collect():
-            """Run scraper and collect queue items."""
-            nonlocal elapsed_seconds
-            start = asyncio.get_event_loop().time()
-
-            # Phase 1: Run scraper - items go into queue during scraping
-            run_result = await _run_health_scraper(scraper_instance, slug, method, scraper_timeout, False)
-            elapsed_seconds = round(asyncio.get_event_loop().time() - start, 2)
-
-            # Phase 2: Put sentinel (scraper.scrape() doesn't put it, only main.main() does)
-            await instance_queue.put(None)
-
-            # Phase 3: Drain queue until sentinel or limit
-            collector_items = []
-            while True:
-                try:
-                    item = await asyncio.wait_for(instance_queue.get(), timeout=5)
-                    if item is None:  # sentinel
-                        break
-                    collector_items.append(item)
-                    if limit is not None and len(collector_items) >= limit:
-                        break
-                except asyncio.TimeoutError:
-                    break
-
-            return collector_items, run_result
-
-        items_collected, run_result = await _run_and_collect()
-
-        # Determine final status: prefer collected count, else preserve timeout/error
-        if items_collected:
-            status = "ok"
-            error_type = None
-            error_message = None
-        else:
-            status = run_result.get("status", "no_results")
-            error_type = run_result.get("error_type")
-            error_message = run_result.get("error_message")
-
-        record = {
-            "slug": slug,
-            "status": status,
-            "article_count": len(items_collected),
-            "elapsed_seconds": elapsed_seconds,
-            "error_type": error_type,
-            "error_message": error_message,
-        }
+        probes.append((index, slug, entry, scraper_info))
+
+    # Same pool split as main.main: Chromium launches are far heavier than
+    # plain HTTP probes, so browser-required sources get a smaller pool.
+    general_sem = asyncio.Semaphore(max_concurrent_scrapers)
+    browser_sem = asyncio.Semaphore(min(2, max_concurrent_scrapers))
+    loop = asyncio.get_event_loop()
+    started_at: Dict[int, float] = {}
+
+    # loop lag is shared by every probe running at the time; each record
+    # gets the lag seen during its own window
+    loop_monitor = LoopMonitor().start()
+
+    async def _run_probe(index, slug, entry, scraper_info):
+        sem = browser_sem if entry.browser_required else general_sem
+        async with sem:
+            started_at[index] = loop.time()
+            record = await _probe_source(
+                slug, entry, scraper_info, method, scraper_timeout, max_pages, limit
+            )
+        record.update(loop_monitor.summary(since=started_at[index], until=loop.time()))
+        _finish(index, record)
 
-        # Add registry metadata
-        record["name"] = entry.name
-        record["method"] = method
-        record["browser_required"] = entry.browser_required
-        record["strict_search"] = entry.strict_search
-        record["supports_search"] = entry.supports_search
-        record["supports_latest"] = entry.supports_latest
-        record["smoke_keyword"] = entry.smoke_keyword
-        record["checked_at"] = datetime.now().isoformat()
-        results.append(record)
+    tasks = [asyncio.create_task(_run_probe(*probe)) for probe in probes]
+    try:
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=total_budget)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+    finally:
+        await loop_monitor.stop()
+
+    # probes cut off by the total budget still get a record
+    for index, slug, entry, _ in probes:
+        if results[index] is not None:
+            continue
+        if index in started_at:
+            record = {
+                "slug": slug,
+                "status": "timeout",
+                "article_count": 0,
+                "elapsed_seconds": round(loop.time() - started_at[index], 2),
+                "error_type": "TimeoutError",
+                "error_message": f"Exceeded {total_budget}s health report budget",
+            }
+        else:
+            record = {
+                "slug": slug,
+                "status": "skipped",
+                "article_count": 0,
+                "elapsed_seconds": 0,
+                "error_type": None,
+                "error_message": f"Not started within {total_budget}s health report budget",
+            }
+        _finish(index, _with_registry_metadata(record, entry, method))
 
     return results
 
@@ -194,15 +279,33 @@ def health_report(
     scraper_timeout: int = _DEFAULT_PROBE_TIMEOUT,
     max_pages: int = _DEFAULT_MAX_PAGES,
     limit: int = _DEFAULT_LIMIT,
+    *,
+    max_concurrent_scrapers: int = _DEFAULT_MAX_CONCURRENT,
+    total_budget: Optional[float] = None,
+    history_path: Optional[Union[str, Path]] = None,
+    store_path: Optional[Union[str, Path]] = None,
 ) -> List[Dict]:
     """Run health probes and return list of report records (sync API).
 
+    Probes run concurrently, so a full run takes roughly as long as the
+    slowest probe rather than the sum of all of them.
+
     Args:
         method: 'latest' or 'search'. Default 'latest'.
         scrapers: 'auto', 'all', or comma-separated slugs.
         scraper_timeout: per-scraper timeout in seconds.
         max_pages: max pages per scraper in latest mode.
         limit: max articles per scraper (for internal queue coordination).
+        max_concurrent_scrapers: probes running at once (default 6).
+            Browser-required sources share a smaller pool capped at 2.
+        total_budget: optional wall-clock budget in seconds for the whole
+            run. Probes still running when it expires are recorded as
+            'timeout', probes not yet started as 'skipped'.
+        history_path: optional JSONL history file; each record is appended
+            (see :func:`append_health_history`) as soon as its probe
+            finishes, all under one run_id.
+        store_path: optional SQLite health history store (see
+            :func:`health_trends`); records are written to it the same way.
 
     Returns:
         List of health record dicts with schema:
@@ -210,6 +313,18 @@ def health_report(
             error_type, error_message, browser_required, strict_search,
             supports_search, supports_latest, smoke_keyword, checked_at
     """
+    run_id = uuid.uuid4().hex[:8]
+    timestamp = datetime.now().isoformat()
+    store = HealthHistoryStore(store_path) if store_path else None
+
+    def on_record(record):
+        if history_path:
+            append_health_history(
+                [record], history_path, run_id=run_id, timestamp=timestamp
+            )
+        if store is not None:
+            store.add_records([_history_record(record, run_id, timestamp)])
+
     try:
         return asyncio.run(
             _async_health_report(
@@ -218,6 +333,9 @@ def health_report(
                 scraper_timeout=scraper_timeout,
                 max_pages=max_pages,
                 limit=limit,
+                max_concurrent_scrapers=max_concurrent_scrapers,
+                total_budget=total_budget,
+                on_record=on_record,
             )
         )
     except KeyboardInterrupt:
@@ -226,14 +344,61 @@ def health_report(
         logger.error(f"Health report failed: {e}")
         return []
     finally:
+        if store is not None:
+            store.close()
         logging.disable(logging.NOTSET)
 
 
-def health_report_to_dataframe(report: List[Dict]) -> pd.DataFrame:
-    """Convert health report list to pandas DataFrame."""
+def health_trends(
+    store_path: Union[str, Path],
+    history_path: Optional[Union[str, Path]] = None,
+    window_days: float = 7,
+    sources: Optional[List[str]] = None,
+    flap_threshold: int = 3,
+) -> List[Dict]:
+    """Per-source health trends from the SQLite health history store.
+
+    Args:
+        store_path: SQLite store path. Created if missing.
+        history_path: optional JSONL history to sync into the store first.
+            The first sync imports the whole file; later ones only read
+            lines appended since.
+        window_days: rolling window in days. Default 7.
+        sources: optional list of slugs to restrict the result to.
+        flap_threshold: ok/failing flips within the window at which a
+            source counts as flapping. Default 3.
+
+    Returns:
+        List of dicts, one per source probed in the window, with schema:
+            source, name, runs, ok, success_rate, p50_elapsed, p95_elapsed,
+            last_status, last_checked, first_failure_at, transitions,
+            flapping
+    """
+    with HealthHistoryStore(store_path) as store:
+        if history_path:
+            store.sync_jsonl(history_path)
+        return store.trends(
+            window_days=window_days, sources=sources, flap_threshold=flap_threshold
+        )
+
+
+def health_report_to_dataframe(report: List[Dict]) -> "pd.DataFrame":
+    """Convert health report list to pandas DataFrame.
+
+    The fetch statistics columns (requests, bytes_downloaded,
+    latency_p50_ms/p95/max, per-phase seconds, fallback counts,
+    listing prefetch counts, parse_cpu_seconds, slow steps) and the event-loop lag columns are
+    always present; sources that were never probed have them empty.
+    """
+    import pandas as pd
+
     if not report:
         return pd.DataFrame()
-    return pd.DataFrame(report)
+    df = pd.DataFrame(report)
+    for column in (*FETCH_STAT_COLUMNS, *LAG_COLUMNS):
+        if column not in df.columns:
+            df[column] = None
+    return df
 
 
 def health_report_to_file(
@@ -272,6 +437,22 @@ def health_report_to_file(
         raise ValueError(f"Unsupported format: {fmt}. Use json, jsonl, csv, or xlsx.")
 
 
+def _history_record(src: Dict, run_id: str, timestamp: str) -> Dict:
+    """Map a health report record to the history schema."""
+    return {
+        "timestamp": timestamp,
+        "run_id": run_id,
+        "source": src.get("slug"),
+        "status": src.get("status"),
+        "error": src.get("error_message"),
+        "count": src.get("article_count", 0),
+        "error_type": src.get("error_type"),
+        "method": src.get("method"),
+        "elapsed_seconds": src.get("elapsed_seconds"),
+        "name": src.get("name"),
+    }
+
+
 def append_health_history(
     report: List[Dict],
     path: Union[str, Path],
@@ -308,18 +489,7 @@ def append_health_history(
     count = 0
     with open(path, "a", encoding="utf-8") as f:
         for src in report:
-            record = {
-                "timestamp": ts,
-                "run_id": rid,
-                "source": src.get("slug"),
-                "status": src.get("status"),
-                "error": src.get("error_message"),
-                "count": src.get("article_count", 0),
-                "error_type": src.get("error_type"),
-                "method": src.get("method"),
-                "elapsed_seconds": src.get("elapsed_seconds"),
-                "name": src.get("name"),
-            }
+            record = _history_record(src, rid, ts)
             try:
                 f.write(json.dumps(record, ensure_ascii=False) + "\n")
                 count += 1
@@ -356,3 +526,48 @@ def _print_health_summary(report: List[Dict]) -> None:
     timeout = sum(1 for r in report if r.get("status") == "timeout")
     no_res = sum(1 for r in report if r.get("status") == "no_results")
     print(f"Summary: {ok}/{total} OK, {no_res} no results, {timeout} timeouts, {err} errors")
+
+    blockers = sorted(
+        (r for r in report if r.get("slow_steps")),
+        key=lambda r: r.get("slow_step_seconds") or 0,
+        reverse=True,
+    )
+    if blockers:
+        print("Blocking the event loop (steps over the slow-step threshold):")
+        for r in blockers[:5]:
+            print(
+                f"  {r.get('slug', '?'):<20} {r['slow_steps']} step(s), "
+                f"max {r.get('slow_step_max_ms') or 0:.0f} ms in {r.get('slow_step_phase')}"
+            )
+
+
+def _print_health_trends(trends: List[Dict]) -> None:
+    """Print a human-readable per-source trend table to stdout."""
+    if not trends:
+        print("No health history in window.")
+        return
+
+    fmt = "{:<20} {:>5} {:>6} {:>7} {:>7} {:<10} {}"
+    print(fmt.format("SOURCE", "RUNS", "OK%", "P50", "P95", "LAST", "NOTE"))
+    print("-" * 80)
+    for t in trends:
+        note = ""
+        if t.get("first_failure_at"):
+            note = f"failing since {t['first_failure_at'][:16]}"
+        if t.get("flapping"):
+            note = f"flapping ({t['transitions']} flips)" + (f"; {note}" if note else "")
+        p50 = t.get("p50_elapsed")
+        p95 = t.get("p95_elapsed")
+        print(fmt.format(
+            t.get("source", "?")[:19],
+            t.get("runs", 0),
+            f"{t.get('success_rate', 0) * 100:.0f}",
+            "-" if p50 is None else f"{p50:.1f}",
+            "-" if p95 is None else f"{p95:.1f}",
+            (t.get("last_status") or "?")[:10],
+            note,
+        ))
+    print("-" * 80)
+    flapping = sum(1 for t in trends if t.get("flapping"))
+    failing = sum(1 for t in trends if t.get("first_failure_at"))
+    print(f"Summary: {len(trends)} sources, {failing} currently failing, {flapping} flapping")
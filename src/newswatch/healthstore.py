@@ -0,0 +1,218 @@
+"""Indexed health history with trend queries.
+
+``append_health_history`` keeps the JSONL history append-only and easy to
+ship around, but every trend question ("how often has kompas failed this
+week?") means re-reading the whole file. ``HealthHistoryStore`` holds the
+same records in SQLite, indexed by source and timestamp, and answers the
+per-source trend questions -- rolling success rate, elapsed-time
+percentiles, when the current failure streak began, and whether a source
+is flapping -- from one indexed scan of the window.
+
+The store imports an existing JSONL history once and afterwards reads only
+the bytes appended since the last sync; probe runs can also write into it
+directly. Records are unique per (run_id, source), so importing a history
+that was also written directly is harmless.
+"""
+
+import json
+import logging
+import sqlite3
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from itertools import pairwise
+from pathlib import Path
+
+from .utils import nearest_rank_percentile
+
+logger = logging.getLogger(__name__)
+
+# statuses that are not a probe outcome and stay out of trend maths
+_NOT_PROBED = ("skipped", "unsupported")
+_DEFAULT_WINDOW_DAYS = 7
+_DEFAULT_FLAP_THRESHOLD = 3
+
+_FIELDS = (
+    "timestamp",
+    "run_id",
+    "source",
+    "status",
+    "error",
+    "count",
+    "error_type",
+    "method",
+    "elapsed_seconds",
+    "name",
+)
+
+
+class HealthHistoryStore:
+    """SQLite store of per-source health records (the JSONL history schema)."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS health_records (
+                timestamp TEXT NOT NULL,
+                run_id TEXT NOT NULL,
+                source TEXT NOT NULL,
+                status TEXT,
+                error TEXT,
+                count INTEGER,
+                error_type TEXT,
+                method TEXT,
+                elapsed_seconds REAL,
+                name TEXT,
+                UNIQUE (run_id, source)
+            );
+            CREATE INDEX IF NOT EXISTS health_records_source_ts
+                ON health_records (source, timestamp);
+            CREATE INDEX IF NOT EXISTS health_records_ts
+                ON health_records (timestamp);
+            CREATE TABLE IF NOT EXISTS imported_files (
+                path TEXT PRIMARY KEY,
+                offset INTEGER NOT NULL
+            );
+            """
+        )
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM health_records").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        self._conn.commit()
+        self._conn.close()
+
+    # ── Writing ──────────────────────────────────────────────────────────
+
+    def add_records(self, records: Iterable[dict]) -> int:
+        """Insert history records (JSONL history field names); return how many were new."""
+        rows = [
+            tuple(record.get(field) for field in _FIELDS)
+            for record in records
+            if record.get("timestamp") and record.get("run_id") and record.get("source")
+        ]
+        before = self._conn.total_changes
+        self._conn.executemany(
+            f"INSERT OR IGNORE INTO health_records ({', '.join(_FIELDS)}) "
+            f"VALUES ({', '.join('?' for _ in _FIELDS)})",
+            rows,
+        )
+        self._conn.commit()
+        return self._conn.total_changes - before
+
+    def sync_jsonl(self, path: str | Path) -> int:
+        """Import records appended to a JSONL history since the last sync.
+
+        The first call imports the whole file; later calls read only from
+        the remembered byte offset. A file that shrank (rotated or
+        truncated) is read again from the start. Corrupt lines are skipped.
+        Returns the number of new records.
+        """
+        path = Path(path)
+        if not path.exists():
+            return 0
+        key = str(path.resolve())
+        row = self._conn.execute(
+            "SELECT offset FROM imported_files WHERE path = ?", (key,)
+        ).fetchone()
+        offset = row[0] if row else 0
+        if offset > path.stat().st_size:
+            offset = 0
+
+        with open(path, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+        # only whole lines: a writer may be mid-append
+        end = data.rfind(b"\n") + 1
+        records = []
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                logger.warning(f"Skipping corrupt health history line in {path}")
+        added = self.add_records(r for r in records if isinstance(r, dict))
+        self._conn.execute(
+            "INSERT OR REPLACE INTO imported_files (path, offset) VALUES (?, ?)",
+            (key, offset + end),
+        )
+        self._conn.commit()
+        return added
+
+    # ── Trend queries ────────────────────────────────────────────────────
+
+    def trends(
+        self,
+        window_days: float = _DEFAULT_WINDOW_DAYS,
+        sources: Iterable[str] | None = None,
+        flap_threshold: int = _DEFAULT_FLAP_THRESHOLD,
+        now: datetime | None = None,
+    ) -> list[dict]:
+        """Per-source trend summary over the last ``window_days``.
+
+        Each dict has: source, name, runs, ok, success_rate, p50_elapsed,
+        p95_elapsed, last_status, last_checked, first_failure_at (start of
+        the current failure streak, None when the latest probe was ok),
+        transitions (ok <-> failing flips in the window) and flapping
+        (transitions >= flap_threshold).
+        """
+        since = ((now or datetime.now()) - timedelta(days=window_days)).isoformat()
+        query = (
+            "SELECT source, name, timestamp, status, elapsed_seconds "
+            "FROM health_records WHERE timestamp >= ? "
+            f"AND status NOT IN ({', '.join('?' for _ in _NOT_PROBED)})"
+        )
+        params: list = [since, *_NOT_PROBED]
+        if sources is not None:
+            sources = list(sources)
+            query += f" AND source IN ({', '.join('?' for _ in sources)})"
+            params.extend(sources)
+        query += " ORDER BY source, timestamp"
+
+        by_source: dict[str, list] = {}
+        for row in self._conn.execute(query, params):
+            by_source.setdefault(row[0], []).append(row)
+
+        return [
+            self._summarize(source, rows, flap_threshold)
+            for source, rows in by_source.items()
+        ]
+
+    @staticmethod
+    def _summarize(source: str, rows: list, flap_threshold: int) -> dict:
+        ok_flags = [status == "ok" for _, _, _, status, _ in rows]
+        elapsed = sorted(e for *_, e in rows if e is not None)
+        transitions = sum(a != b for a, b in pairwise(ok_flags))
+
+        first_failure_at = None
+        for (_, _, timestamp, _, _), ok in zip(reversed(rows), reversed(ok_flags)):
+            if ok:
+                break
+            first_failure_at = timestamp
+
+        ok_count = sum(ok_flags)
+        return {
+            "source": source,
+            "name": next((name for _, name, *_ in reversed(rows) if name), None),
+            "runs": len(rows),
+            "ok": ok_count,
+            "success_rate": round(ok_count / len(rows), 4),
+            "p50_elapsed": nearest_rank_percentile(elapsed, 50),
+            "p95_elapsed": nearest_rank_percentile(elapsed, 95),
+            "last_status": rows[-1][3],
+            "last_checked": rows[-1][2],
+            "first_failure_at": first_failure_at,
+            "transitions": transitions,
+            "flapping": transitions >= flap_threshold,
+        }
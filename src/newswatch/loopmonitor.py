@@ -0,0 +1,151 @@
+"""Event-loop lag monitor.
+
+Every scraper shares one event loop, and BeautifulSoup/dateparser work
+inside a coroutine blocks all of them until it returns: timers fire late,
+aiohttp timeouts run out while a response sits unread, and retries follow.
+``LoopMonitor`` measures that scheduling lag by asking for a wakeup every
+``interval`` seconds and recording how late it came.
+
+Attribution comes from the other side: ``utils.CpuTimed`` times every step
+of a scraper's listing and article coroutines, and steps that hold the loop
+longer than ``utils.SLOW_STEP_SECONDS`` are counted in that scraper's
+``FetchStats`` (``slow_steps``, ``slow_step_seconds``, ``slow_step_max_ms``,
+``slow_step_phase``). ``slow_step_report`` ranks scrapers by that time.
+"""
+
+import asyncio
+from collections import deque
+
+from . import metrics
+from .utils import nearest_rank_percentile
+
+_DEFAULT_INTERVAL = 0.05
+_DEFAULT_STALL_SECONDS = 0.1
+# about an hour and a half of samples at the default interval
+_MAX_SAMPLES = 100_000
+
+LAG_COLUMNS = ("loop_lag_p50_ms", "loop_lag_p95_ms", "loop_lag_max_ms", "loop_stalls")
+
+
+class LoopMonitor:
+    """Sample scheduling lag on the running event loop.
+
+    Use as ``async with LoopMonitor() as monitor:`` or ``start()`` /
+    ``await stop()``. Samples also feed the
+    ``newswatch_event_loop_lag_seconds`` histogram.
+    """
+
+    def __init__(
+        self,
+        interval: float = _DEFAULT_INTERVAL,
+        stall_seconds: float = _DEFAULT_STALL_SECONDS,
+    ):
+        self.interval = interval
+        self.stall_seconds = stall_seconds
+        # (loop time the wakeup was due, lag in seconds)
+        self.samples = deque(maxlen=_MAX_SAMPLES)
+        self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            due = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - due)
+            self.samples.append((due, lag))
+            metrics.EVENT_LOOP_LAG.observe(lag)
+
+    @classmethod
+    def for_run(cls, enabled: bool = False) -> "LoopMonitor | None":
+        """A started monitor when ``enabled`` or a metrics exporter is running."""
+        if enabled or metrics.is_exporting():
+            return cls().start()
+        return None
+
+    def start(self) -> "LoopMonitor":
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        return self
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def __aenter__(self):
+        return self.start()
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    def summary(self, since: float | None = None, until: float | None = None) -> dict:
+        """Lag statistics, optionally limited to a loop-time window.
+
+        Returns loop_lag_p50_ms, loop_lag_p95_ms, loop_lag_max_ms and
+        loop_stalls (wakeups late by at least ``stall_seconds``).
+        """
+        lags = sorted(
+            lag
+            for due, lag in self.samples
+            if (since is None or due >= since) and (until is None or due <= until)
+        )
+
+        def _ms(value):
+            return None if value is None else round(value * 1000, 1)
+
+        return {
+            "loop_lag_p50_ms": _ms(nearest_rank_percentile(lags, 50)),
+            "loop_lag_p95_ms": _ms(nearest_rank_percentile(lags, 95)),
+            "loop_lag_max_ms": _ms(lags[-1] if lags else None),
+            "loop_stalls": sum(lag >= self.stall_seconds for lag in lags),
+        }
+
+
+def slow_step_report(scrapers) -> list[dict]:
+    """Scrapers whose coroutine steps held the loop, worst first.
+
+    Args:
+        scrapers: (name, scraper) pairs; scrapers without ``fetch_stats``
+            are ignored.
+
+    Returns:
+        One dict per scraper with slow steps: name, slow_steps,
+        slow_step_seconds, slow_step_max_ms and slow_step_phase (the
+        phase -- listing or get_article -- with the most slow time).
+    """
+    rows = []
+    for name, scraper in scrapers:
+        stats = getattr(scraper, "fetch_stats", None)
+        if stats is None or not stats.slow_steps:
+            continue
+        summary = stats.summary()
+        rows.append({
+            "name": name,
+            **{key: summary[key] for key in (
+                "slow_steps", "slow_step_seconds", "slow_step_max_ms", "slow_step_phase",
+            )},
+        })
+    rows.sort(key=lambda row: row["slow_step_seconds"], reverse=True)
+    return rows
+
+
+def format_loop_report(lag: dict, slow: list[dict], top: int = 10) -> str:
+    """Human-readable loop lag and slow-step summary for the run summary."""
+    def _fmt(value):
+        return "-" if value is None else f"{value:.0f}"
+
+    lines = [
+        f"Event loop lag: p50 {_fmt(lag['loop_lag_p50_ms'])} ms, "
+        f"p95 {_fmt(lag['loop_lag_p95_ms'])} ms, max {_fmt(lag['loop_lag_max_ms'])} ms, "
+        f"{lag['loop_stalls']} stall(s)"
+    ]
+    if slow:
+        lines.append("Scrapers blocking the loop (steps over the slow-step threshold):")
+        for row in slow[:top]:
+            lines.append(
+                f"  {row['name']:<20} {row['slow_steps']:>4} step(s) "
+                f"{row['slow_step_seconds']:>7.2f}s total, max {row['slow_step_max_ms']:.0f} ms "
+                f"in {row['slow_step_phase']}"
+            )
+    return "\n".join(lines)
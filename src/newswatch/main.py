@@ -8,12 +8,18 @@ import csv
 import json
 import logging
 import math
+import shutil
 from datetime import datetime
 from pathlib import Path
 
 
+from . import tracing
+from .crawlstate import CrawlStateStore
+from .dedup import LinkSet, SeenLinkStore, iter_output_links
+from .loopmonitor import LoopMonitor, format_loop_report, slow_step_report
 from .registry import get_available_scrapers_from_registry, get_scraper_by_slug
 from .timeutils import to_project_naive
+from .utils import ArticleQueue
 
 logging.basicConfig(
     level=logging.INFO,
@@ -24,40 +30,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def _load_dedup_links(file_path: str) -> set:
-    """Load article links from a previous output file for deduplication."""
-    path = Path(file_path)
-    suffix = path.suffix.lower()
-    links = set()
-
-    if suffix == ".csv":
-        with open(path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                link = row.get("link", "")
-                if link:
-                    links.add(link)
-    elif suffix == ".json":
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        for item in data:
-            link = item.get("link", "")
-            if link:
-                links.add(link)
-    elif suffix == ".jsonl":
-        with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    item = json.loads(line)
-                    link = item.get("link", "")
-                    if link:
-                        links.add(link)
-    else:
-        raise ValueError(
-            f"Unsupported dedup file format: {suffix}. Use .csv, .json, or .jsonl."
-        )
+def _load_dedup_links(file_path: str) -> LinkSet:
+    """Load article links from a previous output file for deduplication.
 
+    Returns a compact ``LinkSet`` (8 bytes per link, canonicalized) rather
+    than a set of strings, so a large dedup file stays cheap to hold.
+    """
+    links = LinkSet.from_links(iter_output_links(file_path))
     logger.info(f"Loaded {len(links)} links from dedup file: {file_path}")
     return links
 
@@ -131,7 +110,7 @@ def _build_output_label(keywords=None, method="search"):
     return ".".join(keywords_list)
 
 
-async def write_csv(queue, output_label, filename=None, limit=None, limit_reached_event=None, dedup_links=None, time_range=None):
+async def write_csv(queue, output_label, filename=None, limit=None, limit_reached_event=None, dedup_links=None, time_range=None, seen_store=None, append=False):
     fieldnames = [
         "title",
         "publish_date",
@@ -151,6 +130,10 @@ async def write_csv(queue, output_label, filename=None, limit=None, limit_reache
 
     tmp_filename = filename.with_suffix(filename.suffix + ".tmp")
     items_written = 0
+    # a resumed run carries on from the rows already in the output
+    append = append and filename.exists()
+    if append:
+        shutil.copyfile(filename, tmp_filename)
 
     # Parse time range if provided
     time_start, time_end = (None, None)
@@ -158,11 +141,12 @@ async def write_csv(queue, output_label, filename=None, limit=None, limit_reache
         time_start, time_end = time_range
 
     try:
-        with open(tmp_filename, mode="w", newline="", encoding="utf-8") as csvfile:
+        with open(tmp_filename, mode="a" if append else "w", newline="", encoding="utf-8") as csvfile:
             csv_writer = csv.DictWriter(
                 csvfile, fieldnames=fieldnames, quoting=csv.QUOTE_ALL
             )
-            csv_writer.writeheader()
+            if not append:
+                csv_writer.writeheader()
 
             while True:
                 item = await queue.get()
@@ -172,6 +156,8 @@ async def write_csv(queue, output_label, filename=None, limit=None, limit_reache
                 # Skip duplicates
                 if dedup_links is not None and item.get("link", "") in dedup_links:
                     continue
+                if seen_store is not None and item.get("link", "") in seen_store:
+                    continue
 
                 # Apply time range filter
                 if time_start is not None or time_end is not None:
@@ -184,9 +170,12 @@ async def write_csv(queue, output_label, filename=None, limit=None, limit_reache
                     item["publish_date"] = item["publish_date"].strftime(
                         "%Y-%m-%d %H:%M:%S"
                     )
-                csv_writer.writerow(item)
-                csvfile.flush()  # Ensure data is written to disk
+                with tracing.span("write", format="csv", link=item.get("link")):
+                    csv_writer.writerow(item)
+                    csvfile.flush()  # Ensure data is written to disk
                 items_written += 1
+                if seen_store is not None:
+                    seen_store.add(item.get("link", ""))
 
                 if limit is not None and items_written >= limit:
                     if limit_reached_event:
@@ -216,7 +205,7 @@ async def write_csv(queue, output_label, filename=None, limit=None, limit_reache
         logging.error(f"Error writing to CSV: {e}")
 
 
-async def write_json(queue, output_label, filename=None, limit=None, limit_reached_event=None, dedup_links=None, time_range=None):
+async def write_json(queue, output_label, filename=None, limit=None, limit_reached_event=None, dedup_links=None, time_range=None, seen_store=None):
     """Write scraped articles to JSON file format."""
     if filename is None:
         current_time = datetime.now().strftime("%Y%m%d_%H")
@@ -241,6 +230,8 @@ async def write_json(queue, output_label, filename=None, limit=None, limit_reach
             # Skip duplicates
             if dedup_links is not None and item.get("link", "") in dedup_links:
                 continue
+            if seen_store is not None and item.get("link", "") in seen_store:
+                continue
 
             # Apply time range filter
             if time_start is not None or time_end is not None:
@@ -262,8 +253,12 @@ async def write_json(queue, output_label, filename=None, limit=None, limit_reach
                 break
 
         # Write all articles to JSON file
-        with open(filename, mode="w", encoding="utf-8") as jsonfile:
-            json.dump(articles, jsonfile, indent=2, ensure_ascii=False)
+        with tracing.span("write", format="json", items=len(articles)):
+            with open(filename, mode="w", encoding="utf-8") as jsonfile:
+                json.dump(articles, jsonfile, indent=2, ensure_ascii=False)
+        # only now that the file exists are these links really written
+        if seen_store is not None:
+            seen_store.update(a.get("link", "") for a in articles)
 
         print(f"Data written to {filename}")
     except asyncio.CancelledError:
@@ -275,6 +270,8 @@ async def write_json(queue, output_label, filename=None, limit=None, limit_reach
         if articles:
             with open(filename, mode="w", encoding="utf-8") as jsonfile:
                 json.dump(articles, jsonfile, indent=2, ensure_ascii=False)
+            if seen_store is not None:
+                seen_store.update(a.get("link", "") for a in articles)
             logging.warning(
                 f"Writer cancelled: partial output ({len(articles)} items) "
                 f"written to {filename}"
@@ -288,7 +285,7 @@ async def write_json(queue, output_label, filename=None, limit=None, limit_reach
         logging.error(f"Error writing to JSON: {e}")
 
 
-async def write_xlsx(queue, output_label, filename=None, limit=None, limit_reached_event=None, dedup_links=None, time_range=None):
+async def write_xlsx(queue, output_label, filename=None, limit=None, limit_reached_event=None, dedup_links=None, time_range=None, seen_store=None):
     import pandas as pd
 
     fieldnames = [
@@ -337,6 +334,8 @@ async def write_xlsx(queue, output_label, filename=None, limit=None, limit_reach
             # Skip duplicates
             if dedup_links is not None and item.get("link", "") in dedup_links:
                 continue
+            if seen_store is not None and item.get("link", "") in seen_store:
+                continue
 
             # Apply time range filter
             if time_start is not None or time_end is not None:
@@ -355,8 +354,11 @@ async def write_xlsx(queue, output_label, filename=None, limit=None, limit_reach
                     limit_reached_event.set()
                 break
 
-        df = pd.DataFrame(items, columns=fieldnames)
-        df.to_excel(filename, index=False)
+        with tracing.span("write", format="xlsx", items=len(items)):
+            df = pd.DataFrame(items, columns=fieldnames)
+            df.to_excel(filename, index=False)
+        if seen_store is not None:
+            seen_store.update(i.get("link", "") for i in items)
         print(f"Data written to {filename}")
     except asyncio.CancelledError:
         # `items` only exists in memory until the final to_excel() above;
@@ -367,6 +369,8 @@ async def write_xlsx(queue, output_label, filename=None, limit=None, limit_reach
         if items:
             df = pd.DataFrame(items, columns=fieldnames)
             df.to_excel(filename, index=False)
+            if seen_store is not None:
+                seen_store.update(i.get("link", "") for i in items)
             logging.warning(
                 f"Writer cancelled: partial output ({len(items)} items) "
                 f"written to {filename}"
@@ -380,7 +384,7 @@ async def write_xlsx(queue, output_label, filename=None, limit=None, limit_reach
         logging.error(f"Error writing to XLSX: {e}")
 
 
-async def write_jsonl(queue, output_label, filename=None, limit=None, limit_reached_event=None, dedup_links=None, time_range=None):
+async def write_jsonl(queue, output_label, filename=None, limit=None, limit_reached_event=None, dedup_links=None, time_range=None, seen_store=None, append=False):
     """Write each article as a JSON line (JSONL) — crash-safe streaming output."""
     if filename is None:
         current_time = datetime.now().strftime("%Y%m%d_%H")
@@ -390,6 +394,10 @@ async def write_jsonl(queue, output_label, filename=None, limit=None, limit_reac
 
     tmp_filename = filename.with_suffix(filename.suffix + ".tmp")
     items_written = 0
+    # a resumed run carries on from the lines already in the output
+    append = append and filename.exists()
+    if append:
+        shutil.copyfile(filename, tmp_filename)
 
     # Parse time range if provided
     time_start, time_end = (None, None)
@@ -397,7 +405,7 @@ async def write_jsonl(queue, output_label, filename=None, limit=None, limit_reac
         time_start, time_end = time_range
 
     try:
-        with open(tmp_filename, mode="w", encoding="utf-8") as f:
+        with open(tmp_filename, mode="a" if append else "w", encoding="utf-8") as f:
             while True:
                 item = await queue.get()
                 if item is None:  # Sentinel value to stop the writer
@@ -406,6 +414,8 @@ async def write_jsonl(queue, output_label, filename=None, limit=None, limit_reac
                 # Skip duplicates
                 if dedup_links is not None and item.get("link", "") in dedup_links:
                     continue
+                if seen_store is not None and item.get("link", "") in seen_store:
+                    continue
 
                 # Apply time range filter
                 if time_start is not None or time_end is not None:
@@ -418,9 +428,12 @@ async def write_jsonl(queue, output_label, filename=None, limit=None, limit_reac
                     item["publish_date"] = item["publish_date"].strftime(
                         "%Y-%m-%d %H:%M:%S"
                     )
-                f.write(json.dumps(item, ensure_ascii=False) + "\n")
-                f.flush()  # Ensure data is written to disk
+                with tracing.span("write", format="jsonl", link=item.get("link")):
+                    f.write(json.dumps(item, ensure_ascii=False) + "\n")
+                    f.flush()  # Ensure data is written to disk
                 items_written += 1
+                if seen_store is not None:
+                    seen_store.add(item.get("link", ""))
 
                 if limit is not None and items_written >= limit:
                     if limit_reached_event:
@@ -524,7 +537,7 @@ async def main(args):
     max_pages = getattr(args, "max_pages", None)
     limit = getattr(args, "limit", None)
 
-    queue_ = asyncio.Queue()
+    queue_ = ArticleQueue()
     limit_reached_event = asyncio.Event()
 
     # Get custom output path if provided
@@ -551,26 +564,70 @@ async def main(args):
             logging.error(f"Failed to parse time range: {e}")
             return
 
+    # Persistent seen-link store: consulted before article fetches and
+    # updated by the writer as rows land on disk
+    seen_store_path = getattr(args, "seen_store", None)
+    seen_store = None
+    if seen_store_path:
+        try:
+            seen_store = SeenLinkStore(
+                seen_store_path, bloom=getattr(args, "seen_store_bloom", False)
+            )
+        except Exception as e:
+            logging.error(f"Failed to open seen store: {e}")
+            return
+
+    # Incremental crawl state: each source resumes from the high-water mark
+    # of its previous completed run
+    crawl_state_path = getattr(args, "crawl_state", None)
+    crawl_state = None
+    if crawl_state_path:
+        try:
+            crawl_state = CrawlStateStore(crawl_state_path)
+        except Exception as e:
+            logging.error(f"Failed to open crawl state: {e}")
+            if seen_store is not None:
+                seen_store.close()
+            return
+
+    # Resumable run (--checkpoint / --resume): finished units and emitted
+    # links are journaled, and links an earlier attempt wrote are skipped
+    # before fetching and appended after
+    checkpoint = getattr(args, "run_checkpoint", None)
+    writer_seen_store = seen_store
+    append = False
+    if checkpoint is not None:
+        checkpoint.attach(queue_)
+        dedup_links = (
+            checkpoint.emitted if dedup_links is None else dedup_links.union(checkpoint.emitted)
+        )
+        writer_seen_store = checkpoint.links(seen_store)
+        append = bool(getattr(args, "resume", None))
+
     output_format = getattr(args, "output_format", "xlsx")
     if output_format.lower() == "xlsx":
         writer_task = asyncio.create_task(
             write_xlsx(queue_, output_label, output_path, limit=limit, limit_reached_event=limit_reached_event,
-                       dedup_links=dedup_links, time_range=parsed_time_range)
+                       dedup_links=dedup_links, time_range=parsed_time_range,
+                       seen_store=writer_seen_store)
         )
     elif output_format.lower() == "json":
         writer_task = asyncio.create_task(
             write_json(queue_, output_label, output_path, limit=limit, limit_reached_event=limit_reached_event,
-                       dedup_links=dedup_links, time_range=parsed_time_range)
+                       dedup_links=dedup_links, time_range=parsed_time_range,
+                       seen_store=writer_seen_store)
         )
     elif output_format.lower() == "jsonl":
         writer_task = asyncio.create_task(
             write_jsonl(queue_, output_label, output_path, limit=limit, limit_reached_event=limit_reached_event,
-                        dedup_links=dedup_links, time_range=parsed_time_range)
+                        dedup_links=dedup_links, time_range=parsed_time_range,
+                        seen_store=writer_seen_store, append=append)
         )
     else:
         writer_task = asyncio.create_task(
             write_csv(queue_, output_label, output_path, limit=limit, limit_reached_event=limit_reached_event,
-                      dedup_links=dedup_links, time_range=parsed_time_range)
+                      dedup_links=dedup_links, time_range=parsed_time_range,
+                      seen_store=writer_seen_store, append=append)
         )
 
     scraper_classes = get_available_scrapers(method=method)
@@ -602,10 +659,22 @@ async def main(args):
                     scraper_instance.max_pages = max_pages
                 else:
                     scraper_instance.max_latest_pages = max_pages
+            if seen_store is not None:
+                scraper_instance.seen_store = seen_store
+            if crawl_state is not None:
+                scraper_instance.crawl_state = crawl_state.for_source(scraper_name)
+            if checkpoint is not None:
+                scraper_instance.checkpoint = checkpoint.for_source(scraper_name)
+                scraper_instance.dedup_links = dedup_links
             scraper_entries.append((scraper_name, scraper_instance))
         else:
             logging.warning(f"scraper '{scraper_name}' is not recognized.")
 
+    if crawl_state is not None and getattr(args, "crawl_state_reset", False):
+        crawl_state.reset(
+            None if selected_scrapers.lower() in ["all", "auto"] else scrapers_to_run
+        )
+
     scrapers = [instance for _, instance in scraper_entries]
 
     if not scrapers:
@@ -616,6 +685,10 @@ async def main(args):
             await writer_task
         except asyncio.CancelledError:
             pass
+        if seen_store is not None:
+            seen_store.close()
+        if crawl_state is not None:
+            crawl_state.close()
         return
 
     # Extract new CLI parameters
@@ -631,6 +704,9 @@ async def main(args):
     general_sem = asyncio.Semaphore(max_concurrent_scrapers)
     browser_sem = asyncio.Semaphore(min(2, max_concurrent_scrapers))
 
+    loop_monitor_enabled = getattr(args, "loop_monitor", False)
+    loop_monitor = LoopMonitor.for_run(loop_monitor_enabled)
+
     total = len(scraper_entries)
     progress_tasks = [
         asyncio.create_task(
@@ -722,6 +798,9 @@ async def main(args):
         errors = len(results) - succeeded - timed_out
         print(f"Summary: {succeeded} succeeded, {timed_out} timed out, {errors} errors")
 
+    if loop_monitor_enabled:
+        print(format_loop_report(loop_monitor.summary(), slow_step_report(scraper_entries)))
+
     # After scraping is done, put a sentinel value into the queue to signal the writer to finish
     await queue_.put(None)
 
@@ -741,3 +820,12 @@ async def main(args):
         logging.error(f"Error in writer task: {e}")
         writer_task.cancel()
         await asyncio.gather(writer_task, return_exceptions=True)
+    finally:
+        if checkpoint is not None:
+            checkpoint.settle()
+        if loop_monitor is not None:
+            await loop_monitor.stop()
+        if seen_store is not None:
+            seen_store.close()
+        if crawl_state is not None:
+            crawl_state.close()
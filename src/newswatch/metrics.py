@@ -0,0 +1,397 @@
+"""Prometheus-style metrics for long-running deployments.
+
+A small in-process registry of counters, gauges and histograms rendered in
+the Prometheus text exposition format, so no client library is needed.
+Metrics are always collected -- an update is a dict lookup and an add under
+an uncontended lock -- and exported only on request:
+
+* ``start_http_server(port)`` serves ``/metrics`` from a daemon thread;
+* ``TextfileExporter(path, interval)`` rewrites a node_exporter
+  textfile-collector file every ``interval`` seconds;
+* ``render()`` returns the text for a service to serve itself.
+
+Queue depth and writer lag are computed when the metrics are rendered, from
+the live ``ArticleQueue`` instances, so they cost nothing per article.
+"""
+
+import logging
+import math
+import os
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+LAG_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+
+_exporters = 0
+_exporters_lock = threading.Lock()
+
+
+def _format_value(value) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _label_text(names, values, extra=()) -> str:
+    pairs = [*zip(names, values), *extra]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def host_of(url) -> str:
+    """Host label for a url ("" when it has none)."""
+    try:
+        return urlsplit(url).hostname or ""
+    except ValueError:
+        return ""
+
+
+class _Metric:
+    type_ = "untyped"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values):
+        """The child for one label combination (created on first use).
+
+        Pass label values as strings; they are rendered as given.
+        """
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def _samples(self):
+        for values, child in list(self._children.items()):
+            yield from child.samples(self.name, self.labelnames, values)
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_}",
+        ]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._children.clear()
+
+
+class _CounterChild:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1) -> None:
+        with self._lock:
+            self.value += amount
+
+    def samples(self, name, labelnames, values):
+        yield f"{name}{_label_text(labelnames, values)} {_format_value(self.value)}"
+
+
+class Counter(_Metric):
+    type_ = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount=1) -> None:
+        """Increment an unlabelled counter."""
+        self.labels().inc(amount)
+
+
+class _GaugeChild(_CounterChild):
+    __slots__ = ()
+
+    def set(self, value) -> None:
+        self.value = value
+
+    def dec(self, amount=1) -> None:
+        self.inc(-amount)
+
+
+class Gauge(_Metric):
+    type_ = "gauge"
+
+    def __init__(self, name, documentation, labelnames=(), function=None):
+        super().__init__(name, documentation, labelnames)
+        self._function = function
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value) -> None:
+        self.labels().set(value)
+
+    def _samples(self):
+        if self._function is None:
+            yield from super()._samples()
+        else:
+            yield f"{self.name} {_format_value(self._function())}"
+
+
+class _HistogramChild:
+    __slots__ = ("buckets", "counts", "sum", "_lock")
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    def samples(self, name, labelnames, values):
+        cumulative = 0
+        for bound, count in zip((*self.buckets, math.inf), self.counts):
+            cumulative += count
+            labels = _label_text(labelnames, values, (("le", _format_value(float(bound))),))
+            yield f"{name}_bucket{labels} {cumulative}"
+        labels = _label_text(labelnames, values)
+        yield f"{name}_sum{labels} {_format_value(self.sum)}"
+        yield f"{name}_count{labels} {cumulative}"
+
+
+class Histogram(_Metric):
+    type_ = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value) -> None:
+        self.labels().observe(value)
+
+
+class MetricsRegistry:
+    """An ordered set of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics = {}
+
+    def register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        return "\n".join(m.render() for m in self._metrics.values()) + "\n"
+
+    def clear(self) -> None:
+        """Drop every recorded sample (registrations stay)."""
+        for metric in self._metrics.values():
+            metric.clear()
+
+
+REGISTRY = MetricsRegistry()
+
+
+def _queue_depth() -> int:
+    from .utils import ArticleQueue
+
+    return sum(q.qsize() for q in list(ArticleQueue.live))
+
+
+def _writer_lag() -> float:
+    from .utils import ArticleQueue
+
+    enqueued = [q.oldest_enqueued_at() for q in list(ArticleQueue.live)]
+    enqueued = [t for t in enqueued if t is not None]
+    return round(time.perf_counter() - min(enqueued), 6) if enqueued else 0.0
+
+
+HTTP_REQUESTS = REGISTRY.register(Counter(
+    "newswatch_http_requests_total",
+    "HTTP requests by host, status and transport (aiohttp, rnet, playwright).",
+    ("host", "status", "transport"),
+))
+HTTP_REQUEST_SECONDS = REGISTRY.register(Histogram(
+    "newswatch_http_request_duration_seconds",
+    "HTTP request latency by host and transport.",
+    ("host", "transport"),
+))
+RETRIES = REGISTRY.register(Counter(
+    "newswatch_http_retries_total", "Request retries by host.", ("host",),
+))
+BLOCKED_PAGES = REGISTRY.register(Counter(
+    "newswatch_blocked_pages_total",
+    "Responses that looked like an anti-bot block page, by host and transport.",
+    ("host", "transport"),
+))
+ARTICLES_EMITTED = REGISTRY.register(Counter(
+    "newswatch_articles_emitted_total", "Articles emitted by scrapers, by source.",
+    ("source",),
+))
+QUEUE_WAIT_SECONDS = REGISTRY.register(Histogram(
+    "newswatch_queue_wait_seconds",
+    "Time articles spent in the queue before the writer took them.",
+    buckets=LAG_BUCKETS,
+))
+QUEUE_DEPTH = REGISTRY.register(Gauge(
+    "newswatch_queue_depth", "Articles waiting for a writer.", function=_queue_depth,
+))
+WRITER_LAG = REGISTRY.register(Gauge(
+    "newswatch_writer_lag_seconds",
+    "Age of the oldest article still waiting for a writer.",
+    function=_writer_lag,
+))
+EVENT_LOOP_LAG = REGISTRY.register(Histogram(
+    "newswatch_event_loop_lag_seconds",
+    "How late the event loop ran a timer it was asked to run on time.",
+    buckets=LAG_BUCKETS,
+))
+
+
+def render(registry: MetricsRegistry = REGISTRY) -> str:
+    """Metrics in the Prometheus text exposition format."""
+    return registry.render()
+
+
+def write_textfile(path, registry: MetricsRegistry = REGISTRY) -> None:
+    """Atomically write the metrics to a textfile-collector file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(render(registry), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def is_exporting() -> bool:
+    """True while an exporter is running (runs then sample event-loop lag)."""
+    return _exporters > 0
+
+
+def _exporter_started() -> None:
+    global _exporters
+    with _exporters_lock:
+        _exporters += 1
+
+
+def _exporter_stopped() -> None:
+    global _exporters
+    with _exporters_lock:
+        _exporters = max(0, _exporters - 1)
+
+
+class TextfileExporter:
+    """Rewrite a textfile-collector file every ``interval`` seconds.
+
+    Use as a context manager, or call ``start()``/``stop()``. The file is
+    written once more on stop so the final counts are not lost.
+    """
+
+    def __init__(self, path, interval: float = 15, registry: MetricsRegistry = REGISTRY):
+        self.path = Path(path)
+        self.interval = interval
+        self.registry = registry
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                write_textfile(self.path, self.registry)
+            except OSError as e:
+                logger.warning(f"Failed to write metrics to {self.path}: {e}")
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._run, name="newswatch-metrics-textfile", daemon=True
+        )
+        self._thread.start()
+        _exporter_started()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        _exporter_stopped()
+        write_textfile(self.path, self.registry)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = render(self.server.registry).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("metrics endpoint: " + format, *args)
+
+
+class MetricsServer(ThreadingHTTPServer):
+    """HTTP server for ``/metrics``; see ``start_http_server``."""
+
+    daemon_threads = True
+
+    def __init__(self, address, registry: MetricsRegistry = REGISTRY):
+        super().__init__(address, _MetricsHandler)
+        self.registry = registry
+
+    def shutdown(self) -> None:
+        super().shutdown()
+        _exporter_stopped()
+
+
+def start_http_server(port: int, addr: str = "", registry: MetricsRegistry = REGISTRY) -> MetricsServer:
+    """Serve ``/metrics`` from a daemon thread; returns the server.
+
+    Call ``shutdown()`` then ``server_close()`` on the result to stop it.
+    Port 0 picks a free port (see ``server.server_address``).
+    """
+    server = MetricsServer((addr, port), registry)
+    threading.Thread(
+        target=server.serve_forever, name="newswatch-metrics-http", daemon=True
+    ).start()
+    _exporter_started()
+    return server
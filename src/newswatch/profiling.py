@@ -0,0 +1,336 @@
+"""Per-scraper profiles of the code that runs on the event loop.
+
+Wrapping a whole run in cProfile mixes every scraper together: the loop
+interleaves dozens of coroutines, so one scraper's BeautifulSoup time shows
+up under another's call chain. Here each scraper gets its own
+``cProfile.Profile`` that is switched on only while one of that scraper's
+coroutine steps runs -- ``utils.CpuTimed`` already wraps the listing and
+``get_article`` coroutines of every scraper, and resumes the matching
+profile around each step. Time spent awaiting the network is never counted,
+and the writer and event-loop internals stay out of the profiles.
+
+    with profiling.profile("profiles/") as session:
+        scrape("ihsg", "2026-01-01")
+    print(session.summary_text)
+
+On exit the session writes, per run: a combined ``.pstats`` file, one
+``.pstats`` per scraper, a ``.collapsed`` flame-graph file and a
+``.speedscope.json`` file with one profile per scraper. Collapsed stacks
+are rebuilt from cProfile's caller graph, so time is split between call
+paths in proportion to their share of each function's cumulative time.
+"""
+
+import cProfile
+import json
+import os
+import pstats
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+_active_session = None
+_thread_state = threading.local()
+
+# stacks deeper than this, or weighing less than a microsecond, are dropped
+# from the collapsed output
+_MAX_DEPTH = 64
+_MIN_WEIGHT_SECONDS = 1e-6
+
+
+class ScraperProfile:
+    """The profile of one scraper's on-loop steps."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.profiler = cProfile.Profile()
+        self.steps = 0
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+
+    def resume(self):
+        """Make this profile the active one on this thread.
+
+        Returns the profile that was active before, to hand to ``pause``.
+        """
+        previous = getattr(_thread_state, "active", None)
+        if previous is not self:
+            # only one profiler can be installed per thread
+            if previous is not None:
+                previous.profiler.disable()
+            self.profiler.enable()
+            _thread_state.active = self
+        return previous
+
+    def pause(self, previous) -> None:
+        """Switch back to the profile ``resume`` returned."""
+        if previous is self:
+            return
+        self.profiler.disable()
+        _thread_state.active = previous
+        if previous is not None:
+            previous.profiler.enable()
+
+    def record_step(self, wall: float, cpu: float) -> None:
+        self.steps += 1
+        self.wall_seconds += wall
+        self.cpu_seconds += cpu
+
+    def stats(self) -> pstats.Stats | None:
+        """pstats for this scraper, or None when nothing was recorded."""
+        self.profiler.create_stats()
+        if not self.profiler.stats:
+            return None
+        return pstats.Stats(self.profiler)
+
+
+class ProfileSession:
+    """Scraper profiles collected during one ``profile()`` block."""
+
+    def __init__(self, directory=None, top: int = 20):
+        self.directory = Path(directory) if directory is not None else None
+        self.top = top
+        self.started_at = datetime.now()
+        self.profiles = {}
+        self.files = []
+        self.summary_text = ""
+        self._lock = threading.Lock()
+
+    def profiler_for(self, name: str) -> ScraperProfile:
+        profile = self.profiles.get(name)
+        if profile is None:
+            with self._lock:
+                profile = self.profiles.setdefault(name, ScraperProfile(name))
+        return profile
+
+    # ── Reporting ────────────────────────────────────────────────────────
+
+    def _stats_by_scraper(self) -> dict:
+        stats = {}
+        for name, profile in sorted(self.profiles.items()):
+            scraper_stats = profile.stats()
+            if scraper_stats is not None:
+                stats[name] = scraper_stats
+        return stats
+
+    def summary(self, stats_by_scraper: dict | None = None) -> dict:
+        """Per-scraper totals and the top functions by self time.
+
+        Returns:
+            ``{"scrapers": [...], "functions": [...]}``. Scraper rows have
+            name, steps, wall_seconds, cpu_seconds and top_function, worst
+            first; function rows have function, scraper, calls,
+            tottime and cumtime, limited to ``top``.
+        """
+        if stats_by_scraper is None:
+            stats_by_scraper = self._stats_by_scraper()
+        scrapers, functions = [], []
+        for name, profile in self.profiles.items():
+            entries = stats_by_scraper[name].stats if name in stats_by_scraper else {}
+            top_function = max(entries, key=lambda f: entries[f][2], default=None)
+            scrapers.append({
+                "name": name,
+                "steps": profile.steps,
+                "wall_seconds": round(profile.wall_seconds, 4),
+                "cpu_seconds": round(profile.cpu_seconds, 4),
+                "top_function": _label(top_function) if top_function else None,
+            })
+            for func, (_, calls, tottime, cumtime, _) in entries.items():
+                functions.append({
+                    "function": _label(func),
+                    "scraper": name,
+                    "calls": calls,
+                    "tottime": round(tottime, 4),
+                    "cumtime": round(cumtime, 4),
+                })
+        scrapers.sort(key=lambda row: row["wall_seconds"], reverse=True)
+        functions.sort(key=lambda row: row["tottime"], reverse=True)
+        return {"scrapers": scrapers, "functions": functions[: self.top]}
+
+    def format_summary(self, summary: dict) -> str:
+        lines = ["Profile by scraper (time on the event loop, network waits excluded):"]
+        fmt = "  {:<28} {:>6} {:>8} {:>8}  {}"
+        lines.append(fmt.format("SCRAPER", "STEPS", "WALL_S", "CPU_S", "TOP FUNCTION"))
+        for row in summary["scrapers"]:
+            lines.append(fmt.format(
+                row["name"][:28], row["steps"], f"{row['wall_seconds']:.3f}",
+                f"{row['cpu_seconds']:.3f}", row["top_function"] or "-",
+            ))
+        lines.append(f"Top {self.top} functions by self time:")
+        fmt = "  {:>8} {:>8} {:>8}  {:<28} {}"
+        lines.append(fmt.format("TOTTIME", "CUMTIME", "CALLS", "SCRAPER", "FUNCTION"))
+        for row in summary["functions"]:
+            lines.append(fmt.format(
+                f"{row['tottime']:.3f}", f"{row['cumtime']:.3f}", row["calls"],
+                row["scraper"][:28], row["function"],
+            ))
+        return "\n".join(lines)
+
+    def write(self, stats_by_scraper: dict) -> list[Path]:
+        """Write pstats, collapsed and speedscope files for this run."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        prefix = f"profile-{self.started_at:%Y%m%d-%H%M%S}-{os.getpid()}"
+        files = []
+
+        combined = None
+        for name, scraper_stats in stats_by_scraper.items():
+            path = self.directory / f"{prefix}.{_safe_name(name)}.pstats"
+            scraper_stats.dump_stats(path)
+            files.append(path)
+            if combined is None:
+                combined = pstats.Stats(str(path))
+            else:
+                combined.add(str(path))
+        if combined is not None:
+            path = self.directory / f"{prefix}.pstats"
+            combined.dump_stats(path)
+            files.insert(0, path)
+
+        stacks = {
+            name: collapsed_stacks(scraper_stats.stats, root=name)
+            for name, scraper_stats in stats_by_scraper.items()
+        }
+        path = self.directory / f"{prefix}.collapsed"
+        with open(path, "w", encoding="utf-8") as f:
+            for scraper_stacks in stacks.values():
+                for stack, seconds in scraper_stacks.items():
+                    f.write(f"{';'.join(stack)} {round(seconds * 1e6)}\n")
+        files.append(path)
+
+        path = self.directory / f"{prefix}.speedscope.json"
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(_speedscope(prefix, stacks), f, ensure_ascii=False)
+        files.append(path)
+
+        path = self.directory / f"{prefix}.txt"
+        path.write_text(self.summary_text + "\n", encoding="utf-8")
+        files.append(path)
+        return files
+
+    def finish(self) -> None:
+        stats_by_scraper = self._stats_by_scraper()
+        self.summary_text = self.format_summary(self.summary(stats_by_scraper))
+        if self.directory is not None:
+            self.files = self.write(stats_by_scraper)
+
+
+def _label(func) -> str:
+    filename, lineno, name = func
+    if filename == "~":
+        return name
+    return f"{name} ({os.path.basename(filename)}:{lineno})"
+
+
+def _safe_name(name: str) -> str:
+    return "".join(c if c.isalnum() or c in "-_" else "_" for c in name) or "scraper"
+
+
+def collapsed_stacks(entries: dict, root: str | None = None) -> dict:
+    """Approximate call stacks from a pstats ``stats`` dict.
+
+    cProfile keeps caller -> callee edges, not stacks. Starting from the
+    functions with no recorded caller, each callee's self time is split
+    across the paths that reach it by the share of its cumulative time
+    each caller accounts for.
+
+    Args:
+        entries: ``pstats.Stats.stats``.
+        root: optional frame name put at the bottom of every stack.
+
+    Returns:
+        ``{(frame, ...): seconds}`` of self time per stack.
+    """
+    children = {}
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller, edge in callers.items():
+            # edge is (cc, nc, tt, ct) of func when called from caller
+            children.setdefault(caller, []).append((func, edge[3]))
+
+    stacks = {}
+    base = (root,) if root else ()
+
+    def walk(func, path, labels, share):
+        tottime = entries[func][2]
+        labels = (*labels, _label(func))
+        own = tottime * share
+        if own >= _MIN_WEIGHT_SECONDS:
+            stacks[labels] = stacks.get(labels, 0.0) + own
+        if len(labels) >= _MAX_DEPTH:
+            return
+        for child, edge_cumtime in children.get(func, ()):
+            child_cumtime = entries[child][3]
+            if child in path or not child_cumtime:
+                continue
+            child_share = share * min(1.0, edge_cumtime / child_cumtime)
+            if child_share * child_cumtime >= _MIN_WEIGHT_SECONDS:
+                walk(child, path | {child}, labels, child_share)
+
+    for func, (_, _, _, _, callers) in entries.items():
+        if not any(caller in entries for caller in callers):
+            walk(func, {func}, base, 1.0)
+    return stacks
+
+
+def _speedscope(name: str, stacks_by_scraper: dict) -> dict:
+    frames, index = [], {}
+    profiles = []
+    for scraper, stacks in stacks_by_scraper.items():
+        samples, weights = [], []
+        for stack, seconds in stacks.items():
+            sample = []
+            for frame in stack:
+                if frame not in index:
+                    index[frame] = len(frames)
+                    frames.append({"name": frame})
+                sample.append(index[frame])
+            samples.append(sample)
+            weights.append(seconds)
+        profiles.append({
+            "type": "sampled",
+            "name": scraper,
+            "unit": "seconds",
+            "startValue": 0,
+            "endValue": sum(weights),
+            "samples": samples,
+            "weights": weights,
+        })
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": "newswatch",
+        "activeProfileIndex": 0,
+        "shared": {"frames": frames},
+        "profiles": profiles,
+    }
+
+
+def profiler_for(name: str) -> ScraperProfile | None:
+    """The profile to resume for scraper ``name``, or None when not profiling."""
+    session = _active_session
+    if session is None:
+        return None
+    return session.profiler_for(name)
+
+
+@contextmanager
+def profile(directory=None, top: int = 20):
+    """Profile every scraper's on-loop work for the duration of the block.
+
+    Args:
+        directory: where to write the profile files, or None to only build
+            the summary.
+        top: how many functions the summary lists.
+
+    Yields:
+        The ProfileSession; ``summary_text`` and ``files`` are filled in on
+        exit.
+    """
+    global _active_session
+    previous = _active_session
+    session = ProfileSession(directory, top)
+    _active_session = session
+    try:
+        yield session
+    finally:
+        _active_session = previous
+        session.finish()
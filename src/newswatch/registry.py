@@ -12,7 +12,7 @@ Each entry declares:
     scrapers that call Playwright directly from fetch_search_results()
     never go through self.fetch(), so `concurrency` doesn't bound them.
     browser_required sources default to 1 here even when unset (see
-    get_available_scrapers_from_registry).
+    scraper_params).
   - status: "stable" | "quarantined" | "investigating"
   - strict_search: whether true arbitrary-keyword search is validated
   - browser_required: whether Playwright is needed for this source
@@ -24,10 +24,19 @@ Each entry declares:
 
 Registry is built from a tuple of ScraperEntry via build_registry().
 This prevents silent duplicate-key overwrites that raw dict literals allow.
+
+The entries are the capability manifest: selection, help text, validation
+and the scheduling math read them without importing any scraper module.
+A scraper module is imported only when a run asks for that slug (see
+ScraperClasses), and validate_registry() checks class names against an
+``ast`` scan of the sources (scraper_manifest()) rather than imports.
 """
 
+import ast
+import functools
 import importlib
 import logging
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -890,38 +899,66 @@ SCRAPERS: Dict[str, ScraperEntry] = build_registry(_SCRAPER_ENTRIES)
 _SCRAPER_IGNORE = {"__init__", "basescraper"}
 
 
-def validate_registry() -> List[str]:
-    """Validate registry integrity. Returns list of issues (empty = OK)."""
-    issues: List[str] = []
+@functools.cache
+def scraper_manifest() -> Dict[str, Dict[str, List[str]]]:
+    """Map each scraper module to its top-level classes and the methods they define.
 
-    # Check all registry modules have files
-    scraper_dir = Path(__file__).parent / "scrapers"
+    Built by parsing the sources with ``ast``, not by importing them, so it
+    costs no Playwright/bs4/dateparser import; computed once per process.
+    """
+    manifest: Dict[str, Dict[str, List[str]]] = {}
+    for path in sorted((Path(__file__).parent / "scrapers").glob("*.py")):
+        if path.stem in _SCRAPER_IGNORE:
+            continue
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        manifest[path.stem] = {
+            node.name: [
+                item.name
+                for item in node.body
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+            ]
+            for node in tree.body
+            if isinstance(node, ast.ClassDef)
+        }
+    return manifest
+
+
+def validate_registry(import_modules: bool = False) -> List[str]:
+    """Validate registry integrity. Returns list of issues (empty = OK).
+
+    Args:
+        import_modules: also import every scraper module, catching
+            failures a source scan cannot (missing dependencies, errors
+            at import time).
+    """
+    issues: List[str] = []
+    manifest = scraper_manifest()
     registry_modules = {e.module for e in _SCRAPER_ENTRIES}
 
+    # Check all registry modules have files
     for mod in sorted(registry_modules):
-        if not (scraper_dir / f"{mod}.py").exists():
+        if mod not in manifest:
             issues.append(f"Registry module '{mod}' has no file at scrapers/{mod}.py")
 
     # Check all scraper files have registry entries
-    file_modules = {
-        p.stem for p in scraper_dir.glob("*.py") if p.stem not in _SCRAPER_IGNORE
-    }
-    orphan_files = file_modules - registry_modules
+    orphan_files = set(manifest) - registry_modules
     for f in sorted(orphan_files):
         issues.append(f"Scraper file '{f}.py' has no registry entry")
 
-    # Check all registry classes import
+    # Check all registry classes exist
     for slug, entry in SCRAPERS.items():
-        try:
-            mod = importlib.import_module(
-                f".scrapers.{entry.module}", package="newswatch"
+        if entry.module not in manifest:
+            continue
+        if entry.class_name not in manifest[entry.module]:
+            issues.append(
+                f"Scraper '{slug}': class '{entry.class_name}' not found in module"
             )
-            if not hasattr(mod, entry.class_name):
-                issues.append(
-                    f"Scraper '{slug}': class '{entry.class_name}' not found in module"
-                )
-        except ImportError as e:
-            issues.append(f"Scraper '{slug}': module import failed — {e}")
+            continue
+        if import_modules:
+            try:
+                load_scraper_class(entry)
+            except (ImportError, AttributeError) as e:
+                issues.append(f"Scraper '{slug}': module import failed — {e}")
 
     return issues
 
@@ -982,36 +1019,78 @@ def get_all_slugs() -> List[str]:
     return sorted(SCRAPERS.keys())
 
 
-def get_available_scrapers_from_registry(method: str = "search"):
-    """Build the scraper_classes dict for main.py from the registry.
+def get_method_slugs(method: str = "search") -> List[str]:
+    """Return the slugs a run with this method can use, in registry order.
 
-    Returns:
-        dict: scraper_classes_dict mapping slug -> {"class": ScraperClass, "params": {"concurrency": N}}
+    Reads registry metadata only, so help text and --list_scrapers need no
+    scraper module (nor bs4, dateparser or Playwright) to be imported.
+    """
+    entries = get_latest_scrapers() if method == "latest" else get_search_scrapers()
+    return list(entries)
+
+
+def load_scraper_class(entry: ScraperEntry) -> type:
+    """Import a scraper's module and return its class."""
+    module = importlib.import_module(f".scrapers.{entry.module}", package="newswatch")
+    return getattr(module, entry.class_name)
+
+
+def scraper_params(entry: ScraperEntry) -> Dict[str, int]:
+    """Constructor parameters a run passes to this scraper."""
+    params = {"concurrency": entry.concurrency} if entry.concurrency else {}
+    keyword_concurrency = entry.keyword_concurrency
+    if keyword_concurrency is None and entry.browser_required:
+        # Each browser-required scraper launches its own Chromium
+        # process per keyword task unless gated; default to serial
+        # keywords for these unless an entry opts into more.
+        keyword_concurrency = 1
+    if keyword_concurrency is not None:
+        params["keyword_concurrency"] = keyword_concurrency
+    return params
+
+
+class ScraperClasses(Mapping):
+    """slug -> {"class": ScraperClass, "params": {...}}, imported on first access.
+
+    Keys and membership come from registry metadata, so listing or
+    validating slugs imports nothing, and a run that asks for one slug
+    imports only that scraper's module. A slug whose module fails to
+    import logs a warning and then behaves as if it were not registered.
     """
-    scraper_classes = {}
 
-    if method == "latest":
-        entries = get_latest_scrapers()
-    else:
-        entries = get_search_scrapers()
+    def __init__(self, entries: Dict[str, ScraperEntry]):
+        self._entries = dict(entries)
+        self._loaded: Dict[str, dict] = {}
 
-    for slug, entry in entries.items():
+    def __getitem__(self, slug: str) -> dict:
+        loaded = self._loaded.get(slug)
+        if loaded is not None:
+            return loaded
+        entry = self._entries[slug]
         try:
-            module = importlib.import_module(
-                f".scrapers.{entry.module}", package="newswatch"
-            )
-            scraper_class = getattr(module, entry.class_name)
-            params = {"concurrency": entry.concurrency} if entry.concurrency else {}
-            keyword_concurrency = entry.keyword_concurrency
-            if keyword_concurrency is None and entry.browser_required:
-                # Each browser-required scraper launches its own Chromium
-                # process per keyword task unless gated; default to serial
-                # keywords for these unless an entry opts into more.
-                keyword_concurrency = 1
-            if keyword_concurrency is not None:
-                params["keyword_concurrency"] = keyword_concurrency
-            scraper_classes[slug] = {"class": scraper_class, "params": params}
+            scraper_class = load_scraper_class(entry)
         except (ImportError, AttributeError) as e:
             logging.warning(f"Failed to load scraper '{slug}': {e}")
+            raise KeyError(slug) from e
+        loaded = self._loaded[slug] = {"class": scraper_class, "params": scraper_params(entry)}
+        return loaded
 
-    return scraper_classes
+    def __contains__(self, slug) -> bool:
+        return slug in self._entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def get_available_scrapers_from_registry(method: str = "search") -> ScraperClasses:
+    """Build the scraper_classes mapping for main.py from the registry.
+
+    Returns:
+        ScraperClasses: mapping slug -> {"class": ScraperClass, "params": {"concurrency": N}};
+        a scraper's module is imported the first time its slug is looked up.
+    """
+    entries = get_latest_scrapers() if method == "latest" else get_search_scrapers()
+    return ScraperClasses(entries)
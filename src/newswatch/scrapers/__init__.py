@@ -1,73 +1,98 @@
-from .antaranews import AntaranewsScraper as AntaranewsScraper
-from .abcnews import ABCNewsScraper as ABCNewsScraper
-from .nbcnews import NBCNewsScraper as NBCNewsScraper
-from .apnews import APNewsScraper as APNewsScraper
-from .aljazeera import AlJazeeraScraper as AlJazeeraScraper
-from .balipost import BaliPostScraper as BaliPostScraper
-from .bbc import BBCNewsScraper as BBCNewsScraper
-from .beritajatim import BeritaJatimScraper as BeritaJatimScraper
-from .beritasatu import BeritaSatuScraper as BeritaSatuScraper
-from .bisnis import BisnisScraper as BisnisScraper
-from .bloombergtechnoz import BloombergTechnozScraper as BloombergTechnozScraper
-from .cnbcindonesia import CNBCScraper as CNBCScraper
-from .cnaindonesia import CNAIndonesiaScraper as CNAIndonesiaScraper
-from .cnnindonesia import CNNIndonesiaScraper as CNNIndonesiaScraper
-from .dailysocial import DailySocialScraper as DailySocialScraper
-from .detik import DetikScraper as DetikScraper
-from .ddtcnews import DDTCNewsScraper as DDTCNewsScraper
-from .fajar import FajarScraper as FajarScraper
-from .galamedia import GalamediaScraper as GalamediaScraper
-from .gatra import GatraScraper as GatraScraper
-from .grid import GridScraper as GridScraper
-from .harianjogja import HarianJogjaScraper as HarianJogjaScraper
-from .hipwee import HipweeScraper as HipweeScraper
-from .idntimes import IDNTimesScraper as IDNTimesScraper
-from .idnfinancials import IDNFinancialsScraper as IDNFinancialsScraper
-from .indopolitika import IndopolitikaScraper as IndopolitikaScraper
-from .inews import INewsScraper as INewsScraper
-from .investor import InvestorScraper as InvestorScraper
-from .jakartaglobe import JakartaGlobeScraper as JakartaGlobeScraper
-from .jakartapost import JakartaPostScraper as JakartaPostScraper
-from .jawapos import JawaposScraper as JawaposScraper
-from .jpnn import JpnnScraper as JpnnScraper
-from .kaltimpost import KaltimPostScraper as KaltimPostScraper
-from .jakartaselarascoid import JakartaSelarasScraper as JakartaSelarasScraper
-from .kbr import KBRScraper as KBRScraper
-from .katadata import KatadataScraper as KatadataScraper
-from .kompas import KompasScraper as KompasScraper
-from .kontan import KontanScraper as KontanScraper
-from .kumparan import KumparanScraper as KumparanScraper
-from .liputan6 import Liputan6Scraper as Liputan6Scraper
-from .mediaindonesia import MediaIndonesiaScraper as MediaIndonesiaScraper
-from .merdeka import MerdekaScraper as MerdekaScraper
-from .metrotvnews import MetrotvnewsScraper as MetrotvnewsScraper
-from .niagaasia import NiagaAsiaScraper as NiagaAsiaScraper
-from .mojok import MojokScraper as MojokScraper
-from .mongabay import MongabayScraper as MongabayScraper
-from .ntvnews import NTVNewsScraper as NTVNewsScraper
-from .okezone import OkezoneScraper as OkezoneScraper
-from .pantau import PantauScraper as PantauScraper
-from .pikiranrakyat import PikiranRakyatScraper as PikiranRakyatScraper
-from .poskota import PoskotaScraper as PoskotaScraper
-from .projectmultatuli import ProjectMultatuliScraper as ProjectMultatuliScraper
-from .republika import RepublikaScraper as RepublikaScraper
-from .rmid import RmidScraper as RmidScraper
-from .rri import RRIScraper as RRIScraper
-from .rmol import RMOLScraper as RMOLScraper
-from .sindonews import SindonewsScraper as SindonewsScraper
-from .suara import SuaraScraper as SuaraScraper
-from .suaramerdeka import SuaraMerdekaScraper as SuaraMerdekaScraper
-from .surabayapagi import SurabayaPagiScraper as SurabayaPagiScraper
-from .swa import SWAScraper as SWAScraper
-from .tempo import TempoScraper as TempoScraper
-from .tirto import TirtoScraper as TirtoScraper
-from .tribunnews import TribunnewsScraper as TribunnewsScraper
-from .tvone import TVOneScraper as TVOneScraper
-from .tvrinews import TVRINewsScraper as TVRINewsScraper
-from .viva import VivaScraper as VivaScraper
-from .wartaekonomi import WartaEkonomiScraper as WartaEkonomiScraper
-from .voi import VOIScraper as VOIScraper
-from .voaindonesia import VOAIndonesiaScraper as VOAIndonesiaScraper
+"""Scraper classes, one module per source.
+
+The classes below are imported on first attribute access: a run that uses
+one source imports that scraper's module and not the other ones, with
+their bs4/dateparser/Playwright imports.
+"""
+
+import importlib
+
+_CLASS_MODULES = {
+    "AntaranewsScraper": "antaranews",
+    "ABCNewsScraper": "abcnews",
+    "NBCNewsScraper": "nbcnews",
+    "APNewsScraper": "apnews",
+    "AlJazeeraScraper": "aljazeera",
+    "BaliPostScraper": "balipost",
+    "BBCNewsScraper": "bbc",
+    "BeritaJatimScraper": "beritajatim",
+    "BeritaSatuScraper": "beritasatu",
+    "BisnisScraper": "bisnis",
+    "BloombergTechnozScraper": "bloombergtechnoz",
+    "CNBCScraper": "cnbcindonesia",
+    "CNAIndonesiaScraper": "cnaindonesia",
+    "CNNIndonesiaScraper": "cnnindonesia",
+    "DailySocialScraper": "dailysocial",
+    "DetikScraper": "detik",
+    "DDTCNewsScraper": "ddtcnews",
+    "FajarScraper": "fajar",
+    "GalamediaScraper": "galamedia",
+    "GatraScraper": "gatra",
+    "GridScraper": "grid",
+    "HarianJogjaScraper": "harianjogja",
+    "HipweeScraper": "hipwee",
+    "IDNTimesScraper": "idntimes",
+    "IDNFinancialsScraper": "idnfinancials",
+    "IndopolitikaScraper": "indopolitika",
+    "INewsScraper": "inews",
+    "InvestorScraper": "investor",
+    "JakartaGlobeScraper": "jakartaglobe",
+    "JakartaPostScraper": "jakartapost",
+    "JawaposScraper": "jawapos",
+    "JpnnScraper": "jpnn",
+    "KaltimPostScraper": "kaltimpost",
+    "JakartaSelarasScraper": "jakartaselarascoid",
+    "KBRScraper": "kbr",
+    "KatadataScraper": "katadata",
+    "KompasScraper": "kompas",
+    "KontanScraper": "kontan",
+    "KumparanScraper": "kumparan",
+    "Liputan6Scraper": "liputan6",
+    "MediaIndonesiaScraper": "mediaindonesia",
+    "MerdekaScraper": "merdeka",
+    "MetrotvnewsScraper": "metrotvnews",
+    "NiagaAsiaScraper": "niagaasia",
+    "MojokScraper": "mojok",
+    "MongabayScraper": "mongabay",
+    "NTVNewsScraper": "ntvnews",
+    "OkezoneScraper": "okezone",
+    "PantauScraper": "pantau",
+    "PikiranRakyatScraper": "pikiranrakyat",
+    "PoskotaScraper": "poskota",
+    "ProjectMultatuliScraper": "projectmultatuli",
+    "RepublikaScraper": "republika",
+    "RmidScraper": "rmid",
+    "RRIScraper": "rri",
+    "RMOLScraper": "rmol",
+    "SindonewsScraper": "sindonews",
+    "SuaraScraper": "suara",
+    "SuaraMerdekaScraper": "suaramerdeka",
+    "SurabayaPagiScraper": "surabayapagi",
+    "SWAScraper": "swa",
+    "TempoScraper": "tempo",
+    "TirtoScraper": "tirto",
+    "TribunnewsScraper": "tribunnews",
+    "TVOneScraper": "tvone",
+    "TVRINewsScraper": "tvrinews",
+    "VivaScraper": "viva",
+    "WartaEkonomiScraper": "wartaekonomi",
+    "VOIScraper": "voi",
+    "VOAIndonesiaScraper": "voaindonesia",
+}
+
+
+def __getattr__(name):
+    module = _CLASS_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_CLASS_MODULES))
+
 
 __all__ = [
     "AntaranewsScraper",
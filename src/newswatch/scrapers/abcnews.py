@@ -11,8 +11,8 @@ abcnews.go.com issues a 301 to abcnews.com, so the canonical host is
 abcnews.com. robots.txt disallows /search?searchtext=*, so keyword search
 filters the news sitemap rather than hitting the site's search endpoint —
 the same approach detik and idxchannel take. Because the feed carries a
-publication date per entry, the start_date cutoff is applied before any
-article is fetched.
+publication date per entry, links are listed with it and BaseScraper applies
+the start_date cutoff before any article is fetched.
 """
 import re
 import xml.etree.ElementTree as ET
@@ -124,20 +124,25 @@ class ABCNewsScraper(BaseScraper):
         return self._parse_feed(text)
 
     def _select(self, entries, tokens):
-        """Filter feed entries by keyword tokens and the start_date cutoff."""
+        """(link, publish_date) of the feed entries matching keyword tokens.
+
+        BaseScraper drops the entries dated outside the search window; only
+        the ones it keeps count toward ``MAX_ARTICLES_PER_QUERY``.
+        """
         links = []
         seen = set()
+        in_window = 0
         for loc, title, publish_date in entries:
-            if self.start_date and publish_date and publish_date < self.start_date:
-                continue
             if tokens and not _matches_all_tokens(_normalize(f"{title} {loc}"), tokens):
                 continue
             if loc in seen:
                 continue
-            links.append(loc)
+            links.append((loc, publish_date))
             seen.add(loc)
-            if len(links) >= self.MAX_ARTICLES_PER_QUERY:
-                break
+            if self._in_window([(loc, publish_date)])[0]:
+                in_window += 1
+                if in_window >= self.MAX_ARTICLES_PER_QUERY:
+                    break
         return links or None
 
     # ------------------------------------------------------------------
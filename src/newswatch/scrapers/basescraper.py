@@ -1,10 +1,90 @@
+import asyncio
+import contextvars
 import logging
 from abc import ABC, abstractmethod
-
-import dateparser
+from collections import deque
+from datetime import date, timedelta
 
 from ..timeutils import to_project_naive
-from ..utils import AsyncScraper
+from .. import tracing
+from ..utils import AsyncScraper, CpuTimed, fetch_phase
+
+# articles collected inside a date-window task, held back until the window's
+# turn to be emitted (see BaseScraper._walk_windows)
+_window_buffer: contextvars.ContextVar[list | None] = contextvars.ContextVar(
+    "newswatch_window_buffer", default=None
+)
+
+# the (keyword, listing link) whose article is being fetched, so an article put
+# on the queue is credited to the link it was listed under (see _CrawlQueue)
+_listed_article: contextvars.ContextVar[tuple | None] = contextvars.ContextVar(
+    "newswatch_listed_article", default=None
+)
+
+
+class _WindowedQueue:
+    """Stands in for a scraper's queue: holds back articles put inside a window task."""
+
+    def __init__(self, queue):
+        self.queue = queue
+
+    async def put(self, item) -> None:
+        buffer = _window_buffer.get()
+        if buffer is None:
+            await self.queue.put(item)
+        else:
+            buffer.append(item)
+
+
+class _CrawlQueue:
+    """Stands in for a scraper's queue: tells the crawl session which listed
+    links produced an article."""
+
+    def __init__(self, queue, crawl):
+        self.queue = queue
+        self.crawl = crawl
+
+    async def put(self, item) -> None:
+        await self.queue.put(item)
+        listed = _listed_article.get()
+        if listed is not None:
+            self.crawl.collected(*listed)
+
+
+class _ListingPrefetch:
+    """The listing pages of one walk, requested up to ``depth`` pages ahead.
+
+    ``get(page)`` starts fetching the next ``depth`` pages that ``wanted``
+    accepts, each in a task running ``prefetch_page(n)``, then returns
+    ``page``, awaiting ``fetch_page(page)`` itself if it was not prefetched. Whatever was fetched ahead but never asked for is cancelled by
+    ``close()``, which returns how many pages that was.
+    """
+
+    def __init__(self, fetch_page, prefetch_page, depth, wanted):
+        self.fetch_page = fetch_page
+        self.prefetch_page = prefetch_page
+        self.depth = depth
+        self.wanted = wanted
+        self.prefetched = 0
+        self._tasks = {}
+
+    async def get(self, page):
+        task = self._tasks.pop(page, None)
+        for ahead in range(page + 1, page + self.depth + 1):
+            if ahead not in self._tasks and self.wanted(ahead):
+                self._tasks[ahead] = asyncio.create_task(self.prefetch_page(ahead))
+                self.prefetched += 1
+        if task is None:
+            return await self.fetch_page(page)
+        return await task
+
+    async def close(self):
+        wasted = list(self._tasks.values())
+        self._tasks.clear()
+        for task in wasted:
+            task.cancel()
+        await asyncio.gather(*wasted, return_exceptions=True)
+        return len(wasted)
 
 
 class BaseScraper(AsyncScraper, ABC):
@@ -12,6 +92,17 @@ class BaseScraper(AsyncScraper, ABC):
     # the first page containing an out-of-window article ends pagination on one
     # stray result, which over a long window silently truncates a source.
     STALE_PAGE_TOLERANCE = 3
+    # Sources whose search takes a date range set WINDOW_DAYS. A search with a
+    # start date is then split into windows of that many days, several walked
+    # at once (WINDOW_CONCURRENCY per scraper, across all its keywords), each
+    # reading at most PAGES_PER_WINDOW listing pages.
+    WINDOW_DAYS = None
+    WINDOW_CONCURRENCY = 4
+    PAGES_PER_WINDOW = None
+    # Listing pages requested ahead of the one being processed, so the next
+    # pages download while this page's articles are fetched. Only for sources
+    # whose page N+1 does not depend on page N's response.
+    PREFETCH_PAGES = 0
 
     def __init__(
         self,
@@ -38,11 +129,26 @@ class BaseScraper(AsyncScraper, ABC):
         self.max_latest_pages = max_latest_pages if max_latest_pages is not None else 1
         self.max_pages = max_pages
         self.dedup_links = dedup_links or set()
+        # optional persistent store of links written by earlier runs
+        # (dedup.SeenLinkStore); anything supporting `link in store` works
+        self.seen_store = None
+        # optional high-water marks of earlier runs
+        # (crawlstate.SourceCrawlState), set by the runner
+        self.crawl_state = None
+        self._crawl = None
+        # optional journal of a resumable run (checkpoint.SourceCheckpoint),
+        # set by the runner
+        self.checkpoint = None
         self.start_datetime = start_datetime
         self.end_datetime = end_datetime
         self._articles_collected = 0
+        self.window_semaphore = asyncio.Semaphore(self.WINDOW_CONCURRENCY)
 
     def parse_date(self, date_string, **kwargs):
+        # dateparser takes a few hundred ms to import; keep it off the
+        # import path of the package and of scrapers that never parse a date
+        import dateparser
+
         parsed_date = dateparser.parse(date_string, **kwargs)
         if parsed_date:
             # convert the offset, don't discard it: a -04:00 and a +07:00
@@ -56,7 +162,15 @@ class BaseScraper(AsyncScraper, ABC):
 
     @abstractmethod
     def parse_article_links(self, response_text):
-        pass
+        """Links of one listing page.
+
+        A source whose listing shows when each article was published may
+        return ``(link, listing_date)`` pairs instead of bare links (a date
+        may be None, and the two may be mixed). Dated links outside the
+        search window are then dropped before anything is fetched, and a
+        page with links older than the start date counts toward the
+        pagination stop as if their articles had been fetched.
+        """
 
     @abstractmethod
     async def get_article(self, link, keyword):
@@ -85,47 +199,278 @@ class BaseScraper(AsyncScraper, ABC):
         return self._stale_pages < self.STALE_PAGE_TOLERANCE
 
     async def fetch_search_results(self, keyword):
+        start = getattr(self, "start_date", None) or self.start_datetime
+        if self.WINDOW_DAYS and start:
+            end = self.end_datetime.date() if self.end_datetime else date.today()
+            return await self._walk_windows(keyword, start.date(), end)
+
         page = 1
         found_articles = False
         self._reset_pagination()
+        listing = self._listing_prefetch(
+            lambda n: self.build_search_url(keyword, n),
+            lambda n: (self.max_pages is None or n <= self.max_pages)
+            and not self._unit_done(keyword, f"page:{n}"),
+        )
 
-        while self.max_pages is None or page <= self.max_pages:
-            response_text = await self.build_search_url(keyword, page)
-            if not response_text:
-                break
+        try:
+            while self.max_pages is None or page <= self.max_pages:
+                if self._unit_done(keyword, f"page:{page}"):
+                    found_articles = True
+                    page += 1
+                    continue
+                with tracing.span(
+                    "listing", source=type(self).__name__, keyword=keyword, page=page
+                ):
+                    response_text = await listing.get(page)
+                    if not response_text:
+                        break
 
-            filtered_hrefs = self.parse_article_links(response_text)
-            if not filtered_hrefs:
-                break
+                    filtered_hrefs = self.parse_article_links(response_text)
+                    if not filtered_hrefs:
+                        break
 
-            found_articles = True
-            in_window = await self.process_page(filtered_hrefs, keyword)
-            if not self._keep_paginating(in_window):
-                break
+                    found_articles = True
+                    in_window = await self.process_page(filtered_hrefs, keyword)
+                    self._finish_unit(keyword, f"page:{page}")
+                    if not self._keep_paginating(in_window) or self._caught_up(keyword):
+                        break
 
-            page += 1
+                page += 1
+        finally:
+            await self._close_prefetch(listing, keyword)
 
         if not found_articles:
             logging.info(f"No news found on {self.base_url} for keyword: '{keyword}'")
 
+    def plan_windows(self, floor, end):
+        """``WINDOW_DAYS``-wide (start, end) date windows covering floor..end, newest first.
+
+        Windows are counted from ``floor``, not from ``end``, so a resumed run
+        names them the same way the interrupted one did.
+        """
+        windows = []
+        start = floor
+        while start <= end:
+            windows.append((start, min(end, start + timedelta(days=self.WINDOW_DAYS - 1))))
+            start += timedelta(days=self.WINDOW_DAYS)
+        return windows[::-1]
+
+    async def _walk_windows(self, keyword, floor, end):
+        """Walk ``keyword``'s search window by window, several windows at once.
+
+        At most ``WINDOW_CONCURRENCY`` windows of a keyword are in flight, and
+        they share the scraper's ``window_semaphore`` with its other keywords.
+        Articles a window collects are held back until every newer window has
+        been emitted, so the output still runs newest first.
+        """
+        self._reset_pagination()
+        found = False
+        in_flight = deque()
+        try:
+            for window in self.plan_windows(floor, end):
+                unit = f"window:{window[0]}/{window[1]}"
+                if self._unit_done(keyword, unit):
+                    found = True
+                    continue
+                if len(in_flight) >= self.WINDOW_CONCURRENCY:
+                    found |= await self._emit_window(keyword, *in_flight.popleft())
+                if self._caught_up(keyword):
+                    break
+                task = asyncio.create_task(self._run_window(keyword, window))
+                in_flight.append((unit, task))
+            while in_flight:
+                found |= await self._emit_window(keyword, *in_flight.popleft())
+        finally:
+            for _, task in in_flight:
+                task.cancel()
+            await asyncio.gather(*(task for _, task in in_flight), return_exceptions=True)
+
+        if not found:
+            logging.info(f"No news found on {self.base_url} for keyword: '{keyword}'")
+
+    async def _run_window(self, keyword, window):
+        buffer = []
+        # set in this task's own context; the article tasks it starts copy it
+        _window_buffer.set(buffer)
+        async with self.window_semaphore:
+            found = await self.fetch_window(keyword, window)
+        return found, buffer
+
+    async def _emit_window(self, keyword, unit, task):
+        found, buffer = await task
+        for item in buffer:
+            await self.queue_.put(item)
+        self._finish_unit(keyword, unit)
+        return found
+
+    async def fetch_window(self, keyword, window):
+        """Walk the listing of one (start, end) window; True if it listed anything.
+
+        Pages come from ``build_search_url(keyword, page, window)``. The query
+        itself is date-bounded, so paging stops on a page with nothing new or
+        at ``PAGES_PER_WINDOW``, never on an article's date.
+        """
+        found = False
+        page = 1
+        listing = self._listing_prefetch(
+            lambda n: self.build_search_url(keyword, n, window),
+            lambda n: self.PAGES_PER_WINDOW is None or n <= self.PAGES_PER_WINDOW,
+        )
+        try:
+            while self.PAGES_PER_WINDOW is None or page <= self.PAGES_PER_WINDOW:
+                with tracing.span(
+                    "listing", source=type(self).__name__, keyword=keyword, page=page
+                ):
+                    response_text = await listing.get(page)
+                    if not response_text:
+                        break
+                    filtered_hrefs = self.parse_article_links(response_text)
+                    if not filtered_hrefs:
+                        break
+                    found = True
+                    # the query is date-bounded; listing dates only trim its edges
+                    filtered_hrefs, _, _ = self._in_window(filtered_hrefs)
+                    links = self._new_links(filtered_hrefs, keyword)
+                    if not links:
+                        break
+                    await self._fetch_articles(links, keyword)
+                page += 1
+        finally:
+            await self._close_prefetch(listing, keyword)
+        return found
+
+    def _listing_prefetch(self, fetch_page, wanted):
+        """A ``_ListingPrefetch`` reading ``PREFETCH_PAGES`` ahead (0: none)."""
+
+        async def timed(page):
+            # a prefetched page is fetched in its own task, outside the walk's
+            # CpuTimed; a page awaited directly is already inside it
+            return await CpuTimed(fetch_page(page), self.fetch_stats)
+
+        return _ListingPrefetch(fetch_page, timed, self.PREFETCH_PAGES, wanted)
+
+    async def _close_prefetch(self, listing, keyword):
+        wasted = await listing.close()
+        self.fetch_stats.prefetched_pages += listing.prefetched
+        self.fetch_stats.wasted_prefetches += wasted
+        if wasted:
+            logging.debug(
+                "%s: %d of %d prefetched listing page(s) unused for keyword '%s'",
+                type(self).__name__, wasted, listing.prefetched, keyword,
+            )
+
     async def process_page(self, filtered_hrefs, keyword):
-        links = self._filter_links(filtered_hrefs)
+        filtered_hrefs, past_start, too_new = self._in_window(filtered_hrefs)
+        links = self._new_links(filtered_hrefs, keyword)
         if not links:
+            # a page of articles newer than end_datetime means the window is
+            # further down the listing: keep paging, unless those same links
+            # were listed before
+            fresh = [link for link in too_new if link not in self._pagination_seen]
+            self._pagination_seen.update(too_new)
+            if fresh and not past_start:
+                return True
             # a page carrying nothing new means paging is not advancing; report
             # it as stale so the caller stops instead of refetching the same
             # articles until the scraper timeout
             return False
+        await self._fetch_articles(links, keyword)
+        return self.continue_scraping and not past_start
+
+    def _in_window(self, hrefs):
+        """Drop links whose listing date falls outside the search window.
+
+        Returns the remaining links, whether any was dated before the start
+        date -- what ``get_article`` would otherwise have found out by
+        fetching the article and clearing ``continue_scraping`` -- and the
+        links dropped for being newer than ``end_datetime``.
+        """
+        start = to_project_naive(getattr(self, "start_date", None) or self.start_datetime)
+        end = to_project_naive(self.end_datetime)
+        links = []
+        past_start = False
+        too_new = []
+        for entry in hrefs:
+            if not isinstance(entry, tuple):
+                links.append(entry)
+                continue
+            link, listed = entry
+            listed = to_project_naive(listed)
+            if listed is not None:
+                if start is not None and listed < start:
+                    past_start = True
+                    continue
+                if end is not None and listed > end:
+                    too_new.append(link)
+                    continue
+            links.append(link)
+        return links, past_start, too_new
+
+    def _new_links(self, filtered_hrefs, keyword):
+        """The links of one listing page not handled before, now marked seen."""
+        if self._crawl is not None:
+            filtered_hrefs = self._crawl.page(keyword, filtered_hrefs)
+        links = self._filter_links(filtered_hrefs)
         self._pagination_seen.update(links)
-        tasks = [self.get_article(href, keyword) for href in links]
-        await self.run(tasks)
-        return self.continue_scraping
+        return links
+
+    async def _fetch_articles(self, links, keyword):
+        tasks = [
+            CpuTimed(self._traced_article(href, keyword), self.fetch_stats, "get_article")
+            for href in links
+        ]
+        # the article tasks copy this context when gather() creates them
+        token = fetch_phase.set("article")
+        try:
+            await self.run(tasks)
+        finally:
+            fetch_phase.reset(token)
+
+    async def _traced_article(self, link, keyword):
+        token = _listed_article.set((keyword, link))
+        try:
+            with tracing.span(
+                "get_article", source=type(self).__name__, url=link, keyword=keyword
+            ):
+                return await self.get_article(link, keyword)
+        finally:
+            _listed_article.reset(token)
+
+    def _unit_done(self, keyword, unit):
+        """True if a resumed run already finished ``unit`` of ``keyword``.
+
+        A unit is one step of a scraper's walk -- a listing page, a date
+        window, an archive month -- named so that it means the same thing
+        when the run is resumed.
+        """
+        return self.checkpoint is not None and self.checkpoint.is_done(keyword, str(unit))
+
+    def _finish_unit(self, keyword, unit):
+        """Journal ``unit`` of ``keyword`` as finished (no-op without a checkpoint)."""
+        if self.checkpoint is not None:
+            self.checkpoint.finish(keyword, str(unit))
+
+    def _caught_up(self, keyword):
+        """True once this run reached pages an earlier run already collected."""
+        return self._crawl is not None and self._crawl.caught_up(keyword)
 
     def _filter_links(self, links):
-        """Drop links already handled: the dedup set, or an earlier page."""
-        skip = self._pagination_seen.union(self.dedup_links)
-        if not skip:
-            return links
-        return [link for link in links if link not in skip]
+        """Drop links already handled: the dedup set, the seen store, or an
+        earlier page."""
+        # membership is checked against each container in place: building
+        # `_pagination_seen | dedup_links` would copy the whole dedup set on
+        # every page
+        seen = self._pagination_seen
+        dedup = self.dedup_links
+        store = self.seen_store
+        return [
+            link
+            for link in links
+            if link not in seen
+            and link not in dedup
+            and (store is None or link not in store)
+        ]
 
     async def fetch_latest_results(self):
         page = 1
@@ -133,18 +478,21 @@ class BaseScraper(AsyncScraper, ABC):
         self._reset_pagination()
 
         while page <= self.max_latest_pages:
-            response_text = await self.build_latest_url(page)
-            if not response_text:
-                break
+            with tracing.span(
+                "listing", source=type(self).__name__, keyword="latest", page=page
+            ):
+                response_text = await self.build_latest_url(page)
+                if not response_text:
+                    break
 
-            filtered_hrefs = self.parse_latest_article_links(response_text)
-            if not filtered_hrefs:
-                break
+                filtered_hrefs = self.parse_latest_article_links(response_text)
+                if not filtered_hrefs:
+                    break
 
-            found_articles = True
-            in_window = await self.process_page(filtered_hrefs, "latest")
-            if not self._keep_paginating(in_window):
-                break
+                found_articles = True
+                in_window = await self.process_page(filtered_hrefs, "latest")
+                if not self._keep_paginating(in_window) or self._caught_up("latest"):
+                    break
 
             page += 1
 
@@ -152,16 +500,39 @@ class BaseScraper(AsyncScraper, ABC):
             logging.info(f"No latest news found on {self.base_url}")
 
     async def _run_keyword(self, keyword):
+        if self._unit_done(keyword, "*"):
+            return
         if self.keyword_semaphore is None:
             await self.fetch_search_results(keyword)
         else:
             async with self.keyword_semaphore:
                 await self.fetch_search_results(keyword)
+        self._finish_unit(keyword, "*")
 
     async def scrape(self, method="search"):
-        async with self:
-            if method == "latest":
-                await self.fetch_latest_results()
-            else:
-                tasks = [self._run_keyword(keyword) for keyword in self.keywords]
-                await self.run(tasks)
+        queue = self.queue_
+        if self.crawl_state is not None:
+            start = None
+            if method != "latest":
+                start = to_project_naive(getattr(self, "start_date", None) or self.start_datetime)
+            self._crawl = self.crawl_state.session(method, start)
+        if self.WINDOW_DAYS:
+            self.queue_ = _WindowedQueue(self.queue_)
+        if self._crawl is not None:
+            self.queue_ = _CrawlQueue(self.queue_, self._crawl)
+        try:
+            async with self:
+                if method == "latest":
+                    await CpuTimed(self.fetch_latest_results(), self.fetch_stats)
+                else:
+                    tasks = [
+                        CpuTimed(self._run_keyword(keyword), self.fetch_stats)
+                        for keyword in self.keywords
+                    ]
+                    await self.run(tasks)
+            # only a completed run moves the frontier
+            if self._crawl is not None:
+                self._crawl.save()
+        finally:
+            self.queue_ = queue
+            self._crawl = None
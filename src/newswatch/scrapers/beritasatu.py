@@ -23,6 +23,9 @@ class BeritaSatuScraper(BaseScraper):
     Latest: homepage for page 1, /page/{N} for later.
     """
 
+    # ?page=N needs nothing from the page before it
+    PREFETCH_PAGES = 2
+
     def __init__(self, keywords, concurrency=5, start_date=None, queue_=None, keyword_concurrency=None):
         super().__init__(keywords, concurrency, queue_, keyword_concurrency=keyword_concurrency)
         self.base_url = "https://www.beritasatu.com"
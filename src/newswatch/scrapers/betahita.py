@@ -34,7 +34,6 @@ from datetime import datetime
 from urllib.parse import quote, urljoin
 
 from bs4 import BeautifulSoup, Comment
-from dateparser import parse as _dateparser_parse
 
 from .basescraper import BaseScraper
 
@@ -187,6 +186,8 @@ class BetahitaScraper(BaseScraper):
         text = raw.strip()
 
         # Try dateparser first with explicit Indonesian settings.
+        from dateparser import parse as _dateparser_parse
+
         parsed = _dateparser_parse(text, languages=["id"], settings={"PREFER_DAY_OF_MONTH": "first"})
         if parsed:
             return parsed.replace(tzinfo=None)
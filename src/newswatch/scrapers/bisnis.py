@@ -3,7 +3,6 @@ import re
 from urllib.parse import unquote, urlencode
 
 from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
 
 from .basescraper import BaseScraper
 
@@ -12,6 +11,9 @@ _UNSUPPORTED_SUBDOMAINS = {"epaper", "foto", "video", "infografis"}
 
 
 class BisnisScraper(BaseScraper):
+    # ?page=N needs nothing from the page before it
+    PREFETCH_PAGES = 2
+
     def __init__(self, keywords, concurrency=12, start_date=None, queue_=None, keyword_concurrency=None):
         super().__init__(keywords, concurrency, queue_, keyword_concurrency=keyword_concurrency)
         self.base_url = "bisnis.com"
@@ -213,6 +215,7 @@ class BisnisScraper(BaseScraper):
 
     async def fetch_latest_results(self):
         """Fetch latest articles using Playwright to bypass anti-bot."""
+        from playwright.async_api import async_playwright
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
             try:
@@ -5,8 +5,6 @@ import re
 from urllib.parse import quote, urljoin
 
 from bs4 import BeautifulSoup
-from playwright.async_api import TimeoutError as PlaywrightTimeoutError
-from playwright.async_api import async_playwright
 
 from .basescraper import BaseScraper
 
@@ -47,6 +45,8 @@ class DDTCNewsScraper(BaseScraper):
 
     async def fetch_search_results(self, keyword):
         """Render client-side results and expand bounded pagination."""
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+        from playwright.async_api import async_playwright
         async with async_playwright() as playwright:
             browser = await playwright.chromium.launch(headless=True)
             try:
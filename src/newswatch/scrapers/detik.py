@@ -7,7 +7,9 @@ last day or so. When a start date is given the index walk is used, because the
 sitemaps cannot answer for anything older.
 
 Set ``NEWSWATCH_DETIK_INDEX_NEWEST=YYYY-MM-DD`` to start the walk at a day
-other than today, so a long backfill can be resumed in chunks.
+other than today, so a long backfill can be resumed in chunks. A run started
+with ``--checkpoint`` journals each finished day instead, and ``--resume``
+skips them.
 """
 
 import asyncio
@@ -27,6 +29,9 @@ class DetikScraper(BaseScraper):
     MAX_INDEX_PAGES_PER_DAY = 50
     INDEX_CHUNK = 10
     MAX_INDEX_DAYS = 800
+    # the index walk reads one-day windows, this many days at once
+    WINDOW_DAYS = 1
+    WINDOW_CONCURRENCY = 4
 
     def __init__(self, keywords, concurrency=5, start_date=None, queue_=None):
         super().__init__(keywords, concurrency, queue_)
@@ -51,6 +56,8 @@ class DetikScraper(BaseScraper):
         # long backfill that dies partway has to restart from today. Naming
         # the newest day makes it resumable in chunks.
         self.index_newest_day = self._env_day("NEWSWATCH_DETIK_INDEX_NEWEST")
+        # channel-days that hit MAX_INDEX_PAGES_PER_DAY, per keyword walked
+        self._truncated_days = {}
 
     @staticmethod
     def _env_day(name):
@@ -77,8 +84,11 @@ class DetikScraper(BaseScraper):
         to avoid fetching every article detik published (~500/day). That is
         the same field the corpus relevance gate reads, so nothing survives
         the filter here that would survive downstream.
+
+        Each day is a one-day window of BaseScraper's window walk, so several
+        days are read at once and a ``--checkpoint`` run resumes per day;
+        ``fetch_window`` fans a day out over the index hosts.
         """
-        needle = " ".join(keyword.lower().split())
         today = self.index_newest_day or datetime.now().date()
         oldest = self.start_date.date()
         span = (today - oldest).days + 1
@@ -92,44 +102,11 @@ class DetikScraper(BaseScraper):
                 keyword,
             )
 
-        matched = 0
-        seen = set()
-        truncated_days = 0
-        day = today
-        while day >= oldest:
-            stamp = day.strftime("%m/%d/%Y")
-            for host in self.INDEX_HOSTS:
-                page = 1
-                while page <= self.MAX_INDEX_PAGES_PER_DAY:
-                    # 573 days x 3 channels is far too many round trips to walk
-                    # one page at a time; self.fetch's semaphore still caps the
-                    # real parallelism at the registry concurrency
-                    chunk = range(page, min(page + self.INDEX_CHUNK, self.MAX_INDEX_PAGES_PER_DAY + 1))
-                    results = await asyncio.gather(
-                        *(
-                            self._fetch_index_page(host, stamp, n)
-                            for n in chunk
-                        )
-                    )
-                    hits = 0
-                    for cards, entries in results:
-                        if not cards:
-                            continue
-                        hits += 1
-                        for link, title in entries:
-                            if link in seen:
-                                continue
-                            seen.add(link)
-                            if needle in " ".join(title.lower().split()):
-                                matched += 1
-                                await self.get_article(link, keyword)
-                    if not hits:
-                        break
-                    page = chunk.stop
-                else:
-                    truncated_days += 1
-            day -= timedelta(days=1)
-
+        self._truncated_days[keyword] = 0
+        try:
+            await self._walk_windows(keyword, oldest, today)
+        finally:
+            truncated_days = self._truncated_days.pop(keyword)
         if truncated_days:
             logging.warning(
                 "Detik index hit the %d-page cap on %d channel-days for "
@@ -138,8 +115,66 @@ class DetikScraper(BaseScraper):
                 truncated_days,
                 keyword,
             )
-        if not matched:
-            logging.info(f"No news found on {self.base_url} for keyword: '{keyword}'")
+
+    async def fetch_window(self, keyword, window):
+        """Read one day's index on every host at once; True if a headline matched."""
+        day = window[0]
+        articles = []
+        try:
+            matched = await asyncio.gather(
+                *(
+                    self._walk_index_host(keyword, host, day, articles)
+                    for host in self.INDEX_HOSTS
+                )
+            )
+            await asyncio.gather(*articles)
+        except BaseException:
+            for task in articles:
+                task.cancel()
+            raise
+        return any(matched)
+
+    async def _walk_index_host(self, keyword, host, day, articles):
+        """Page through one host's index for ``day``.
+
+        Matched articles are fetched in tasks appended to ``articles`` while
+        the next chunk of index pages is requested. Returns True if any
+        headline matched.
+        """
+        needle = " ".join(keyword.lower().split())
+        stamp = day.strftime("%m/%d/%Y")
+        matched = False
+        page = 1
+        while page <= self.MAX_INDEX_PAGES_PER_DAY:
+            # 573 days x 3 channels is far too many round trips to walk
+            # one page at a time; self.fetch's semaphore still caps the
+            # real parallelism at the registry concurrency
+            chunk = range(page, min(page + self.INDEX_CHUNK, self.MAX_INDEX_PAGES_PER_DAY + 1))
+            results = await asyncio.gather(
+                *(self._fetch_index_page(host, stamp, n) for n in chunk)
+            )
+            hits = 0
+            links = []
+            for cards, entries in results:
+                if not cards:
+                    continue
+                hits += 1
+                links.extend(
+                    link
+                    for link, title in entries
+                    if needle in " ".join(title.lower().split())
+                )
+            if links:
+                matched = True
+                links = self._new_links(list(dict.fromkeys(links)), keyword)
+                if links:
+                    articles.append(asyncio.create_task(self._fetch_articles(links, keyword)))
+            if not hits:
+                break
+            page = chunk.stop
+        else:
+            self._truncated_days[keyword] += 1
+        return matched
 
     async def _fetch_index_page(self, host, stamp, page):
         url = f"https://{host}.detik.com/indeks?page={page}&date={stamp}"
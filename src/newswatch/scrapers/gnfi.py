@@ -22,6 +22,7 @@ from urllib.parse import quote, urljoin
 
 from bs4 import BeautifulSoup
 
+from ..pagemeta import page_metadata
 from .basescraper import BaseScraper
 
 
@@ -91,27 +92,36 @@ class GNFIScraper(BaseScraper):
             logging.warning("GNFI empty article body: %s", link)
             return
 
-        soup = BeautifulSoup(response_text, "html.parser")
-
-        title = self._extract_title(soup)
-        if not title:
+        # head metadata first: an article before start_date is dropped, and
+        # one whose JSON-LD carries everything is taken, without a soup
+        meta = page_metadata(response_text)
+        publish_date = self._fast_date(meta)
+        if publish_date and self.start_date and publish_date < self.start_date:
+            self.continue_scraping = False
             return
 
-        publish_date = self._extract_date(soup)
-        if not publish_date:
+        title = meta.tag("og:title")
+        author = meta.tag("author") or meta.author
+        category = meta.section
+        content = meta.body
+        if not (title and publish_date and author and category and content):
+            soup = BeautifulSoup(response_text, "html.parser")
+            title = title or self._extract_title(soup)
+            publish_date = publish_date or self._extract_date(soup)
+            content = content or self._extract_content(soup)
+            author = author or self._extract_author(soup)
+            category = category or self._extract_category(soup)
+
+        if not title or not publish_date:
             return
 
         if self.start_date and publish_date < self.start_date:
             self.continue_scraping = False
             return
 
-        content = self._extract_content(soup)
         if not content:
             return
 
-        author = self._extract_author(soup)
-        category = self._extract_category(soup)
-
         await self.queue_.put({
             "title": title,
             "publish_date": publish_date,
@@ -131,6 +141,13 @@ class GNFIScraper(BaseScraper):
         h1 = soup.select_one("h1")
         return h1.get_text(strip=True) if h1 else ""
 
+    def _fast_date(self, meta):
+        stamp = self._date_from_jsonld(meta.ld)
+        if stamp:
+            return stamp
+        published = meta.tag("article:published_time")
+        return self.parse_date(published) if published else None
+
     def _extract_date(self, soup):
         for script in soup.select('script[type="application/ld+json"]'):
             try:
@@ -18,6 +18,7 @@ import xml.etree.ElementTree as ET
 
 from bs4 import BeautifulSoup
 
+from ..pagemeta import page_metadata, parse_iso_datetime
 from .basescraper import BaseScraper
 
 
@@ -149,22 +150,39 @@ class HukumonlineScraper(BaseScraper):
             logging.warning("Hukumonline no response for %s", link)
             return
 
-        soup = BeautifulSoup(response_text, "html.parser")
-
-        title = self._extract_title(soup)
-        if not title:
+        # head metadata first: an article before start_date is dropped, and
+        # one whose JSON-LD carries everything is taken, without a soup
+        meta = page_metadata(response_text)
+        published = meta.ld.get("datePublished") or meta.ld.get("dateCreated") or meta.tag(
+            "article:published_time"
+        )
+        publish_date = (
+            parse_iso_datetime(published) or self.parse_date(published)
+            if isinstance(published, str)
+            else None
+        )
+        if publish_date and self.start_date and publish_date < self.start_date:
+            self.continue_scraping = False
             return
 
-        publish_date = self._extract_date(soup, link)
-        if not publish_date:
+        title = meta.tag("og:title")
+        author, section = meta.author, meta.section
+        content = meta.body
+        if not (title and publish_date and author and section and content):
+            soup = BeautifulSoup(response_text, "html.parser")
+            title = title or self._extract_title(soup)
+            publish_date = publish_date or self._extract_date(soup, link)
+            if not (author and section):
+                author, section = self._extract_author_section(soup)
+            content = content or self._extract_content(soup)
+
+        if not title or not publish_date:
             return
 
         if self.start_date and publish_date < self.start_date:
             self.continue_scraping = False
             return
 
-        author, section = self._extract_author_section(soup)
-        content = self._extract_content(soup)
         if not content:
             return
 
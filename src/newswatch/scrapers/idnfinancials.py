@@ -22,6 +22,7 @@ from urllib.parse import quote, urljoin
 from bs4 import BeautifulSoup
 
 from ..timeutils import to_project_naive
+from ..pagemeta import page_metadata
 from .basescraper import BaseScraper
 
 # Task-local current keyword: each concurrent `fetch_search_results`
@@ -214,32 +215,50 @@ class IDNFinancialsScraper(BaseScraper):
             logging.warning("IDNFinancials no response for %s", link)
             return
 
-        soup = BeautifulSoup(response_text, "html.parser")
+        # head metadata first: an article before start_date is dropped, and
+        # one whose JSON-LD carries everything is taken, without a soup
+        meta = page_metadata(response_text)
+        publish_date = _parse_iso_datetime(
+            meta.tag("article:published_time", "og:article:published_time", "datepublished")
+        ) or self._date_from_jsonld(meta.ld)
+        if publish_date and self.start_date and publish_date < self.start_date:
+            self.continue_scraping = False
+            return
+
+        title = meta.tag("og:title")
+        author = meta.author
+        if author.startswith("http"):
+            author = ""
+        category = meta.tag("article:section")
+        body = meta.body
+        soup = None
+        if not (title and publish_date and author and category and body):
+            soup = BeautifulSoup(response_text, "html.parser")
 
         # ---- title (required) ----
-        title = ""
-        for sel in TITLE_SELECTORS:
-            el = soup.select_one(sel)
-            if not el:
-                continue
-            if el.name == "meta":
-                title = el.get("content", "").strip()
-            else:
-                title = el.get_text(strip=True)
-            if title:
-                break
+        if not title:
+            for sel in TITLE_SELECTORS:
+                el = soup.select_one(sel)
+                if not el:
+                    continue
+                if el.name == "meta":
+                    title = el.get("content", "").strip()
+                else:
+                    title = el.get_text(strip=True)
+                if title:
+                    break
         if not title:
             logging.error("IDNFinancials title not found | url: %s", link)
             return
 
         # ---- date (authoritative meta first, then JSON-LD) ----
-        publish_date = None
-        for sel in PUBLISHED_META_SELECTORS:
-            meta = soup.select_one(sel)
-            if meta and meta.get("content"):
-                publish_date = _parse_iso_datetime(meta["content"])
-                if publish_date:
-                    break
+        if publish_date is None:
+            for sel in PUBLISHED_META_SELECTORS:
+                meta_tag = soup.select_one(sel)
+                if meta_tag and meta_tag.get("content"):
+                    publish_date = _parse_iso_datetime(meta_tag["content"])
+                    if publish_date:
+                        break
 
         if publish_date is None:
             for script in soup.find_all("script", type="application/ld+json"):
@@ -269,15 +288,18 @@ class IDNFinancialsScraper(BaseScraper):
             return
 
         # ---- author ----
-        author = self._extract_author(soup)
+        if not author:
+            author = self._extract_author(soup)
         if not author:
             author = "Unknown"
 
         # ---- category ----
-        category = self._extract_category(soup, link)
+        if not category:
+            category = self._extract_category(soup, link)
 
         # ---- body ----
-        body = self._extract_body(soup)
+        if not body:
+            body = self._extract_body(soup)
         if not body:
             logging.warning("IDNFinancials empty body | url: %s", link)
             return
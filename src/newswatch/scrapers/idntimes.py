@@ -10,7 +10,6 @@ import logging
 import re
 
 import aiohttp
-from playwright.async_api import async_playwright
 
 from .basescraper import BaseScraper
 from ..utils import keyword_url_slug
@@ -26,6 +25,7 @@ class IDNTimesScraper(BaseScraper):
 
     async def fetch_search_results(self, keyword):
         """Render the tag page and read its tag-named sections."""
+        from playwright.async_api import async_playwright
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
             try:
@@ -173,6 +173,7 @@ class IDNTimesScraper(BaseScraper):
     async def build_latest_url(self, page):
         if page > 1:
             return None
+        from playwright.async_api import async_playwright
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
             try:
@@ -10,7 +10,6 @@ import logging
 import re
 
 import aiohttp
-from playwright.async_api import async_playwright
 
 from .basescraper import BaseScraper
 
@@ -28,6 +27,7 @@ class JakartaPostScraper(BaseScraper):
 
     async def fetch_search_results(self, keyword):
         """Use Playwright to capture Google CSE search results with pagination."""
+        from playwright.async_api import async_playwright
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
             try:
@@ -228,6 +228,7 @@ class JakartaPostScraper(BaseScraper):
     async def build_latest_url(self, page):
         if page > 1:
             return None
+        from playwright.async_api import async_playwright
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
             try:
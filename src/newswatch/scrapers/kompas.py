@@ -1,6 +1,5 @@
 import logging
 import re
-from datetime import date, timedelta
 
 from bs4 import BeautifulSoup
 
@@ -27,8 +26,10 @@ class KompasScraper(BaseScraper):
     # sort, so one query can never reach further back than about 700 articles.
     # The endpoint does honour start_date/end_date, so the walk is a sequence of
     # date windows narrow enough that each one fits under the cap.
+    # BaseScraper walks the windows, several at once.
     PAGES_PER_WINDOW = 38
     WINDOW_DAYS = 7
+    PREFETCH_PAGES = 2
 
     def __init__(self, keywords, concurrency=12, start_date=None, queue_=None):
         super().__init__(keywords, concurrency, queue_)
@@ -47,33 +48,6 @@ class KompasScraper(BaseScraper):
             },
         )
 
-    async def fetch_search_results(self, keyword):
-        """Walk the archive one date window at a time, newest first."""
-        if not self.start_date:
-            return await super().fetch_search_results(keyword)
-
-        self._reset_pagination()
-        floor = self.start_date.date()
-        end = self.end_datetime.date() if self.end_datetime else date.today()
-        found = False
-
-        while end >= floor:
-            start = max(floor, end - timedelta(days=self.WINDOW_DAYS - 1))
-            for page in range(1, self.PAGES_PER_WINDOW + 1):
-                text = await self.build_search_url(keyword, page, (start, end))
-                if not text:
-                    break
-                links = self.parse_article_links(text)
-                if not links:
-                    break
-                found = True
-                if not await self.process_page(links, keyword):
-                    break
-            end = start - timedelta(days=1)
-
-        if not found:
-            logging.info(f"No news found on {self.base_url} for keyword: '{keyword}'")
-
     async def build_latest_url(self, page):
         return await self.fetch(
             f"https://indeks.kompas.com/?page={page}",
@@ -9,7 +9,6 @@ import logging
 import re
 
 import aiohttp
-from playwright.async_api import async_playwright
 
 from .basescraper import BaseScraper
 from ..utils import keyword_url_slug
@@ -27,6 +26,7 @@ class Liputan6Scraper(BaseScraper):
 
     async def fetch_search_results(self, keyword):
         """Render the tag page and read its listing container."""
+        from playwright.async_api import async_playwright
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
             try:
@@ -171,6 +171,7 @@ class Liputan6Scraper(BaseScraper):
     async def build_latest_url(self, page):
         if page > 1:
             return None
+        from playwright.async_api import async_playwright
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
             try:
@@ -203,6 +203,9 @@ class NBCNewsScraper(BaseScraper):
         for year, month in self._months():
             if not self.continue_scraping:
                 break
+            unit = f"month:{year}-{month:02d}"
+            if self._unit_done(keyword, unit):
+                continue
             response_text = await self.fetch(
                 self.archive_url(year, month), headers=self.headers, timeout=45
             )
@@ -211,6 +214,7 @@ class NBCNewsScraper(BaseScraper):
 
             links = self._select(self.parse_archive_entries(response_text), tokens)
             if not links:
+                self._finish_unit(keyword, unit)
                 continue
 
             found_any = True
@@ -218,7 +222,9 @@ class NBCNewsScraper(BaseScraper):
             links = links[:remaining]
             collected += len(links)
 
-            if not await self.process_page(links, keyword):
+            in_window = await self.process_page(links, keyword)
+            self._finish_unit(keyword, unit)
+            if not in_window:
                 break
             if collected >= self.MAX_ARTICLES_PER_QUERY:
                 logging.warning(
@@ -19,10 +19,12 @@ import json
 import logging
 import re
 import xml.etree.ElementTree as ET
+from datetime import datetime
 from urllib.parse import urlparse
 
 from bs4 import BeautifulSoup
 
+from ..timeutils import to_project_naive
 from .basescraper import BaseScraper
 
 _SM_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
@@ -77,6 +79,15 @@ def _to_naive(value):
     return value
 
 
+def _listed(link, date_text):
+    """``(link, publication date)`` for BaseScraper's date cutoff, or the bare
+    link when the sitemap gives no usable date."""
+    try:
+        return link, to_project_naive(datetime.fromisoformat(date_text))
+    except (TypeError, ValueError):
+        return link
+
+
 def _canonical_article_url(url):
     """Normalize same-site article URLs and reject non-article surfaces."""
     if not isinstance(url, str) or not url.strip():
@@ -209,7 +220,7 @@ class NTVNewsScraper(BaseScraper):
         tokens = _keyword_tokens(self._current_keyword)
         links = []
         seen = set()
-        for loc, title, _date in entries:
+        for loc, title, date_text in entries:
             canonical = _canonical_article_url(loc)
             if not canonical:
                 continue
@@ -217,7 +228,7 @@ class NTVNewsScraper(BaseScraper):
             if not _matches_all_tokens(haystack, tokens):
                 continue
             if canonical not in seen:
-                links.append(canonical)
+                links.append(_listed(canonical, date_text))
                 seen.add(canonical)
             if len(links) >= self.MAX_ARTICLES_PER_QUERY:
                 break
@@ -241,12 +252,12 @@ class NTVNewsScraper(BaseScraper):
 
         links = []
         seen = set()
-        for loc, _title, _date in entries:
+        for loc, _title, date_text in entries:
             canonical = _canonical_article_url(loc)
             if not canonical:
                 continue
             if canonical not in seen:
-                links.append(canonical)
+                links.append(_listed(canonical, date_text))
                 seen.add(canonical)
         return links or None
 
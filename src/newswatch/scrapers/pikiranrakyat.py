@@ -10,7 +10,6 @@ import logging
 import re
 
 import aiohttp
-from playwright.async_api import async_playwright
 
 from .basescraper import BaseScraper
 
@@ -28,6 +27,7 @@ class PikiranRakyatScraper(BaseScraper):
 
     async def fetch_search_results(self, keyword):
         """Use Playwright to pass Cloudflare, then extract CSE results."""
+        from playwright.async_api import async_playwright
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
             try:
@@ -200,6 +200,7 @@ class PikiranRakyatScraper(BaseScraper):
     async def build_latest_url(self, page):
         if page > 1:
             return None
+        from playwright.async_api import async_playwright
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
             try:
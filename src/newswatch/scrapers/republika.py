@@ -9,7 +9,6 @@ import logging
 import re
 
 import aiohttp
-from playwright.async_api import async_playwright
 
 from .basescraper import BaseScraper
 from ..utils import keyword_url_slug
@@ -25,6 +24,7 @@ class RepublikaScraper(BaseScraper):
 
     async def fetch_search_results(self, keyword):
         """Use Playwright to render tag page, filter by keyword in URL."""
+        from playwright.async_api import async_playwright
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
             try:
@@ -157,6 +157,7 @@ class RepublikaScraper(BaseScraper):
     async def build_latest_url(self, page):
         if page > 1:
             return None
+        from playwright.async_api import async_playwright
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
             try:
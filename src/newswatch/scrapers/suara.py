@@ -17,10 +17,8 @@ from typing import Optional
 from urllib.parse import quote
 
 from bs4 import BeautifulSoup, Tag
-from playwright.async_api import Error as PlaywrightError
-from playwright.async_api import TimeoutError as PlaywrightTimeoutError
-from playwright.async_api import async_playwright
 
+from ..pagemeta import page_metadata, parse_iso_datetime
 from .basescraper import BaseScraper
 
 
@@ -42,6 +40,9 @@ class SuaraScraper(BaseScraper):
     async def fetch_search_results(self, keyword):
         """Render the search page and harvest dated Suara article anchors."""
         url = f"{self.base_url}/search?q={quote(keyword, safe='')}"
+        from playwright.async_api import Error as PlaywrightError
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+        from playwright.async_api import async_playwright
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
             try:
@@ -83,14 +84,37 @@ class SuaraScraper(BaseScraper):
         if not response_text:
             return
 
-        soup = self._get_soup(response_text)
         try:
-            title = self._extract_title(soup)
+            # head metadata first: an article before start_date is dropped, and
+            # one whose JSON-LD carries everything is taken, without a soup
+            meta = page_metadata(response_text)
+            publish_date_str = meta.ld.get("datePublished")
+            if not isinstance(publish_date_str, str):
+                publish_date_str = ""
+            publish_date = parse_iso_datetime(publish_date_str) or (
+                self.parse_date(publish_date_str, locales=["id"]) if publish_date_str else None
+            )
+            if publish_date and self.start_date and publish_date < self.start_date:
+                self.continue_scraping = False
+                return
+
+            title = meta.tag("og:title")
+            author = meta.author
+            content = meta.body
+            if not (title and publish_date and author and content):
+                soup = self._get_soup(response_text)
+                title = title or self._extract_title(soup)
+                if not publish_date:
+                    publish_date_str = self._extract_date_text(soup)
+                    publish_date = (
+                        self.parse_date(publish_date_str, locales=["id"]) if publish_date_str else None
+                    )
+                author = author or self._extract_author(soup)
+                content = content or self._extract_content(soup)
+
             if not title:
                 return
 
-            publish_date_str = self._extract_date_text(soup)
-            publish_date = self.parse_date(publish_date_str, locales=["id"]) if publish_date_str else None
             if not publish_date:
                 logging.debug(
                     "Suara date parse failed | url: %s | date: %r",
@@ -103,12 +127,11 @@ class SuaraScraper(BaseScraper):
                 self.continue_scraping = False
                 return
 
-            content = self._extract_content(soup)
             if not content:
                 return
 
             category = self._category_from_url(link)
-            author = self._extract_author(soup) or "Unknown"
+            author = author or "Unknown"
 
             item = {
                 "title": title,
@@ -284,6 +307,7 @@ class SuaraScraper(BaseScraper):
     async def build_latest_url(self, page):
         if page > 1:
             return None
+        from playwright.async_api import async_playwright
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
             try:
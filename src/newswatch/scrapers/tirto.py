@@ -9,8 +9,6 @@ import json
 import logging
 import re
 
-from playwright.async_api import async_playwright
-
 from .basescraper import BaseScraper
 
 
@@ -24,6 +22,7 @@ class TirtoScraper(BaseScraper):
 
     async def fetch_search_results(self, keyword):
         """Use Playwright: pass Cloudflare, capture CSE, fetch articles."""
+        from playwright.async_api import async_playwright
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
             try:
@@ -133,6 +132,7 @@ class TirtoScraper(BaseScraper):
 
     async def fetch_latest_results(self):
         """Override to handle latest extraction entirely in one browser session."""
+        from playwright.async_api import async_playwright
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
             try:
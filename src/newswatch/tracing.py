@@ -0,0 +1,252 @@
+"""Lightweight tracing spans for the fetch/parse/queue/write pipeline.
+
+A minimal in-house tracer with an OpenTelemetry-shaped API: a span has a
+name, a start and end, a parent and attributes, and the active span follows
+the asyncio context, so an article task's spans hang under the listing page
+that spawned it. Tracing is off unless ``recording()`` installed a tracer;
+with none installed ``span()`` returns a shared no-op, so the instrumentation
+left in hot paths costs a global lookup.
+
+Finished spans export to JSONL (one span per line) or to a Chrome
+trace-event file that Perfetto and chrome://tracing open directly. Each
+asyncio task gets its own track; queue waits, which overlap freely, are
+emitted as async slices.
+
+    with tracing.recording("run.trace.json"):
+        scrape("ihsg", "2026-01-01")
+"""
+
+import asyncio
+import contextvars
+import itertools
+import json
+import threading
+import time
+import uuid
+import weakref
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+
+_current_span = contextvars.ContextVar("newswatch_current_span", default=None)
+_active_tracer = None
+
+
+class Span:
+    """One timed operation. Use as a context manager to make it current."""
+
+    __slots__ = (
+        "tracer", "name", "span_id", "parent_id", "start_ns", "end_ns",
+        "attributes", "track", "asynchronous", "_token",
+    )
+
+    def __init__(self, tracer, name, span_id, parent_id, start_ns, attributes,
+                 track, asynchronous=False):
+        self.tracer = tracer
+        self.name = name
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.start_ns = start_ns
+        self.end_ns = None
+        self.attributes = attributes
+        self.track = track
+        self.asynchronous = asynchronous
+        self._token = None
+
+    def set_attribute(self, key, value) -> None:
+        self.attributes[key] = value
+
+    def end(self, end_ns=None) -> None:
+        if self.end_ns is None:
+            self.end_ns = self.tracer.now_ns() if end_ns is None else end_ns
+            self.tracer.spans.append(self)
+
+    def __enter__(self):
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+        _current_span.reset(self._token)
+        self.end()
+        return False
+
+
+class _NoopSpan:
+    """Stand-in returned while tracing is off."""
+
+    __slots__ = ()
+    span_id = None
+
+    def set_attribute(self, key, value) -> None:
+        pass
+
+    def end(self, end_ns=None) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    """Collects finished spans for one run and exports them."""
+
+    def __init__(self):
+        self.trace_id = uuid.uuid4().hex
+        self.spans = []
+        self._ids = itertools.count(1)
+        self._epoch = datetime.now()
+        self._origin_ns = time.perf_counter_ns()
+        self._lock = threading.Lock()
+        self._task_tracks = weakref.WeakKeyDictionary()
+        self._track_names = {0: "main"}
+
+    def now_ns(self) -> int:
+        """Nanoseconds since the tracer was created."""
+        return time.perf_counter_ns() - self._origin_ns
+
+    def _track(self, attributes) -> int:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        if task is None:
+            return 0
+        track = self._task_tracks.get(task)
+        if track is None:
+            with self._lock:
+                track = len(self._track_names)
+                source = attributes.get("source")
+                name = task.get_name()
+                self._track_names[track] = f"{source} {name}" if source else name
+                self._task_tracks[task] = track
+        return track
+
+    def start_span(self, name, **attributes) -> Span:
+        """Start a span under the current one; end it or use it in ``with``."""
+        parent = _current_span.get()
+        return Span(
+            self, name, next(self._ids),
+            parent.span_id if parent is not None else None,
+            self.now_ns(), attributes, self._track(attributes),
+        )
+
+    def record(self, name, start_ns, end_ns=None, parent_id=None, **attributes) -> Span:
+        """Record an already-finished span, e.g. a wait measured after the fact."""
+        span = Span(
+            self, name, next(self._ids), parent_id, start_ns, attributes,
+            track=None, asynchronous=True,
+        )
+        span.end(end_ns)
+        return span
+
+    # ── Export ───────────────────────────────────────────────────────────
+
+    def export(self, path) -> None:
+        """Write spans to ``path``: JSONL for ``.jsonl``, else Chrome trace JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix.lower() == ".jsonl":
+            self.export_jsonl(path)
+        else:
+            self.export_chrome(path)
+
+    def export_jsonl(self, path) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            for span in sorted(self.spans, key=lambda s: s.start_ns):
+                record = {
+                    "trace_id": self.trace_id,
+                    "span_id": span.span_id,
+                    "parent_id": span.parent_id,
+                    "name": span.name,
+                    "start": (self._epoch + timedelta(microseconds=span.start_ns / 1000)).isoformat(),
+                    "duration_ms": round((span.end_ns - span.start_ns) / 1e6, 3),
+                    "track": self._track_names.get(span.track, "async"),
+                    "attributes": span.attributes,
+                }
+                f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+
+    def export_chrome(self, path) -> None:
+        events = [
+            {"name": "process_name", "ph": "M", "pid": 1, "tid": 0,
+             "args": {"name": "newswatch"}},
+        ]
+        events.extend(
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": track,
+             "args": {"name": name}}
+            for track, name in self._track_names.items()
+        )
+        for span in self.spans:
+            args = {**span.attributes, "span_id": span.span_id, "parent_id": span.parent_id}
+            start_us = span.start_ns / 1000
+            if span.asynchronous:
+                common = {"name": span.name, "cat": "newswatch", "id": span.span_id,
+                          "pid": 1, "tid": 0}
+                events.append({**common, "ph": "b", "ts": start_us, "args": args})
+                events.append({**common, "ph": "e", "ts": span.end_ns / 1000})
+            else:
+                events.append({
+                    "name": span.name, "cat": "newswatch", "ph": "X",
+                    "ts": start_us, "dur": (span.end_ns - span.start_ns) / 1000,
+                    "pid": 1, "tid": span.track, "args": args,
+                })
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"traceEvents": events, "displayTimeUnit": "ms",
+                 "otherData": {"trace_id": self.trace_id}},
+                f, ensure_ascii=False, default=str,
+            )
+
+
+def get_tracer() -> Tracer | None:
+    """The installed tracer, or None when tracing is off."""
+    return _active_tracer
+
+
+def span(name, **attributes):
+    """Start a span under the current one (a no-op while tracing is off).
+
+    Use as ``with span("fetch", url=url) as s: ...``.
+    """
+    tracer = _active_tracer
+    if tracer is None:
+        return NOOP_SPAN
+    return tracer.start_span(name, **attributes)
+
+
+def current_span():
+    """The span active in this context, or the no-op span."""
+    return _current_span.get() or NOOP_SPAN
+
+
+@contextmanager
+def recording(path=None):
+    """Install a tracer for the duration of the block.
+
+    Spans from every thread and event loop go to the same tracer. When
+    ``path`` is given the trace is written there on exit (``.jsonl`` for
+    JSONL, anything else for Chrome trace-event JSON).
+
+    Args:
+        path: export file, or None to keep the spans only in memory.
+
+    Yields:
+        The Tracer collecting the spans.
+    """
+    global _active_tracer
+    previous = _active_tracer
+    tracer = Tracer()
+    _active_tracer = tracer
+    try:
+        yield tracer
+    finally:
+        _active_tracer = previous
+        if path is not None:
+            tracer.export(path)
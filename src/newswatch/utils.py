@@ -1,8 +1,32 @@
 import asyncio
+import contextvars
 import logging
+import math
+import time
+import weakref
+from types import SimpleNamespace
+
 import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from . import archive, config, metrics, profiling, tracing
+
+# which scraper phase a fetch belongs to; BaseScraper.process_page switches
+# its article tasks to "article", everything else is listing traffic
+fetch_phase = contextvars.ContextVar("newswatch_fetch_phase", default="listing")
 
-from . import config
+# a coroutine step that holds the event loop this long is a slow step
+# (asyncio's own debug-mode slow_callback_duration default)
+SLOW_STEP_SECONDS = 0.1
+
+
+def nearest_rank_percentile(sorted_values: list, pct: float):
+    """Nearest-rank percentile of an ascending list (None when empty)."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
 
 
 def keyword_url_slug(keyword: str) -> str:
@@ -21,6 +45,13 @@ def keyword_matches_url(keyword: str, url: str) -> bool:
 
 
 async def _rnet_get(url: str, headers: dict | None, timeout: int, proxy: str | None = None) -> str | None:
+    with tracing.span("fallback.rnet", url=url) as span:
+        text = await _rnet_get_text(url, headers, timeout, proxy)
+        span.set_attribute("ok", text is not None)
+        return text
+
+
+async def _rnet_get_text(url, headers, timeout, proxy):
     try:
         from rnet import Client, Proxy
 
@@ -40,6 +71,13 @@ async def _rnet_get(url: str, headers: dict | None, timeout: int, proxy: str | N
 
 
 async def _playwright_get(url: str, headers: dict | None, timeout: int, proxy: str | None = None) -> str | None:
+    with tracing.span("fallback.playwright", url=url) as span:
+        text = await _playwright_get_text(url, headers, timeout, proxy)
+        span.set_attribute("ok", text is not None)
+        return text
+
+
+async def _playwright_get_text(url, headers, timeout, proxy):
     try:
         from playwright.async_api import async_playwright
 
@@ -111,6 +149,219 @@ def _looks_blocked(text: str) -> bool:
     return any(m in head for m in block_markers)
 
 
+class FetchStats:
+    """Request counters, latencies and phase timings for one scraper.
+
+    Phase seconds are summed over concurrent requests, so they can exceed
+    the wall-clock time of the run. ``parse_cpu_seconds`` is the CPU time
+    scraper tasks spend between awaits -- HTML parsing dominates it,
+    network waits are excluded. ``slow_steps`` maps a phase to
+    [count, total seconds, max seconds] of steps that held the event loop
+    for at least ``SLOW_STEP_SECONDS``.
+    """
+
+    PHASES = ("dns", "connect", "listing", "article", "rnet", "playwright")
+
+    def __init__(self, source: str = ""):
+        self.source = source
+        self.requests = 0
+        self.failed_requests = 0
+        self.retries = 0
+        self.bytes_downloaded = 0
+        self.latencies = []
+        self.fallback_rnet = 0
+        self.fallback_playwright = 0
+        # listing pages requested ahead of need, and those never used
+        self.prefetched_pages = 0
+        self.wasted_prefetches = 0
+        self.phase_seconds = dict.fromkeys(self.PHASES, 0.0)
+        self.parse_cpu_seconds = 0.0
+        self.slow_steps = {}
+
+    def record_slow_step(self, phase: str, seconds: float) -> None:
+        entry = self.slow_steps.setdefault(phase, [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+        entry[2] = max(entry[2], seconds)
+
+    def record_request(self, seconds: float, nbytes: int = 0, ok: bool = True) -> None:
+        """Record one aiohttp request attempt against the current phase."""
+        self.requests += 1
+        if not ok:
+            self.failed_requests += 1
+        self.bytes_downloaded += nbytes
+        self.latencies.append(seconds)
+        self.phase_seconds[fetch_phase.get()] += seconds
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """aiohttp tracing hooks that add DNS and connect time to the phases."""
+
+        def _timer(phase):
+            async def on_start(session, ctx, params):
+                setattr(ctx, f"{phase}_started", time.perf_counter())
+
+            async def on_end(session, ctx, params):
+                started = getattr(ctx, f"{phase}_started", None)
+                if started is not None:
+                    self.phase_seconds[phase] += time.perf_counter() - started
+
+            return on_start, on_end
+
+        trace = aiohttp.TraceConfig(trace_config_ctx_factory=SimpleNamespace)
+        dns_start, dns_end = _timer("dns")
+        connect_start, connect_end = _timer("connect")
+        trace.on_dns_resolvehost_start.append(dns_start)
+        trace.on_dns_resolvehost_end.append(dns_end)
+        trace.on_connection_create_start.append(connect_start)
+        trace.on_connection_create_end.append(connect_end)
+        return trace
+
+    def summary(self) -> dict:
+        """Flat columns for a health record."""
+        latencies = sorted(self.latencies)
+
+        def _ms(value):
+            return None if value is None else round(value * 1000, 1)
+
+        record = {
+            "requests": self.requests,
+            "failed_requests": self.failed_requests,
+            "retries": self.retries,
+            "bytes_downloaded": self.bytes_downloaded,
+            "latency_p50_ms": _ms(nearest_rank_percentile(latencies, 50)),
+            "latency_p95_ms": _ms(nearest_rank_percentile(latencies, 95)),
+            "latency_max_ms": _ms(latencies[-1] if latencies else None),
+            "fallback_rnet": self.fallback_rnet,
+            "fallback_playwright": self.fallback_playwright,
+            "prefetched_pages": self.prefetched_pages,
+            "wasted_prefetches": self.wasted_prefetches,
+        }
+        for phase in self.PHASES:
+            record[f"{phase}_seconds"] = round(self.phase_seconds[phase], 6)
+        record["parse_cpu_seconds"] = round(self.parse_cpu_seconds, 6)
+        slow = self.slow_steps.values()
+        record["slow_steps"] = sum(count for count, _, _ in slow)
+        record["slow_step_seconds"] = round(sum(total for _, total, _ in slow), 3)
+        record["slow_step_max_ms"] = round(max((m for _, _, m in slow), default=0.0) * 1000, 1)
+        record["slow_step_phase"] = max(
+            self.slow_steps, key=lambda phase: self.slow_steps[phase][1], default=None
+        )
+        return record
+
+
+FETCH_STAT_COLUMNS = tuple(FetchStats().summary())
+
+
+class CpuTimed:
+    """Await a coroutine, adding the CPU time of each of its steps to stats.
+
+    Only the time the coroutine itself runs between suspensions is counted,
+    so concurrent tasks on the same loop do not inflate each other. A step
+    that holds the loop for ``SLOW_STEP_SECONDS`` or more is recorded as a
+    slow step of ``phase``. While ``profiling.profile()`` is active, each
+    step also runs under the profile of the scraper that owns ``stats``.
+    """
+
+    def __init__(self, coro, stats: FetchStats, phase: str = "listing"):
+        self._coro = coro
+        self._stats = stats
+        self._phase = phase
+
+    def __await__(self):
+        coro = self._coro
+        stats = self._stats
+        profile = profiling.profiler_for(stats.source)
+        message, error = None, None
+        while True:
+            if profile is not None:
+                previous = profile.resume()
+            started = time.thread_time()
+            wall_started = time.perf_counter()
+            try:
+                if error is None:
+                    yielded = coro.send(message)
+                else:
+                    yielded = coro.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                cpu = time.thread_time() - started
+                held = time.perf_counter() - wall_started
+                if profile is not None:
+                    profile.pause(previous)
+                    profile.record_step(held, cpu)
+                stats.parse_cpu_seconds += cpu
+                if held >= SLOW_STEP_SECONDS:
+                    stats.record_slow_step(self._phase, held)
+            try:
+                message, error = (yield yielded), None
+            except GeneratorExit:
+                coro.close()
+                raise
+            except BaseException as exc:
+                message, error = None, exc
+
+
+def _record_http_metrics(url, status, transport, seconds):
+    host = metrics.host_of(url)
+    metrics.HTTP_REQUESTS.labels(host, status, transport).inc()
+    metrics.HTTP_REQUEST_SECONDS.labels(host, transport).observe(seconds)
+    if status == "blocked":
+        metrics.BLOCKED_PAGES.labels(host, transport).inc()
+
+
+class ArticleQueue(asyncio.Queue):
+    """The scraper-to-writer article queue.
+
+    Each item remembers when it was enqueued, which feeds the queue-wait,
+    queue-depth and writer-lag metrics. While tracing is on it also
+    remembers the span that produced it, and dequeuing records a
+    ``queue.wait`` span -- how long the article sat waiting for the writer.
+    """
+
+    # every queue still referenced, for the render-time depth/lag gauges
+    live = weakref.WeakSet()
+
+    def __init__(self, maxsize=0):
+        super().__init__(maxsize)
+        ArticleQueue.live.add(self)
+        # articles ever put and taken; a checkpoint compares the two to know
+        # when the writer has caught up with a finished unit
+        self.puts = 0
+        self.gets = 0
+
+    def _put(self, item):
+        if item is not None:
+            self.puts += 1
+            metrics.ARTICLES_EMITTED.labels(str(item.get("source") or "")).inc()
+        tracer = tracing.get_tracer()
+        if tracer is None:
+            self._queue.append((item, time.perf_counter(), None, 0, None))
+        else:
+            self._queue.append(
+                (item, time.perf_counter(), tracer, tracer.now_ns(),
+                 tracing.current_span().span_id)
+            )
+
+    def _get(self):
+        item, enqueued_at, tracer, enqueued_ns, parent_id = self._queue.popleft()
+        if item is not None:
+            self.gets += 1
+            metrics.QUEUE_WAIT_SECONDS.observe(time.perf_counter() - enqueued_at)
+            if tracer is not None:
+                tracer.record(
+                    "queue.wait", enqueued_ns, parent_id=parent_id, link=item.get("link")
+                )
+        return item
+
+    def oldest_enqueued_at(self):
+        """perf_counter() time the oldest waiting item was enqueued, or None."""
+        for item, enqueued_at, *_ in self._queue:
+            if item is not None:
+                return enqueued_at
+        return None
+
+
 class AsyncScraper:
     def __init__(self, concurrency=12, max_retries=None, keyword_concurrency=None):
         self.semaphore = asyncio.Semaphore(concurrency)
@@ -125,6 +376,7 @@ class AsyncScraper:
         self.session = None
         self.max_retries = max_retries if max_retries is not None else config.get_max_retries()
         self.proxy = config.get_proxy()
+        self.fetch_stats = FetchStats(type(self).__name__)
 
     async def __aenter__(self):
         timeout = aiohttp.ClientTimeout(
@@ -137,6 +389,7 @@ class AsyncScraper:
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
                 "Accept-Language": "id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7",
             },
+            trace_configs=[self.fetch_stats.trace_config()],
         )
         return self
 
@@ -144,53 +397,177 @@ class AsyncScraper:
         if self.session:
             await self.session.close()
 
+    async def _http_text(self, url, method, data, headers, timeout):
+        """One timed aiohttp request; raises like the session does."""
+        replay = archive.get_replay()
+        if replay is not None:
+            return await self._replayed_text(replay, url, method, data)
+        started = time.perf_counter()
+        nbytes = 0
+        ok = False
+        status = "error"
+        text = content_type = None
+        recorder = archive.get_recorder()
+        try:
+            with tracing.span("http", url=url, method=method) as span:
+                if method == "GET":
+                    request = self.session.get(
+                        url, headers=headers, timeout=timeout, proxy=self.proxy
+                    )
+                else:
+                    request = self.session.post(
+                        url, data=data, headers=headers, timeout=timeout, proxy=self.proxy
+                    )
+                async with request as response:
+                    status = str(response.status)
+                    content_type = response.headers.get("Content-Type")
+                    span.set_attribute("status", response.status)
+                    response.raise_for_status()
+                    nbytes = len(await response.read())
+                    text = await response.text()
+                span.set_attribute("bytes", nbytes)
+            ok = True
+            return text
+        except asyncio.TimeoutError:
+            status = "timeout"
+            raise
+        except asyncio.CancelledError:
+            # a cancelled request has no outcome worth archiving
+            recorder = None
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self.fetch_stats.record_request(elapsed, nbytes, ok)
+            _record_http_metrics(url, status, "aiohttp", elapsed)
+            if recorder is not None:
+                recorder.record(
+                    url, method, data, "aiohttp", status, text, elapsed,
+                    content_type, type(self).__name__,
+                )
+
+    async def _replayed_text(self, replay, url, method, data):
+        """Answer a request from the replayed archive, failing as aiohttp would."""
+        record = replay.lookup(url, method, data)
+        delay = replay.delay(record)
+        if delay:
+            await asyncio.sleep(delay)
+        status = record["status"] if record is not None else "missing"
+        ok = status.isdigit() and int(status) < 400
+        text = replay.read_text(record) if ok else None
+        nbytes = len(text.encode("utf-8", "replace")) if text else 0
+        self.fetch_stats.record_request(delay, nbytes, ok)
+        _record_http_metrics(url, status, "replay", delay)
+        if ok:
+            return text or ""
+        if status == "timeout":
+            raise asyncio.TimeoutError()
+        if status.isdigit():
+            request_info = aiohttp.RequestInfo(URL(url), method, CIMultiDictProxy(CIMultiDict()), URL(url))
+            raise aiohttp.ClientResponseError(
+                request_info, (), status=int(status), message="replayed from archive"
+            )
+        if record is None:
+            raise aiohttp.ClientConnectionError(f"{url} is not in the replay archive")
+        raise aiohttp.ClientConnectionError(f"replayed {status} for {url}")
+
+    async def _transport_get(self, transport, getter, url, headers, timeout):
+        """Fetch through a fallback transport, or its archived answer when replaying."""
+        replay = archive.get_replay()
+        if replay is None:
+            return await getter(url, headers, timeout, self.proxy)
+        record = replay.lookup(url, "GET", None, transport)
+        delay = replay.delay(record)
+        if delay:
+            await asyncio.sleep(delay)
+        return replay.read_text(record) if record is not None else None
+
+    async def _backoff(self, seconds):
+        """Wait before a retry; replays without simulated latency do not wait."""
+        replay = archive.get_replay()
+        if replay is None or replay.latency is not None:
+            await asyncio.sleep(seconds)
+
+    async def _fallback_get(self, url, headers, timeout):
+        """Retry a GET through rnet, then Playwright; None if both fail."""
+        merged_headers = dict(self.session.headers)
+        if headers:
+            merged_headers.update(headers)
+        stats = self.fetch_stats
+
+        stats.fallback_rnet += 1
+        started = time.perf_counter()
+        try:
+            rnet_text = await self._transport_get("rnet", _rnet_get, url, merged_headers, timeout)
+        finally:
+            elapsed = time.perf_counter() - started
+            stats.phase_seconds["rnet"] += elapsed
+        blocked = bool(rnet_text) and _looks_blocked(rnet_text)
+        status = "blocked" if blocked else "ok" if rnet_text else "failed"
+        _record_http_metrics(url, status, "rnet", elapsed)
+        self._archive_fallback(url, "rnet", status, rnet_text, elapsed)
+        if rnet_text and not blocked:
+            stats.bytes_downloaded += len(rnet_text.encode("utf-8", "replace"))
+            return rnet_text
+
+        stats.fallback_playwright += 1
+        started = time.perf_counter()
+        try:
+            pw_text = await self._transport_get(
+                "playwright", _playwright_get, url, merged_headers, timeout
+            )
+        finally:
+            elapsed = time.perf_counter() - started
+            stats.phase_seconds["playwright"] += elapsed
+        status = "ok" if pw_text else "failed"
+        _record_http_metrics(url, status, "playwright", elapsed)
+        self._archive_fallback(url, "playwright", status, pw_text, elapsed)
+        if pw_text:
+            stats.bytes_downloaded += len(pw_text.encode("utf-8", "replace"))
+            return pw_text
+        return None
+
+    def _archive_fallback(self, url, transport, status, text, elapsed):
+        recorder = archive.get_recorder()
+        if recorder is not None:
+            recorder.record(
+                url, "GET", None, transport, status, text or None, elapsed,
+                source=type(self).__name__,
+            )
+
+    def _count_retry(self, url):
+        self.fetch_stats.retries += 1
+        metrics.RETRIES.labels(metrics.host_of(url)).inc()
+
     async def fetch(
         self, url, method="GET", data=None, headers=None, retries=0, timeout=30
     ):
+        with tracing.span(
+            "fetch", url=url, method=method, attempt=retries, source=type(self).__name__
+        ) as span:
+            text = await self._fetch(url, method, data, headers, retries, timeout)
+            span.set_attribute("ok", text is not None)
+            return text
+
+    async def _fetch(self, url, method, data, headers, retries, timeout):
         async with self.semaphore:
             try:
                 # Create request-specific timeout
                 request_timeout = aiohttp.ClientTimeout(total=timeout)
 
                 if method == "GET":
-                    async with self.session.get(
-                        url, headers=headers, timeout=request_timeout, proxy=self.proxy
-                    ) as response:
-                        response.raise_for_status()
-                        text = await response.text()
-
-                        if text and _looks_blocked(text):
-                            merged_headers = dict(self.session.headers)
-                            if headers:
-                                merged_headers.update(headers)
-                            rnet_text = await _rnet_get(url, merged_headers, timeout, self.proxy)
-                            if rnet_text and not _looks_blocked(rnet_text):
-                                return rnet_text
-
-                            pw_text = await _playwright_get(
-                                url, merged_headers, timeout, self.proxy
-                            )
-                            if pw_text:
-                                return pw_text
-
-                        return text
+                    text = await self._http_text(url, method, data, headers, request_timeout)
+                    if text and _looks_blocked(text):
+                        metrics.BLOCKED_PAGES.labels(metrics.host_of(url), "aiohttp").inc()
+                        fallback_text = await self._fallback_get(url, headers, timeout)
+                        if fallback_text:
+                            return fallback_text
+                    return text
                 elif method == "POST":
-                    async with self.session.post(
-                        url, data=data, headers=headers, timeout=request_timeout, proxy=self.proxy
-                    ) as response:
-                        response.raise_for_status()
-                        return await response.text()
+                    return await self._http_text(url, method, data, headers, request_timeout)
             except aiohttp.ClientResponseError as e:
                 status = getattr(e, "status", None)
                 if method == "GET" and status in (401, 403, 406, 418):
-                    merged_headers = dict(self.session.headers)
-                    if headers:
-                        merged_headers.update(headers)
-                    rnet_text = await _rnet_get(url, merged_headers, timeout, self.proxy)
-                    if rnet_text and not _looks_blocked(rnet_text):
-                        return rnet_text
-
-                    text = await _playwright_get(url, merged_headers, timeout, self.proxy)
+                    text = await self._fallback_get(url, headers, timeout)
                     if text:
                         return text
                 if status == 429 or status in (
@@ -204,7 +581,8 @@ class AsyncScraper:
                         logging.warning(
                             f"Received status {status}, retry {retries + 1}/{self.max_retries} for {url} in {wait_time}s"
                         )
-                        await asyncio.sleep(wait_time)
+                        self._count_retry(url)
+                        await self._backoff(wait_time)
                         return await self.fetch(
                             url, method, data, headers, retries + 1, timeout
                         )
@@ -212,14 +590,7 @@ class AsyncScraper:
                 return None
             except aiohttp.ClientError as e:
                 if method == "GET":
-                    merged_headers = dict(self.session.headers)
-                    if headers:
-                        merged_headers.update(headers)
-                    rnet_text = await _rnet_get(url, merged_headers, timeout, self.proxy)
-                    if rnet_text and not _looks_blocked(rnet_text):
-                        return rnet_text
-
-                    text = await _playwright_get(url, merged_headers, timeout, self.proxy)
+                    text = await self._fallback_get(url, headers, timeout)
                     if text:
                         return text
                 if retries < self.max_retries:
@@ -227,7 +598,8 @@ class AsyncScraper:
                     logging.warning(
                         f"Retry {retries + 1}/{self.max_retries} for {url} in {wait_time}s"
                     )
-                    await asyncio.sleep(wait_time)
+                    self._count_retry(url)
+                    await self._backoff(wait_time)
                     return await self.fetch(
                         url, method, data, headers, retries + 1, timeout
                     )
@@ -240,7 +612,8 @@ class AsyncScraper:
                     logging.warning(
                         f"Timeout retry {retries + 1}/{self.max_retries} for {url} in {wait_time}s"
                     )
-                    await asyncio.sleep(wait_time)
+                    self._count_retry(url)
+                    await self._backoff(wait_time)
                     return await self.fetch(
                         url, method, data, headers, retries + 1, timeout + 5
                     )
@@ -0,0 +1,397 @@
+"""Long-running latest-mode polling (``--watch``, ``api.watch()``).
+
+Running ``--method latest`` from cron every few minutes pays interpreter
+startup, new HTTP sessions and a fresh pass over every source's latest
+listing on each run, whether or not anything was published since the last
+one. A watch keeps one process and one session per source alive and polls
+each source's latest listing on its own schedule:
+
+- the interval adapts to how often the source publishes. It is set so a
+  poll finds about ``target_new`` new links at the source's recent rate (a
+  moving average), clamped to ``[min_interval, max_interval]``; a poll that
+  finds nothing lengthens it by half. A busy wire such as detik settles
+  near the minimum, a weekly near the maximum.
+- listed links already seen -- earlier in the watch, or in the persistent
+  seen store -- are dropped before their article page is fetched, so a poll
+  of an unchanged listing costs its listing requests and nothing more.
+- new articles stream to the caller as they arrive; the CLI appends them to
+  JSONL files that roll over every hour or day (``RotatingJsonlSink``).
+
+Browser-required sources still launch Chromium per poll, from their own
+``fetch_latest_results``; they share the smaller browser pool as in a
+normal run.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from .dedup import LinkSet
+from .main import get_available_scrapers
+from .registry import get_scraper_by_slug
+from .utils import ArticleQueue, CpuTimed
+
+logger = logging.getLogger(__name__)
+
+ROTATIONS = {"hour": "%Y%m%d_%H", "day": "%Y%m%d"}
+
+
+class PollSchedule:
+    """Adaptive poll interval for one source.
+
+    Args:
+        interval: seconds until the second poll (the first is immediate).
+        min_interval: shortest interval, however busy the source.
+        max_interval: longest interval, however quiet.
+        target_new: new links one poll should find at the source's rate.
+        smoothing: weight of the newest observation in the rate average.
+    """
+
+    def __init__(
+        self,
+        interval: float = 120.0,
+        min_interval: float = 30.0,
+        max_interval: float = 1800.0,
+        target_new: float = 3.0,
+        smoothing: float = 0.3,
+    ):
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("need 0 < min_interval <= max_interval")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target_new = target_new
+        self.smoothing = smoothing
+        self.interval = self._clamp(interval)
+        self.rate = None  # new links per second
+
+    def _clamp(self, seconds: float) -> float:
+        return min(self.max_interval, max(self.min_interval, seconds))
+
+    def update(self, new_links: int, elapsed: float | None) -> float:
+        """Record one poll; returns the seconds to wait before the next.
+
+        Args:
+            new_links: links the poll found that had not been seen.
+            elapsed: seconds since the previous poll started, or None for
+                the first poll -- whatever a listing holds at startup is a
+                backlog, not a publishing rate.
+        """
+        if elapsed is None:
+            return self.interval
+        observed = new_links / max(elapsed, 1e-6)
+        if self.rate is None:
+            self.rate = observed
+        else:
+            self.rate = self.smoothing * observed + (1 - self.smoothing) * self.rate
+        if new_links and self.rate > 0:
+            self.interval = self._clamp(self.target_new / self.rate)
+        else:
+            self.interval = self._clamp(self.interval * 1.5)
+        return self.interval
+
+
+@dataclass
+class SourceState:
+    """What a watch has done for one source so far."""
+
+    slug: str
+    schedule: PollSchedule
+    polls: int = 0
+    errors: int = 0
+    articles: int = 0  # handed to the watch, before cross-source dedup
+    last_new: int = 0
+    last_poll_at: datetime | None = None
+    poll_seconds: list = field(default_factory=list, repr=False)
+
+
+class _CountingQueue:
+    """Stands in for a scraper's queue: forwards items, counting them."""
+
+    def __init__(self, queue: asyncio.Queue, state: SourceState):
+        self.queue = queue
+        self.state = state
+
+    async def put(self, item) -> None:
+        self.state.articles += 1
+        await self.queue.put(item)
+
+
+class Watcher:
+    """Poll the latest listings of a set of sources until stopped.
+
+    Args:
+        scrapers: "auto", "all" or comma-separated slugs (latest-capable).
+        seen_store: a ``SeenLinkStore`` (or anything with ``in``/``add``)
+            consulted before fetching and updated with every emitted link.
+        interval, min_interval, max_interval: see ``PollSchedule``.
+        max_pages: latest listing pages per poll (default: each scraper's own).
+        max_concurrent_scrapers: general pool size; browser-required
+            sources share a pool of at most 2.
+        scraper_timeout: seconds one poll may take (default 180).
+        duration: stop after this many seconds (default: run until closed).
+        max_polls: stop each source after this many polls.
+        progress: print one line per poll.
+        proxy: proxy URL for this watch's requests (default: NEWSWATCH_PROXY).
+    """
+
+    def __init__(
+        self,
+        scrapers: str = "auto",
+        *,
+        seen_store=None,
+        interval: float = 120.0,
+        min_interval: float = 30.0,
+        max_interval: float = 1800.0,
+        max_pages: int | None = None,
+        max_concurrent_scrapers: int = 6,
+        scraper_timeout: float | None = None,
+        duration: float | None = None,
+        max_polls: int | None = None,
+        progress: bool = False,
+        proxy: str | None = None,
+    ):
+        self.scrapers = scrapers
+        self.seen_store = seen_store
+        self.interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_pages = max_pages
+        self.max_concurrent_scrapers = max_concurrent_scrapers
+        self.scraper_timeout = scraper_timeout or 180
+        self.duration = duration
+        self.max_polls = max_polls
+        self.progress = progress
+        self.proxy = proxy
+        self.sources: dict[str, SourceState] = {}
+        # links listed by any source (skipped before fetching) and links
+        # emitted (skipped at output); kept apart because a listed link is
+        # recorded when its poll ends, possibly before its article is read
+        # off the queue
+        self._listed = LinkSet()
+        self._emitted = LinkSet()
+        self._stop = asyncio.Event()
+
+    def stop(self) -> None:
+        """Ask every source to finish its current poll and stop."""
+        self._stop.set()
+
+    def _select(self) -> list[tuple[str, object]]:
+        scraper_classes = get_available_scrapers(method="latest")
+        if self.scrapers.lower() in ("all", "auto"):
+            slugs = list(scraper_classes)
+        else:
+            slugs = [s.strip().lower() for s in self.scrapers.split(",") if s.strip()]
+        selected = []
+        for slug in slugs:
+            info = scraper_classes.get(slug)
+            if not info:
+                logger.warning(f"scraper '{slug}' is not recognized.")
+                continue
+            scraper = info["class"]("latest", **dict(info["params"]))
+            if self.max_pages is not None:
+                scraper.max_latest_pages = self.max_pages
+            scraper.dedup_links = self._listed
+            scraper.seen_store = self.seen_store
+            if self.proxy:
+                scraper.proxy = self.proxy
+            selected.append((slug, scraper))
+        return selected
+
+    async def _poll_source(self, state, scraper, queue, sem):
+        scraper.queue_ = _CountingQueue(queue, state)
+        loop = asyncio.get_running_loop()
+        previous_start = None
+        async with scraper:
+            while not self._stop.is_set():
+                async with sem:
+                    started = loop.time()
+                    before = state.articles
+                    try:
+                        await asyncio.wait_for(
+                            CpuTimed(scraper.fetch_latest_results(), scraper.fetch_stats),
+                            timeout=self.scraper_timeout,
+                        )
+                    except asyncio.TimeoutError:
+                        state.errors += 1
+                        logger.warning(f"{state.slug}: poll timed out after {self.scraper_timeout}s")
+                    except Exception as e:
+                        state.errors += 1
+                        logger.warning(f"{state.slug}: poll failed: {e}")
+                # listed links that yielded no article are not refetched either
+                for link in getattr(scraper, "_pagination_seen", ()):
+                    self._listed.add(link)
+                state.polls += 1
+                state.last_new = state.articles - before
+                state.last_poll_at = datetime.now()
+                state.poll_seconds.append(round(loop.time() - started, 3))
+                delay = state.schedule.update(
+                    state.last_new, None if previous_start is None else started - previous_start
+                )
+                previous_start = started
+                if self.progress:
+                    print(f"[watch] {state.slug}: {state.last_new} new, next poll in {delay:.0f}s")
+                if self.max_polls is not None and state.polls >= self.max_polls:
+                    return
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._stop.wait(), timeout=delay)
+
+    async def articles(self, format_dates: bool = True) -> AsyncIterator[dict]:
+        """Yield each new article as it is collected, until the watch stops.
+
+        Closing the generator stops every source and cancels polls in flight.
+        """
+        queue = ArticleQueue()
+        general_sem = asyncio.Semaphore(self.max_concurrent_scrapers)
+        browser_sem = asyncio.Semaphore(min(2, self.max_concurrent_scrapers))
+        tasks = []
+        for slug, scraper in self._select():
+            state = self.sources[slug] = SourceState(
+                slug, PollSchedule(self.interval, self.min_interval, self.max_interval)
+            )
+            browser = getattr(get_scraper_by_slug(slug), "browser_required", False)
+            tasks.append(asyncio.create_task(
+                self._poll_source(state, scraper, queue, browser_sem if browser else general_sem)
+            ))
+        if not tasks:
+            logger.error("no valid scrapers selected for watch.")
+            return
+
+        async def _finish():
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await queue.put(None)
+
+        finisher = asyncio.create_task(_finish())
+        timer = (
+            asyncio.get_running_loop().call_later(self.duration, self.stop)
+            if self.duration is not None
+            else None
+        )
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                link = item.get("link", "")
+                if link in self._emitted or (self.seen_store is not None and link in self.seen_store):
+                    continue
+                self._emitted.add(link)
+                if self.seen_store is not None:
+                    self.seen_store.add(link)
+                if format_dates and isinstance(item.get("publish_date"), datetime):
+                    item["publish_date"] = item["publish_date"].strftime("%Y-%m-%d %H:%M:%S")
+                yield item
+        finally:
+            if timer is not None:
+                timer.cancel()
+            self.stop()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            finisher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await finisher
+            if self.seen_store is not None and hasattr(self.seen_store, "flush"):
+                self.seen_store.flush()
+
+    def summary_rows(self) -> list[dict]:
+        """Per-source polls, articles and current interval."""
+        return [
+            {
+                "slug": state.slug,
+                "polls": state.polls,
+                "errors": state.errors,
+                "articles": state.articles,
+                "interval_seconds": round(state.schedule.interval),
+            }
+            for state in self.sources.values()
+        ]
+
+
+class RotatingJsonlSink:
+    """Append articles to JSONL files that roll over every hour or day.
+
+    Files are named like the regular JSONL output,
+    ``news-watch-<label>-<YYYYmmdd_HH>.jsonl`` (``<YYYYmmdd>`` for daily
+    rotation), and are appended to, so a restarted watch continues the
+    current period's file. Every line is flushed as it is written.
+    """
+
+    def __init__(self, directory, rotate: str = "hour", label: str = "latest"):
+        if rotate not in ROTATIONS:
+            raise ValueError(f"rotate must be one of {sorted(ROTATIONS)}, not {rotate!r}")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.rotate = rotate
+        self.label = label
+        self.files: list[Path] = []
+        self.written = 0
+        self._path = None
+        self._file = None
+
+    def path_for(self, when: datetime) -> Path:
+        return self.directory / f"news-watch-{self.label}-{when.strftime(ROTATIONS[self.rotate])}.jsonl"
+
+    def write(self, item: dict) -> Path:
+        path = self.path_for(datetime.now())
+        if path != self._path:
+            self.close()
+            self._file = open(path, "a", encoding="utf-8")
+            self._path = path
+            if path not in self.files:
+                self.files.append(path)
+        self._file.write(json.dumps(item, ensure_ascii=False, default=str) + "\n")
+        self._file.flush()
+        self.written += 1
+        return path
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._path = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def watcher_from_args(args, seen_store=None) -> Watcher:
+    """A ``Watcher`` configured from the CLI's ``--watch*`` and run flags."""
+    return Watcher(
+        args.scrapers,
+        seen_store=seen_store,
+        interval=args.watch_interval,
+        min_interval=args.watch_min_interval,
+        max_interval=args.watch_max_interval,
+        max_pages=getattr(args, "max_pages", None),
+        max_concurrent_scrapers=args.max_concurrent_scrapers,
+        scraper_timeout=getattr(args, "scraper_timeout", None),
+        duration=args.watch_duration,
+        progress=getattr(args, "progress", False),
+    )
+
+
+async def run_watch(watcher: Watcher, sink: RotatingJsonlSink) -> None:
+    """Write every article the watch yields to ``sink`` until it stops."""
+    async for item in watcher.articles():
+        sink.write(item)
+
+
+def print_watch_summary(watcher: Watcher, sink: RotatingJsonlSink) -> None:
+    rows = watcher.summary_rows()
+    if rows:
+        print(f"\n{'SOURCE':<18} {'POLLS':>6} {'ERRORS':>6} {'ARTICLES':>8} {'INTERVAL_S':>10}")
+        for row in rows:
+            print(
+                f"{row['slug']:<18} {row['polls']:>6} {row['errors']:>6} "
+                f"{row['articles']:>8} {row['interval_seconds']:>10}"
+            )
+    files = ", ".join(str(p) for p in sink.files) or "-"
+    print(f"Wrote {sink.written} article(s) to {files}")
@@ -0,0 +1,99 @@
+"""Shared fixtures."""
+
+import asyncio
+import re
+from collections import defaultdict
+from datetime import datetime
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from newswatch.scrapers.basescraper import BaseScraper
+
+
+@pytest.fixture
+async def local_site():
+    """Serve canned responses from a local aiohttp server.
+
+    Call the fixture with ``{path: (status, body)}`` or
+    ``{path: [(status, body), ...]}`` (served in turn, last one repeats);
+    it returns the server's base url.
+    """
+    servers = []
+
+    async def _serve(routes):
+        remaining = {
+            path: list(spec) if isinstance(spec, list) else [spec]
+            for path, spec in routes.items()
+        }
+
+        async def handler(request):
+            responses = remaining.get(request.path)
+            if not responses:
+                return web.Response(status=404)
+            status, body = responses.pop(0) if len(responses) > 1 else responses[0]
+            return web.Response(status=status, text=body, content_type="text/html")
+
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", handler)
+        server = TestServer(app)
+        await server.start_server()
+        servers.append(server)
+        return str(server.make_url("")).rstrip("/")
+
+    yield _serve
+    for server in servers:
+        await server.close()
+
+
+class _ListingScraper(BaseScraper):
+    """Lists article slugs under ``base_url`` and records what it touched.
+
+    Search page N serves ``pages[N - 1]``; the latest listing is fetched
+    from ``{base_url}/latest`` as comma-separated slugs. A slug ending in a
+    number is published on that day of October 2026.
+    """
+
+    def __init__(self, keywords="ihsg", pages=(), base_url="https://example.com", **kwargs):
+        kwargs.setdefault("queue_", asyncio.Queue())
+        kwargs.setdefault("max_pages", 10)
+        super().__init__(keywords, **kwargs)
+        self.pages = pages
+        self.base_url = base_url
+        self.listed_pages = defaultdict(list)
+        self.fetched = []
+
+    async def build_search_url(self, keyword, page):
+        self.listed_pages[keyword].append(page)
+        return self.pages[page - 1] if page <= len(self.pages) else None
+
+    def parse_article_links(self, response_text):
+        return [f"{self.base_url}/{slug}" for slug in response_text]
+
+    async def build_latest_url(self, page):
+        return await self.fetch(f"{self.base_url}/latest")
+
+    def parse_latest_article_links(self, response_text):
+        return [f"{self.base_url}/{slug}" for slug in response_text.split(",")]
+
+    async def get_article(self, link, keyword):
+        slug = link.rsplit("/", 1)[-1]
+        self.fetched.append(slug)
+        day = re.search(r"\d+$", slug)
+        await self.queue_.put({
+            "title": slug,
+            "publish_date": datetime(2026, 10, int(day.group())) if day else datetime(2026, 10, 19, 9, 30),
+            "author": "",
+            "content": "",
+            "keyword": keyword,
+            "category": "",
+            "source": "local",
+            "link": link,
+        })
+
+
+@pytest.fixture
+def listing_scraper():
+    """A ``BaseScraper`` over canned listings; see ``_ListingScraper``."""
+    return _ListingScraper
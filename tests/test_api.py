@@ -3,6 +3,10 @@ Tests for the synchronous API module.
 """
 
 import asyncio
+import contextlib
+import os
+import threading
+import time
 from datetime import datetime, timedelta
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -12,6 +16,8 @@ import pytest
 
 import newswatch.api as api_module
 from newswatch.api import (
+    ascrape,
+    iter_scrape,
     latest,
     latest_to_dataframe,
     latest_to_file,
@@ -93,10 +99,10 @@ class TestInputValidation:
 class TestScrapeToDataFrame:
     """Test scrape_to_dataframe functionality."""
 
-    @patch("newswatch.api.scrape")
-    def test_scrape_to_dataframe_empty_results(self, mock_scrape):
+    @patch("newswatch.api._async_scrape_to_columns", new_callable=AsyncMock)
+    def test_scrape_to_dataframe_empty_results(self, mock_async):
         """Test dataframe creation with empty results."""
-        mock_scrape.return_value = []
+        mock_async.return_value = api_module._ArticleColumns()
 
         df = scrape_to_dataframe("test", "2025-01-01")
 
@@ -114,8 +120,8 @@ class TestScrapeToDataFrame:
         ]
         assert list(df.columns) == expected_columns
 
-    @patch("newswatch.api.scrape")
-    def test_scrape_to_dataframe_with_results(self, mock_scrape):
+    @patch("newswatch.api._async_scrape_to_columns", new_callable=AsyncMock)
+    def test_scrape_to_dataframe_with_results(self, mock_async):
         """Test dataframe creation with mock results."""
         mock_results = [
             {
@@ -129,7 +135,7 @@ class TestScrapeToDataFrame:
                 "link": "http://test.com/article1",
             }
         ]
-        mock_scrape.return_value = mock_results
+        mock_async.return_value = api_module._ArticleColumns.from_records(mock_results)
 
         df = scrape_to_dataframe("test", "2025-01-01")
 
@@ -138,6 +144,45 @@ class TestScrapeToDataFrame:
         assert df.loc[0, "title"] == "Test Article"
         assert pd.api.types.is_datetime64_any_dtype(df["publish_date"])
 
+    def test_columns_keep_datetimes_without_string_round_trip(self):
+        from zoneinfo import ZoneInfo
+
+        columns = api_module._ArticleColumns.from_records(
+            [
+                {
+                    "title": "a",
+                    "publish_date": datetime(2025, 1, 1, 12, 0, 0, 500, tzinfo=ZoneInfo("Asia/Jakarta")),
+                    "source": "kompas",
+                    "keyword": "ihsg",
+                    "link": "https://example.com/a",
+                },
+                {
+                    "title": "b",
+                    "publish_date": "2025-01-02 08:30:00",
+                    "source": "kompas",
+                    "keyword": "ihsg",
+                    "link": "https://example.com/b",
+                },
+                {"title": "c", "publish_date": None, "source": "tempo", "link": "https://example.com/c"},
+            ]
+        )
+        df = columns.to_dataframe()
+
+        assert list(df.columns) == list(api_module._ArticleColumns.COLUMNS)
+        assert df["publish_date"].dtype == "datetime64[ns]"
+        assert df.loc[0, "publish_date"] == pd.Timestamp("2025-01-01 12:00:00")
+        assert df.loc[1, "publish_date"] == pd.Timestamp("2025-01-02 08:30:00")
+        assert pd.isna(df.loc[2, "publish_date"])
+        for name in ("source", "keyword", "category"):
+            assert isinstance(df[name].dtype, pd.CategoricalDtype)
+        assert list(df["source"].cat.categories) == ["kompas", "tempo"]
+
+    def test_empty_dataframe_has_final_dtypes(self):
+        df = api_module._ArticleColumns().to_dataframe()
+        assert df.empty
+        assert pd.api.types.is_datetime64_any_dtype(df["publish_date"])
+        assert isinstance(df["source"].dtype, pd.CategoricalDtype)
+
 
 class TestScrapeToFile:
     """Test scrape_to_file functionality."""
@@ -203,6 +248,30 @@ class TestScrapeToFile:
 
         mock_scrape_df.assert_called_once()
 
+    @patch("newswatch.api.scrape_to_dataframe")
+    def test_scrape_to_file_jsonl_writes_one_record_per_line(self, mock_scrape_df, tmp_path):
+        """Test the vectorized JSONL writer."""
+        import json
+
+        mock_scrape_df.return_value = api_module._ArticleColumns.from_records(
+            [
+                {"title": "Berita ekonomi", "publish_date": datetime(2025, 1, 1, 12, 0),
+                 "source": "kompas", "link": "https://example.com/a"},
+                {"title": "b", "publish_date": None, "source": "tempo",
+                 "link": "https://example.com/b"},
+            ]
+        ).to_dataframe()
+
+        out = tmp_path / "out.jsonl"
+        scrape_to_file("test", "2025-01-01", out, "jsonl")
+
+        records = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+        assert [r["link"] for r in records] == ["https://example.com/a", "https://example.com/b"]
+        assert records[0]["publish_date"] == "2025-01-01 12:00:00"
+        assert records[1]["publish_date"] is None
+        assert records[0]["source"] == "kompas"
+        assert not (tmp_path / "out.jsonl.tmp").exists()
+
 
 class TestConvenienceFunctions:
     """Test convenience functions."""
@@ -248,6 +317,8 @@ class TestConvenienceFunctions:
             max_concurrent_scrapers=6,
             time_range=None,
             dedup_file=None,
+            seen_store=None,
+            crawl_state=None,
             proxy=None,
         )
 
@@ -273,6 +344,8 @@ class TestConvenienceFunctions:
             max_concurrent_scrapers=6,
             time_range=None,
             dedup_file=None,
+            seen_store=None,
+            crawl_state=None,
             proxy=None,
         )
 
@@ -296,6 +369,8 @@ class TestConvenienceFunctions:
             max_concurrent_scrapers=6,
             time_range=None,
             dedup_file=None,
+            seen_store=None,
+            crawl_state=None,
             proxy=None,
         )
 
@@ -469,12 +544,12 @@ class TestScraperTimeout:
         latest(scraper_timeout=15)
         mock_async.assert_called_once()
 
-    @patch("newswatch.api.scrape")
-    def test_scrape_to_dataframe_accepts_scraper_timeout(self, mock_scrape):
+    @patch("newswatch.api._async_scrape_to_columns", new_callable=AsyncMock)
+    def test_scrape_to_dataframe_accepts_scraper_timeout(self, mock_async):
         """Test that scrape_to_dataframe() forwards scraper_timeout."""
-        mock_scrape.return_value = []
+        mock_async.return_value = api_module._ArticleColumns()
         scrape_to_dataframe("test", "2025-01-01", scraper_timeout=20)
-        mock_scrape.assert_called_once()
+        assert mock_async.call_args[1]["scraper_timeout"] == 20
 
 
 def _make_tracking_scraper_class():
@@ -567,6 +642,177 @@ class TestMaxConcurrentScrapers:
         assert mock_async.call_args[1]["max_concurrent_scrapers"] == 4
 
 
+def _make_emitting_scraper_class(count, delay=0.0):
+    """A fake scraper class that puts `count` articles on its queue, one
+    every `delay` seconds, and records whether it was cancelled."""
+
+    class _Emitting:
+        cancelled = 0
+
+        def __init__(self, keywords, start_date=None, queue_=None, **kwargs):
+            self.queue_ = queue_
+
+        async def scrape(self, method="search"):
+            try:
+                for i in range(count):
+                    await self.queue_.put(
+                        {"title": f"t{i}", "link": f"https://example.com/{i}"}
+                    )
+                    await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                type(self).cancelled += 1
+                raise
+
+    return _Emitting
+
+
+class TestCollectorCompletion:
+    """The collector ends on the sentinel; it never polls with timeouts."""
+
+    async def test_collector_records_time_to_last_item(self):
+        queue = asyncio.Queue()
+        stats = api_module._CollectorStats()
+
+        async def produce():
+            for i in range(3):
+                await queue.put({"title": "t", "link": f"https://example.com/{i}"})
+                await asyncio.sleep(0.01)
+            await queue.put(None)
+
+        producer = asyncio.create_task(produce())
+        results = await api_module._collect_queue_results(queue, stats=stats)
+        await producer
+
+        assert len(results) == 3
+        timing = stats.as_dict()
+        assert timing["items"] == 3
+        assert 0 <= timing["time_to_first_item"] <= timing["time_to_last_item"]
+        assert timing["time_to_last_item"] <= timing["total_seconds"] < 1
+
+    async def test_collector_does_not_use_wait_for(self, monkeypatch):
+        def _fail(*args, **kwargs):
+            raise AssertionError("collector must not poll with wait_for")
+
+        monkeypatch.setattr(api_module.asyncio, "wait_for", _fail)
+        queue = asyncio.Queue()
+        for i in range(5):
+            queue.put_nowait({"link": f"https://example.com/{i}"})
+        queue.put_nowait(None)
+        results = await api_module._collect_queue_results(queue)
+        assert len(results) == 5
+
+
+class TestStreamingAPI:
+    """ascrape() / iter_scrape() yield articles as they are collected."""
+
+    @pytest.fixture
+    def patch_scrapers(self, monkeypatch):
+        def _patch(scraper_class):
+            monkeypatch.setattr(
+                api_module,
+                "get_available_scrapers",
+                lambda method="search": {"fake": {"class": scraper_class, "params": {}}},
+            )
+            monkeypatch.setattr(
+                api_module,
+                "get_scraper_by_slug",
+                lambda slug: SimpleNamespace(browser_required=False),
+            )
+
+        return _patch
+
+    async def test_ascrape_yields_before_scrapers_finish(self, patch_scrapers):
+        Emitting = _make_emitting_scraper_class(3, delay=0.05)
+        patch_scrapers(Emitting)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        links = []
+        async for article in ascrape("test", "2025-01-01", verbose=True):
+            if not links:
+                first_at = loop.time() - started
+            links.append(article["link"])
+        assert links == [f"https://example.com/{i}" for i in range(3)]
+        assert first_at < 0.1
+
+    async def test_ascrape_early_break_cancels_scrapers(self, patch_scrapers):
+        Emitting = _make_emitting_scraper_class(1000, delay=0.01)
+        patch_scrapers(Emitting)
+        async with contextlib.aclosing(
+            ascrape("test", "2025-01-01", verbose=True)
+        ) as articles:
+            async for _ in articles:
+                break
+        assert Emitting.cancelled == 1
+
+    async def test_ascrape_raises_validation_error(self):
+        with pytest.raises(ValidationError):
+            async for _ in ascrape("test", "not-a-date"):
+                pass
+
+    def test_iter_scrape_yields_all_articles(self, patch_scrapers):
+        patch_scrapers(_make_emitting_scraper_class(5))
+        links = [a["link"] for a in iter_scrape("test", "2025-01-01", verbose=True)]
+        assert links == [f"https://example.com/{i}" for i in range(5)]
+
+    def test_iter_scrape_respects_limit(self, patch_scrapers):
+        patch_scrapers(_make_emitting_scraper_class(50))
+        articles = list(iter_scrape("test", "2025-01-01", verbose=True, limit=2))
+        assert len(articles) == 2
+
+    def test_iter_scrape_close_cancels_scrapers(self, patch_scrapers):
+        Emitting = _make_emitting_scraper_class(1000, delay=0.01)
+        patch_scrapers(Emitting)
+        articles = iter_scrape("test", "2025-01-01", verbose=True)
+        next(articles)
+        articles.close()
+        assert Emitting.cancelled == 1
+        assert not any(t.name == "newswatch-iter-scrape" for t in threading.enumerate())
+
+    def test_iter_scrape_raises_validation_error(self):
+        with pytest.raises(ValidationError):
+            list(iter_scrape("test", "2025-01-01", method="bogus"))
+
+    async def test_ascrape_proxy_goes_to_its_scrapers_not_the_environment(
+        self, patch_scrapers, monkeypatch
+    ):
+        monkeypatch.delenv("NEWSWATCH_PROXY", raising=False)
+        seen = []
+
+        class _Proxied:
+            def __init__(self, keywords, start_date=None, queue_=None, **kwargs):
+                self.queue_ = queue_
+                self.proxy = None
+
+            async def scrape(self, method="search"):
+                await asyncio.sleep(0.01)
+                seen.append((self.proxy, os.environ.get("NEWSWATCH_PROXY")))
+                await self.queue_.put({"title": "t", "link": "https://example.com/a"})
+
+        patch_scrapers(_Proxied)
+
+        async def _collect(proxy):
+            return [a async for a in ascrape("test", "2025-01-01", verbose=True, proxy=proxy)]
+
+        await asyncio.gather(_collect("http://a.example:8080"), _collect("http://b.example:8080"))
+        assert sorted(seen) == [("http://a.example:8080", None), ("http://b.example:8080", None)]
+
+    def test_a_slow_consumer_holds_the_stream_back(self, monkeypatch):
+        monkeypatch.setattr(api_module, "_STREAM_BUFFER", 2)
+        produced = []
+
+        async def _articles():
+            for i in range(100):
+                produced.append(i)
+                yield {"link": f"https://example.com/{i}"}
+
+        articles = api_module._iterate_in_thread(_articles, "newswatch-test-stream")
+        assert next(articles)["link"] == "https://example.com/0"
+        time.sleep(0.1)
+        # the one taken, two waiting for the caller, one waiting for a credit
+        assert len(produced) == 4
+        assert [a["link"] for a in articles][-1] == "https://example.com/99"
+
+
 class TestAPIIntegration:
     """Integration tests for the API (require network access)."""
 
@@ -0,0 +1,252 @@
+"""Tests for the response archive (--record and --replay)."""
+
+import gzip
+import json
+import sys
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from newswatch import archive
+from newswatch.cli import cli
+from newswatch.utils import AsyncScraper
+
+
+def _index(directory):
+    return [
+        json.loads(line)
+        for line in (directory / archive.INDEX_NAME).read_text(encoding="utf-8").splitlines()
+    ]
+
+
+def _body(directory, sha256):
+    return gzip.decompress(archive.object_path(directory, sha256).read_bytes()).decode("utf-8")
+
+
+async def test_recording_archives_bodies_once_by_content(local_site, tmp_path):
+    base = await local_site({"/a": (200, "same page"), "/b": (200, "same page"), "/c": (200, "other")})
+    with archive.recording(tmp_path) as recorder:
+        async with AsyncScraper() as scraper:
+            for path in ("/a", "/b", "/c", "/a"):
+                assert await scraper.fetch(f"{base}{path}")
+
+    records = _index(tmp_path)
+    assert [r["url"] for r in records] == [f"{base}{p}" for p in ("/a", "/b", "/c", "/a")]
+    assert {r["transport"] for r in records} == {"aiohttp"}
+    assert all(r["status"] == "200" and r["source"] == "AsyncScraper" for r in records)
+    assert records[0]["content_type"].startswith("text/html")
+    assert records[0]["sha256"] == records[1]["sha256"] != records[2]["sha256"]
+    assert _body(tmp_path, records[2]["sha256"]) == "other"
+    assert recorder.responses == 4
+    assert recorder.objects_written == 2
+    assert len(list((tmp_path / archive.OBJECTS_DIR).rglob("*.gz"))) == 2
+
+
+async def test_failures_and_fallbacks_are_indexed(local_site, tmp_path):
+    base = await local_site({"/gone": (404, ""), "/denied": (403, "")})
+    with archive.recording(tmp_path):
+        with patch("newswatch.utils._rnet_get", AsyncMock(return_value="<p>via rnet</p>")):
+            async with AsyncScraper(max_retries=0) as scraper:
+                assert await scraper.fetch(f"{base}/gone") is None
+                assert await scraper.fetch(f"{base}/denied") == "<p>via rnet</p>"
+
+    records = _index(tmp_path)
+    assert [(r["transport"], r["status"]) for r in records] == [
+        ("aiohttp", "404"), ("aiohttp", "403"), ("rnet", "ok"),
+    ]
+    assert records[0]["sha256"] is None and records[0]["size"] == 0
+    assert _body(tmp_path, records[2]["sha256"]) == "<p>via rnet</p>"
+
+
+async def test_post_requests_carry_a_hash_of_their_body(local_site, tmp_path):
+    base = await local_site({"/search": (200, "results")})
+    with archive.recording(tmp_path):
+        async with AsyncScraper() as scraper:
+            await scraper.fetch(f"{base}/search", method="POST", data={"q": "ihsg", "page": 1})
+    (record,) = _index(tmp_path)
+    assert record["method"] == "POST"
+    assert record["request_sha256"] == archive.request_hash({"page": 1, "q": "ihsg"})
+    assert archive.request_hash(None) is None
+
+
+async def test_nothing_is_recorded_outside_a_recording(local_site, tmp_path):
+    base = await local_site({"/a": (200, "page")})
+    async with AsyncScraper() as scraper:
+        await scraper.fetch(f"{base}/a")
+    assert archive.get_recorder() is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_recording_appends_to_an_existing_archive(tmp_path):
+    for text in ("first", "second"):
+        with archive.recording(tmp_path) as recorder:
+            recorder.record("https://example.com/a", "GET", None, "aiohttp", "200", text, 0.01)
+    assert [_body(tmp_path, r["sha256"]) for r in _index(tmp_path)] == ["first", "second"]
+
+
+def test_cli_record_reports_archived_responses(monkeypatch, capsys, tmp_path):
+    monkeypatch.setattr(sys, "argv", ["cli.py", "--keywords", "ihsg", "--record", str(tmp_path)])
+
+    async def fake_main(args):
+        archive.get_recorder().record("https://example.com/a", "GET", None, "aiohttp", "200", "x", 0.01)
+
+    with patch("newswatch.main.main", side_effect=fake_main):
+        cli()
+    assert f"Recorded 1 response(s) to {tmp_path}" in capsys.readouterr().out
+    assert len(_index(tmp_path)) == 1
+
+
+# ── Replay ────────────────────────────────────────────────────────────────
+
+
+def _no_network():
+    return patch(
+        "aiohttp.ClientSession._request", side_effect=AssertionError("network used during replay")
+    )
+
+
+async def test_replay_serves_a_recorded_scraper_run_without_network(local_site, tmp_path):
+    from newswatch.scrapers.basescraper import BaseScraper
+    from newswatch.utils import ArticleQueue
+
+    base = await local_site({
+        "/latest": (200, "a,b"), "/a": (200, "Article A"), "/b": (200, "Article B"),
+    })
+
+    class _Scraper(BaseScraper):
+        async def build_latest_url(self, page):
+            return await self.fetch(f"{base}/latest")
+
+        def parse_latest_article_links(self, response_text):
+            return [f"{base}/{slug}" for slug in response_text.split(",")]
+
+        async def build_search_url(self, keyword, page):
+            return None
+
+        def parse_article_links(self, response_text):
+            return None
+
+        async def get_article(self, link, keyword):
+            await self.queue_.put({"title": await self.fetch(link), "link": link})
+
+    async def run():
+        queue = ArticleQueue()
+        await _Scraper("", max_pages=1, queue_=queue).scrape(method="latest")
+        titles = []
+        while not queue.empty():
+            titles.append((await queue.get())["title"])
+        return sorted(titles)
+
+    with archive.recording(tmp_path):
+        recorded = await run()
+    with _no_network(), archive.replaying(tmp_path) as replay:
+        replayed = await run()
+
+    assert recorded == replayed == ["Article A", "Article B"]
+    assert replay.served == 3 and replay.misses == 0
+
+
+async def test_replay_repeats_recorded_retries_in_order_without_backoff(local_site, tmp_path):
+    base = await local_site({"/a": [(503, ""), (200, "ok")]})
+    with patch("newswatch.utils.asyncio.sleep", AsyncMock()), archive.recording(tmp_path):
+        async with AsyncScraper(max_retries=1) as scraper:
+            assert await scraper.fetch(f"{base}/a") == "ok"
+
+    started = time.perf_counter()
+    with _no_network(), archive.replaying(tmp_path):
+        async with AsyncScraper(max_retries=1) as scraper:
+            assert await scraper.fetch(f"{base}/a") == "ok"
+    assert time.perf_counter() - started < 0.5
+    assert scraper.fetch_stats.retries == 1
+    assert scraper.fetch_stats.failed_requests == 1
+
+
+async def test_replay_answers_fallbacks_from_the_archive(local_site, tmp_path):
+    base = await local_site({"/denied": (403, "")})
+    with archive.recording(tmp_path):
+        with patch("newswatch.utils._rnet_get", AsyncMock(return_value="<p>via rnet</p>")):
+            async with AsyncScraper(max_retries=0) as scraper:
+                await scraper.fetch(f"{base}/denied")
+
+    rnet = AsyncMock(side_effect=AssertionError("rnet used during replay"))
+    with _no_network(), patch("newswatch.utils._rnet_get", rnet), archive.replaying(tmp_path):
+        async with AsyncScraper(max_retries=0) as scraper:
+            assert await scraper.fetch(f"{base}/denied") == "<p>via rnet</p>"
+
+
+async def test_replay_misses_fail_without_network(tmp_path):
+    with archive.recording(tmp_path) as recorder:
+        recorder.record("https://example.com/a", "GET", None, "aiohttp", "200", "a", 0.2)
+    with _no_network(), archive.replaying(tmp_path) as replay:
+        async with AsyncScraper(max_retries=0) as scraper:
+            assert await scraper.fetch("https://example.com/missing") is None
+            assert await scraper.fetch("https://example.com/a") == "a"
+    # the aiohttp request and both fallbacks found nothing
+    assert replay.misses == 3
+    assert replay.served == 1
+
+
+async def test_replay_simulates_latency(tmp_path):
+    with archive.recording(tmp_path) as recorder:
+        recorder.record("https://example.com/a", "GET", None, "aiohttp", "200", "a", 0.08)
+    for latency, minimum in ((0.05, 0.05), ("recorded", 0.08)):
+        with archive.replaying(tmp_path, latency=latency):
+            async with AsyncScraper() as scraper:
+                started = time.perf_counter()
+                await scraper.fetch("https://example.com/a")
+                assert time.perf_counter() - started >= minimum
+
+
+def test_replay_rejects_a_directory_without_an_archive(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        archive.ResponseArchive(tmp_path)
+    with archive.recording(tmp_path):
+        pass
+    with pytest.raises(ValueError):
+        archive.ResponseArchive(tmp_path, latency="slow")
+
+
+def test_cli_replay_reports_served_responses(monkeypatch, capsys, tmp_path):
+    with archive.recording(tmp_path) as recorder:
+        recorder.record("https://example.com/a", "GET", None, "aiohttp", "200", "a", 0.01)
+    monkeypatch.setattr(sys, "argv", ["cli.py", "--keywords", "ihsg", "--replay", str(tmp_path)])
+
+    async def fake_main(args):
+        async with AsyncScraper() as scraper:
+            assert await scraper.fetch("https://example.com/a") == "a"
+
+    with patch("newswatch.main.main", side_effect=fake_main):
+        cli()
+    assert f"Replayed 1 response(s) from {tmp_path} (0 request(s) not in the archive)" in capsys.readouterr().out
+
+
+def test_cli_rejects_record_with_replay(monkeypatch, tmp_path):
+    monkeypatch.setattr(sys, "argv", ["cli.py", "--record", str(tmp_path), "--replay", str(tmp_path)])
+    with pytest.raises(SystemExit):
+        cli()
+
+
+def test_cli_replay_leaves_out_browser_driven_scrapers(monkeypatch, capsys, tmp_path):
+    with archive.recording(tmp_path):
+        pass
+    monkeypatch.setattr(sys, "argv", ["cli.py", "--keywords", "ihsg", "--replay", str(tmp_path)])
+    seen = {}
+
+    async def fake_main(args):
+        seen["scrapers"] = args.scrapers.split(",")
+
+    with patch("newswatch.main.main", side_effect=fake_main):
+        cli()
+    assert "kompas" in seen["scrapers"]
+    assert "tirto" not in seen["scrapers"] and "bisnis" not in seen["scrapers"]
+    assert "skipping browser-driven scraper(s)" in capsys.readouterr().out
+
+
+def test_cli_replay_rejects_a_named_browser_driven_scraper(monkeypatch, capsys, tmp_path):
+    with archive.recording(tmp_path):
+        pass
+    monkeypatch.setattr(sys, "argv", ["cli.py", "-s", "kompas,tirto", "--replay", str(tmp_path)])
+    with pytest.raises(SystemExit):
+        cli()
+    assert "tirto" in capsys.readouterr().err
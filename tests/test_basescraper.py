@@ -1,6 +1,11 @@
 import asyncio
+import time
+from datetime import datetime
+
+import pytest
 
 from newswatch.scrapers.basescraper import BaseScraper
+from newswatch.utils import SLOW_STEP_SECONDS
 
 
 class DummyScraper(BaseScraper):
@@ -215,3 +220,213 @@ async def test_pagination_state_resets_between_keywords():
     await scraper.fetch_search_results("b")
     assert first == [1, 2, 3]
     assert scraper.visited_pages == [1, 2, 3]
+
+
+class _WindowedScraper(BaseScraper):
+    """A date-bounded search: each window lists two pages of two articles.
+
+    The newest window answers slowest, so its articles would land last if
+    windows were emitted as they finish.
+    """
+
+    WINDOW_DAYS = 7
+    WINDOW_CONCURRENCY = 3
+    PAGES_PER_WINDOW = 2
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.start_date = datetime(2026, 9, 1)
+        self.end_datetime = datetime(2026, 9, 28)
+        self.active = 0
+        self.max_active = 0
+        self.requested = []
+
+    async def build_search_url(self, keyword, page, window=None):
+        self.requested.append((window[0].day, page))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.05 if window[1].day == 28 else 0.01)
+        self.active -= 1
+        return f"{window[0].day}-{page}" if page <= 3 else None
+
+    def parse_article_links(self, response_text):
+        return [f"https://example.com/{response_text}-{n}" for n in (1, 2)]
+
+    async def get_article(self, link, keyword):
+        await self.queue_.put({"link": link, "keyword": keyword})
+
+
+def _drain(queue):
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait()["link"].rsplit("/", 1)[-1])
+    return items
+
+
+async def test_windows_run_concurrently_and_are_emitted_newest_first():
+    queue = asyncio.Queue()
+    scraper = _WindowedScraper("ihsg", queue_=queue)
+    await scraper.scrape()
+
+    assert 1 < scraper.max_active <= 3
+    # four windows counted from the start date, PAGES_PER_WINDOW pages each
+    assert sorted(scraper.requested) == [
+        (day, page) for day in (1, 8, 15, 22) for page in (1, 2)
+    ]
+    assert [link.split("-")[0] for link in _drain(queue)] == ["22"] * 4 + ["15"] * 4 + ["8"] * 4 + ["1"] * 4
+
+
+async def test_finished_windows_are_skipped_on_resume(tmp_path):
+    from newswatch.checkpoint import RunCheckpoint
+
+    queue = asyncio.Queue()
+    with RunCheckpoint(tmp_path, "run") as run:
+        run.for_source("local").finish("ihsg", "window:2026-09-22/2026-09-28")
+        scraper = _WindowedScraper("ihsg", queue_=queue)
+        scraper.checkpoint = run.for_source("local")
+        await scraper.scrape()
+        assert {day for day, _ in scraper.requested} == {1, 8, 15}
+        assert run.is_done("local", "ihsg", "window:2026-09-01/2026-09-07")
+
+
+class _PrefetchScraper(BaseScraper):
+    """Five listing pages; each article takes a while to fetch."""
+
+    PREFETCH_PAGES = 2
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.events = []
+
+    async def build_search_url(self, keyword, page):
+        self.events.append(f"list-{page}")
+        await asyncio.sleep(0.01)
+        return f"page-{page}" if page <= 5 else None
+
+    def parse_article_links(self, response_text):
+        return [f"https://example.com/{response_text}"]
+
+    async def get_article(self, link, keyword):
+        self.events.append("article-start")
+        await asyncio.sleep(0.02)
+        if link.endswith("page-2"):
+            self.continue_scraping = False
+
+
+async def test_listing_pages_are_fetched_ahead_while_articles_are_in_flight():
+    scraper = _PrefetchScraper("ihsg", queue_=asyncio.Queue(), max_pages=10)
+    await scraper.fetch_search_results("ihsg")
+
+    # pages 2 and 3 were requested before page 1's article was fetched
+    assert scraper.events[:4] == ["list-1", "list-2", "list-3", "article-start"]
+    assert scraper.fetch_stats.prefetched_pages >= 2
+
+
+async def test_prefetched_pages_past_the_stop_are_discarded_and_counted():
+    scraper = _PrefetchScraper("ihsg", queue_=asyncio.Queue(), max_pages=10)
+    scraper.STALE_PAGE_TOLERANCE = 1
+    await scraper.fetch_search_results("ihsg")
+
+    # page 2 ends the walk; pages 3 and 4 were already on their way
+    assert scraper.events.count("article-start") == 2
+    assert scraper.fetch_stats.wasted_prefetches == 2
+    assert scraper.fetch_stats.summary()["wasted_prefetches"] == 2
+
+
+async def test_prefetch_stays_within_max_pages():
+    scraper = _PrefetchScraper("ihsg", queue_=asyncio.Queue(), max_pages=2)
+    await scraper.fetch_search_results("ihsg")
+    assert sorted(e for e in scraper.events if e.startswith("list-")) == ["list-1", "list-2"]
+
+
+class _CpuListingScraper(BaseScraper):
+    """Two listing pages, each taking one slow step of CPU to build."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.base_url = "https://example.com"
+
+    async def build_search_url(self, keyword, page):
+        if page > 2:
+            return None
+        end = time.thread_time() + SLOW_STEP_SECONDS + 0.02
+        while time.thread_time() < end:
+            pass
+        return f"page-{page}"
+
+    def parse_article_links(self, response_text):
+        return [f"https://example.com/{response_text}"]
+
+    async def get_article(self, link, keyword):
+        pass
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+async def test_each_listing_page_is_timed_once(prefetch):
+    scraper = _CpuListingScraper("ihsg", queue_=asyncio.Queue(), max_pages=2)
+    scraper.PREFETCH_PAGES = prefetch
+    await scraper.scrape()
+
+    step = SLOW_STEP_SECONDS + 0.02
+    assert scraper.fetch_stats.summary()["slow_steps"] == 2
+    assert 2 * step <= scraper.fetch_stats.parse_cpu_seconds < 3 * step
+
+
+class _DatedListingScraper(BaseScraper):
+    """A listing that carries each link's date, as sitemap feeds do."""
+
+    def __init__(self, pages, *args, **kwargs):
+        super().__init__("ihsg", *args, queue_=asyncio.Queue(), max_pages=10, **kwargs)
+        self.pages = pages
+        self.visited_pages: list[int] = []
+        self.fetched: list[str] = []
+
+    async def build_search_url(self, keyword, page):
+        self.visited_pages.append(page)
+        return page if page <= len(self.pages) else None
+
+    def parse_article_links(self, response_text):
+        return [
+            entry if day is None else (entry, datetime(2026, 10, day))
+            for entry, day in self.pages[response_text - 1]
+        ]
+
+    async def get_article(self, link, keyword):
+        self.fetched.append(link)
+
+
+async def test_links_listed_before_the_start_date_are_never_fetched():
+    pages = [[("a", 18), ("b", 12)], [("c", 9)], [("d", 8)], [("e", 7)], [("f", 6)]]
+    scraper = _DatedListingScraper(pages, start_datetime=datetime(2026, 10, 10))
+    await scraper.fetch_search_results("ihsg")
+    assert scraper.fetched == ["a", "b"]
+    # pages reaching past the start count as stale, as a fetched out-of-window
+    # article would, so the walk still stops after STALE_PAGE_TOLERANCE of them
+    assert scraper.visited_pages == [1, 2, 3, 4]
+
+
+async def test_links_listed_after_the_end_date_are_dropped_and_undated_ones_kept():
+    pages = [[("a", 18), ("b", None), ("c", 15)]]
+    scraper = _DatedListingScraper(
+        pages, start_datetime=datetime(2026, 10, 1), end_datetime=datetime(2026, 10, 16)
+    )
+    await scraper.fetch_search_results("ihsg")
+    assert scraper.fetched == ["b", "c"]
+
+
+async def test_pages_newer_than_the_end_date_keep_pagination_going():
+    pages = [[("a", 28)], [("b", 27)], [("c", 26)], [("d", 14), ("e", 12)], [("f", 3)]]
+    scraper = _DatedListingScraper(
+        pages, start_datetime=datetime(2026, 10, 10), end_datetime=datetime(2026, 10, 15)
+    )
+    await scraper.fetch_search_results("ihsg")
+    assert scraper.fetched == ["d", "e"]
+    assert scraper.visited_pages[:5] == [1, 2, 3, 4, 5]
+
+
+async def test_a_repeated_page_of_too_new_links_is_stale():
+    pages = [[("a", 28)]] * 8
+    scraper = _DatedListingScraper(pages, end_datetime=datetime(2026, 10, 15))
+    await scraper.fetch_search_results("ihsg")
+    assert scraper.fetched == []
+    assert scraper.visited_pages == [1, 2, 3, 4]
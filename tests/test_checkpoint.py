@@ -0,0 +1,122 @@
+"""Tests for resumable runs: the journal, output recovery and resumed walks."""
+
+import asyncio
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+import newswatch.cli as cli_module
+import newswatch.main as main_module
+from newswatch.checkpoint import RunCheckpoint, recover_output
+from newswatch.main import write_jsonl
+from newswatch.utils import ArticleQueue
+
+
+def test_a_unit_is_journaled_only_once_the_writer_caught_up(tmp_path):
+    queue = ArticleQueue()
+    with RunCheckpoint(tmp_path, "run") as run:
+        run.attach(queue)
+        links = run.links()
+        queue.put_nowait({"link": "https://example.com/a"})
+        run.for_source("local").finish("ihsg", "page:1")
+        assert not run.is_done("local", "ihsg", "page:1")
+
+        item = queue.get_nowait()
+        links.add(item["link"])
+        assert run.is_done("local", "ihsg", "page:1")
+
+        run.for_source("local").finish("ihsg", "page:2")
+        queue.put_nowait({"link": "https://example.com/b"})
+        run.for_source("local").finish("ihsg", "page:3")
+        run.settle()  # page:3's article never reached the writer
+
+    reopened = RunCheckpoint(tmp_path, "run")
+    assert reopened.done == {("local", "ihsg", "page:1"), ("local", "ihsg", "page:2")}
+    assert "https://example.com/a" in reopened.emitted
+    reopened.close()
+
+
+def test_run_arguments_round_trip(tmp_path):
+    with RunCheckpoint(tmp_path, "run") as run:
+        run.save_arguments(SimpleNamespace(method="search", keywords="ihsg", output_format="csv"))
+    args = SimpleNamespace(keywords="other")
+    RunCheckpoint(tmp_path, "run").load_arguments(args)
+    assert (args.keywords, args.method, args.start_date) == ("ihsg", "search", None)
+    assert RunCheckpoint.exists(tmp_path, "run")
+    assert not RunCheckpoint.exists(tmp_path, "missing")
+
+
+def test_recover_output_drops_a_half_written_line(tmp_path):
+    out = tmp_path / "out.jsonl"
+    out.write_text('{"link": "a"}\n')
+    (tmp_path / "out.jsonl.tmp").write_text('{"link": "a"}\n{"link": "b"}\n{"link": "c')
+    assert recover_output(out, "jsonl")
+    assert out.read_text() == '{"link": "a"}\n{"link": "b"}\n'
+    assert not recover_output(out, "jsonl")
+
+
+async def test_resumed_writer_appends_to_the_output(tmp_path):
+    out = tmp_path / "out.jsonl"
+    out.write_text('{"link": "a"}\n')
+    queue = asyncio.Queue()
+    for item in ({"link": "b"}, None):
+        queue.put_nowait(item)
+    await write_jsonl(queue, "x", out, append=True)
+    assert out.read_text().splitlines() == ['{"link": "a"}', '{"link": "b"}']
+
+
+async def test_resumed_scraper_skips_finished_pages_and_keywords(tmp_path, listing_scraper):
+    with RunCheckpoint(tmp_path, "run") as run:
+        source = run.for_source("local")
+        source.finish("ihsg", "*")
+        source.finish("bank", "page:1")
+
+        scraper = listing_scraper("ihsg,bank", pages=[["a"], ["b"]])
+        scraper.checkpoint = source
+        await scraper.scrape()
+
+        assert scraper.listed_pages == {"bank": [2, 3]}
+        assert run.is_done("local", "bank", "page:2")
+        assert run.is_done("local", "bank", "*")
+
+
+async def test_checkpointed_scrapers_also_skip_dedup_file_links(tmp_path, monkeypatch):
+    dedup_file = tmp_path / "previous.jsonl"
+    dedup_file.write_text('{"link": "https://example.com/old"}\n')
+    seen = {}
+
+    class _Recording:
+        def __init__(self, keywords, start_date=None, queue_=None, **kwargs):
+            self.queue_ = queue_
+
+        async def scrape(self, method="search"):
+            seen["dedup_links"] = self.dedup_links
+
+    monkeypatch.setattr(
+        main_module, "get_available_scrapers",
+        lambda method="search": {"local": {"class": _Recording, "params": {}}},
+    )
+    monkeypatch.setattr(main_module, "get_scraper_by_slug", lambda slug: SimpleNamespace(browser_required=False))
+    with RunCheckpoint(tmp_path, "run") as run:
+        run.emitted.add("https://example.com/emitted")
+        args = SimpleNamespace(
+            keywords="ihsg", start_date=None, scrapers="local", output_format="jsonl",
+            output_path=str(tmp_path / "out.jsonl"), dedup_file=str(dedup_file), run_checkpoint=run,
+        )
+        await main_module.main(args)
+
+    assert "https://example.com/old" in seen["dedup_links"]
+    assert "https://example.com/emitted" in seen["dedup_links"]
+
+
+def test_cli_resume_of_an_unknown_run_is_an_error(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["newswatch", "--resume", "nope", "--checkpoint-dir", str(tmp_path)])
+    with pytest.raises(SystemExit):
+        cli_module.cli()
+
+
+def test_cli_checkpoint_needs_a_streaming_format(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["newswatch", "--checkpoint", "-of", "xlsx"])
+    with pytest.raises(SystemExit):
+        cli_module.cli()
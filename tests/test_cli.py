@@ -1,3 +1,4 @@
+import json
 import sys
 from unittest.mock import AsyncMock, patch
 
@@ -11,7 +12,7 @@ def test_cli_no_args(monkeypatch, capsys):
     monkeypatch.setattr(sys, "argv", ["cli.py"])
 
     # Mock the main scraping function to avoid real network calls
-    with patch("newswatch.cli.run_main", new_callable=AsyncMock) as mock_main:
+    with patch("newswatch.main.main", new_callable=AsyncMock) as mock_main:
         cli()
         capsys.readouterr()
 
@@ -29,7 +30,7 @@ def test_cli_with_invalid_args(monkeypatch, capsys):
     monkeypatch.setattr(sys, "argv", ["cli.py", "--unknown_arg"])
 
     # Mock the main function (shouldn't be called due to arg parsing error)
-    with patch("newswatch.cli.run_main", new_callable=AsyncMock) as mock_main:
+    with patch("newswatch.main.main", new_callable=AsyncMock) as mock_main:
         with pytest.raises(SystemExit):
             cli()
         captured = capsys.readouterr()
@@ -43,7 +44,7 @@ def test_cli_help(monkeypatch, capsys):
     monkeypatch.setattr(sys, "argv", ["cli.py", "--help"])
 
     # Mock the main function (shouldn't be called due to help exit)
-    with patch("newswatch.cli.run_main", new_callable=AsyncMock) as mock_main:
+    with patch("newswatch.main.main", new_callable=AsyncMock) as mock_main:
         with pytest.raises(SystemExit):
             cli()
         captured = capsys.readouterr()
@@ -56,7 +57,7 @@ def test_cli_list_scrapers(monkeypatch, capsys):
     monkeypatch.setattr(sys, "argv", ["cli.py", "--list_scrapers"])
 
     # Mock the main function (shouldn't be called when listing scrapers)
-    with patch("newswatch.cli.run_main", new_callable=AsyncMock) as mock_main:
+    with patch("newswatch.main.main", new_callable=AsyncMock) as mock_main:
         cli()
         captured = capsys.readouterr()
         assert "Supported search scrapers:" in captured.out
@@ -67,7 +68,7 @@ def test_cli_list_scrapers(monkeypatch, capsys):
 def test_cli_latest_method(monkeypatch, capsys):
     monkeypatch.setattr(sys, "argv", ["cli.py", "--method", "latest"])
 
-    with patch("newswatch.cli.run_main", new_callable=AsyncMock) as mock_main:
+    with patch("newswatch.main.main", new_callable=AsyncMock) as mock_main:
         cli()
         capsys.readouterr()
 
@@ -81,7 +82,7 @@ def test_cli_list_latest_scrapers(monkeypatch, capsys):
         sys, "argv", ["cli.py", "--method", "latest", "--list_scrapers"]
     )
 
-    with patch("newswatch.cli.run_main", new_callable=AsyncMock) as mock_main:
+    with patch("newswatch.main.main", new_callable=AsyncMock) as mock_main:
         cli()
         captured = capsys.readouterr()
         assert "Supported latest scrapers:" in captured.out
@@ -94,7 +95,7 @@ def test_cli_latest_with_limit_and_max_pages(monkeypatch, capsys):
         sys, "argv", ["cli.py", "--method", "latest", "--limit", "5", "--max-pages", "2"]
     )
 
-    with patch("newswatch.cli.run_main", new_callable=AsyncMock) as mock_main:
+    with patch("newswatch.main.main", new_callable=AsyncMock) as mock_main:
         cli()
         capsys.readouterr()
 
@@ -109,7 +110,7 @@ def test_cli_scraper_timeout_arg(monkeypatch, capsys):
     """Test that --scraper-timeout is parsed."""
     monkeypatch.setattr(sys, "argv", ["cli.py", "--scraper-timeout", "30"])
 
-    with patch("newswatch.cli.run_main", new_callable=AsyncMock) as mock_main:
+    with patch("newswatch.main.main", new_callable=AsyncMock) as mock_main:
         cli()
         capsys.readouterr()
 
@@ -124,7 +125,7 @@ def test_cli_daterange_canonical_no_deprecation_warning(monkeypatch, capsys):
     value = "2026-07-13/2026-07-15"
     monkeypatch.setattr(sys, "argv", ["cli.py", "--daterange", value])
 
-    with patch("newswatch.cli.run_main", new_callable=AsyncMock) as mock_main:
+    with patch("newswatch.main.main", new_callable=AsyncMock) as mock_main:
         cli()
         captured = capsys.readouterr()
 
@@ -141,7 +142,7 @@ def test_cli_time_range_unrecognized_after_removal(monkeypatch, capsys):
         ["cli.py", "--time-range", "2026-07-13/2026-07-15"],
     )
 
-    with patch("newswatch.cli.run_main", new_callable=AsyncMock) as mock_main:
+    with patch("newswatch.main.main", new_callable=AsyncMock) as mock_main:
         with pytest.raises(SystemExit) as error:
             cli()
 
@@ -159,7 +160,7 @@ def test_cli_date_range_with_hyphen_unrecognized(monkeypatch, capsys):
         ["cli.py", "--date-range", "2026-07-13/2026-07-15"],
     )
 
-    with patch("newswatch.cli.run_main", new_callable=AsyncMock) as mock_main:
+    with patch("newswatch.main.main", new_callable=AsyncMock) as mock_main:
         with pytest.raises(SystemExit) as error:
             cli()
 
@@ -174,7 +175,7 @@ def test_cli_progress_flag(monkeypatch, capsys):
     """Test that --progress flag is parsed."""
     monkeypatch.setattr(sys, "argv", ["cli.py", "--progress"])
 
-    with patch("newswatch.cli.run_main", new_callable=AsyncMock) as mock_main:
+    with patch("newswatch.main.main", new_callable=AsyncMock) as mock_main:
         cli()
         capsys.readouterr()
 
@@ -186,9 +187,9 @@ def test_cli_health_report_flag(monkeypatch, capsys):
     """Test that --health-report flag runs health report instead of main."""
     monkeypatch.setattr(sys, "argv", ["cli.py", "--health-report"])
 
-    with patch("newswatch.cli.run_main", new_callable=AsyncMock) as mock_main, \
-         patch("newswatch.cli.health_report") as mock_health, \
-         patch("newswatch.cli._print_health_summary") as mock_summary:
+    with patch("newswatch.main.main", new_callable=AsyncMock) as mock_main, \
+         patch("newswatch.health.health_report") as mock_health, \
+         patch("newswatch.health._print_health_summary") as mock_summary:
         mock_health.return_value = [{"slug": "test", "status": "ok"}]
         cli()
 
@@ -204,11 +205,13 @@ def test_cli_health_report_with_output(monkeypatch, capsys, tmp_path):
         "--scrapers", "kompas", "--output_path", outfile,
         "--scraper-timeout", "20", "--max-pages", "1",
     ])
+    monkeypatch.delenv("NEWSWATCH_HEALTH_HISTORY", raising=False)
+    monkeypatch.delenv("NEWSWATCH_HEALTH_STORE", raising=False)
 
-    with patch("newswatch.cli.run_main", new_callable=AsyncMock) as mock_main, \
-         patch("newswatch.cli.health_report") as mock_health, \
-         patch("newswatch.cli._print_health_summary") as mock_summary, \
-         patch("newswatch.cli.health_report_to_file") as mock_to_file:
+    with patch("newswatch.main.main", new_callable=AsyncMock) as mock_main, \
+         patch("newswatch.health.health_report") as mock_health, \
+         patch("newswatch.health._print_health_summary") as mock_summary, \
+         patch("newswatch.health.health_report_to_file") as mock_to_file:
         mock_health.return_value = [{"slug": "kompas", "status": "ok"}]
         cli()
 
@@ -216,6 +219,8 @@ def test_cli_health_report_with_output(monkeypatch, capsys, tmp_path):
         mock_health.assert_called_once_with(
             method="latest", scrapers="kompas",
             scraper_timeout=20, max_pages=1, limit=1,
+            max_concurrent_scrapers=6, total_budget=None,
+            history_path=None, store_path=None,
         )
         mock_to_file.assert_called_once_with(
             mock_health.return_value, outfile, "csv",
@@ -225,66 +230,57 @@ def test_cli_health_report_with_output(monkeypatch, capsys, tmp_path):
 
 
 def test_cli_health_report_history_flag(monkeypatch, capsys, tmp_path):
-    """Test --health-history wires append_health_history with the flag path."""
+    """Test --health-history is handed to health_report for streaming appends."""
     history = str(tmp_path / "subdir" / "health.jsonl")
     monkeypatch.setattr(sys, "argv", [
         "cli.py", "--health-report", "--health-history", history,
     ])
     monkeypatch.delenv("NEWSWATCH_HEALTH_HISTORY", raising=False)
 
-    with patch("newswatch.cli.run_main", new_callable=AsyncMock) as mock_main, \
-         patch("newswatch.cli.health_report") as mock_health, \
-         patch("newswatch.cli._print_health_summary"), \
-         patch("newswatch.cli.append_health_history") as mock_append:
+    with patch("newswatch.main.main", new_callable=AsyncMock) as mock_main, \
+         patch("newswatch.health.health_report") as mock_health, \
+         patch("newswatch.health._print_health_summary"):
         mock_health.return_value = [
             {"slug": "kompas", "status": "ok", "article_count": 2},
             {"slug": "tempo", "status": "ok", "article_count": 1},
         ]
-        mock_append.return_value = 2
         cli()
 
         mock_main.assert_not_called()
-        mock_append.assert_called_once()
-        args, kwargs = mock_append.call_args
-        assert args[0] == mock_health.return_value
-        assert args[1] == history
+        assert mock_health.call_args[1]["history_path"] == history
         captured = capsys.readouterr()
         assert "Appended 2 health record(s)" in captured.out
         assert history in captured.out
 
 
 def test_cli_health_report_history_from_env(monkeypatch, capsys, tmp_path):
-    """Test NEWSWATCH_HEALTH_HISTORY env wires append_health_history when flag absent."""
+    """Test NEWSWATCH_HEALTH_HISTORY env is used when the flag is absent."""
     history = str(tmp_path / "env_health.jsonl")
     monkeypatch.setattr(sys, "argv", ["cli.py", "--health-report"])
     monkeypatch.setenv("NEWSWATCH_HEALTH_HISTORY", history)
 
-    with patch("newswatch.cli.run_main", new_callable=AsyncMock), \
-         patch("newswatch.cli.health_report") as mock_health, \
-         patch("newswatch.cli._print_health_summary"), \
-         patch("newswatch.cli.append_health_history") as mock_append:
+    with patch("newswatch.main.main", new_callable=AsyncMock), \
+         patch("newswatch.health.health_report") as mock_health, \
+         patch("newswatch.health._print_health_summary"):
         mock_health.return_value = [{"slug": "kompas", "status": "ok"}]
-        mock_append.return_value = 1
         cli()
 
-        mock_append.assert_called_once()
-        assert mock_append.call_args[0][1] == history
+        assert mock_health.call_args[1]["history_path"] == history
         captured = capsys.readouterr()
         assert "Appended 1 health record(s)" in captured.out
 
 
 def test_cli_health_report_no_history_skips_append(monkeypatch, capsys, tmp_path):
-    """Test --health-report without --health-history or env does NOT call append."""
+    """Test --health-report without --health-history or env writes no history."""
     monkeypatch.setattr(sys, "argv", ["cli.py", "--health-report"])
     monkeypatch.delenv("NEWSWATCH_HEALTH_HISTORY", raising=False)
 
-    with patch("newswatch.cli.run_main", new_callable=AsyncMock), \
-         patch("newswatch.cli.health_report") as mock_health, \
-         patch("newswatch.cli._print_health_summary"), \
-         patch("newswatch.cli.append_health_history") as mock_append:
+    with patch("newswatch.main.main", new_callable=AsyncMock), \
+         patch("newswatch.health.health_report") as mock_health, \
+         patch("newswatch.health._print_health_summary"):
         mock_health.return_value = [{"slug": "kompas", "status": "ok"}]
         cli()
-        mock_append.assert_not_called()
+        assert mock_health.call_args[1]["history_path"] is None
         captured = capsys.readouterr()
         assert "Appended" not in captured.out
 
@@ -298,11 +294,125 @@ def test_cli_health_report_flag_overrides_env(monkeypatch, capsys, tmp_path):
     ])
     monkeypatch.setenv("NEWSWATCH_HEALTH_HISTORY", env_path)
 
-    with patch("newswatch.cli.run_main", new_callable=AsyncMock), \
-         patch("newswatch.cli.health_report") as mock_health, \
-         patch("newswatch.cli._print_health_summary"), \
-         patch("newswatch.cli.append_health_history") as mock_append:
+    with patch("newswatch.main.main", new_callable=AsyncMock), \
+         patch("newswatch.health.health_report") as mock_health, \
+         patch("newswatch.health._print_health_summary"):
         mock_health.return_value = [{"slug": "kompas", "status": "ok"}]
-        mock_append.return_value = 1
         cli()
-        assert mock_append.call_args[0][1] == flag_path
\ No newline at end of file
+        assert mock_health.call_args[1]["history_path"] == flag_path
+
+
+def test_cli_health_budget_flag(monkeypatch):
+    """Test --health-budget and --max-concurrent-scrapers reach health_report."""
+    monkeypatch.setattr(sys, "argv", [
+        "cli.py", "--health-report", "--health-budget", "90",
+        "--max-concurrent-scrapers", "10",
+    ])
+
+    with patch("newswatch.main.main", new_callable=AsyncMock), \
+         patch("newswatch.health.health_report") as mock_health, \
+         patch("newswatch.health._print_health_summary"):
+        mock_health.return_value = []
+        cli()
+        assert mock_health.call_args[1]["total_budget"] == 90
+        assert mock_health.call_args[1]["max_concurrent_scrapers"] == 10
+
+
+def test_cli_seen_store_build_imports_links_and_exits(monkeypatch, capsys, tmp_path):
+    output = tmp_path / "previous.jsonl"
+    output.write_text('{"link": "https://example.com/a"}\n', encoding="utf-8")
+    store_path = tmp_path / "seen.db"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["cli.py", "--seen-store", str(store_path), "--seen-store-build", str(output)],
+    )
+
+    with patch("newswatch.main.main", new_callable=AsyncMock) as mock_main:
+        cli()
+        mock_main.assert_not_called()
+    assert "Added 1 link(s)" in capsys.readouterr().out
+
+    from newswatch.dedup import SeenLinkStore
+
+    with SeenLinkStore(store_path) as store:
+        assert "https://example.com/a" in store
+
+
+def test_cli_health_trends_syncs_history_and_prints(monkeypatch, capsys, tmp_path):
+    """Test --health-trends imports the JSONL history into the store and exits."""
+    history = tmp_path / "health.jsonl"
+    from datetime import datetime
+
+    record = {"timestamp": datetime.now().isoformat(), "run_id": "r1",
+              "source": "kompas", "status": "ok", "elapsed_seconds": 1.0}
+    history.write_text(json.dumps(record) + "\n", encoding="utf-8")
+    monkeypatch.setattr(sys, "argv", [
+        "cli.py", "--health-trends", "--health-history", str(history),
+        "--health-store", str(tmp_path / "health.db"),
+    ])
+
+    with patch("newswatch.main.main", new_callable=AsyncMock) as mock_main:
+        cli()
+        mock_main.assert_not_called()
+    out = capsys.readouterr().out
+    assert "kompas" in out
+    assert "Summary: 1 sources" in out
+
+
+def test_cli_trace_writes_trace_file(monkeypatch, capsys, tmp_path):
+    """Test --trace records the run and writes a Chrome trace file."""
+    from newswatch import tracing
+
+    path = tmp_path / "run.trace.json"
+    monkeypatch.setattr(sys, "argv", ["cli.py", "--keywords", "ihsg", "--trace", str(path)])
+
+    async def fake_main(args):
+        assert tracing.get_tracer() is not None
+        with tracing.span("fetch", url="https://example.com"):
+            pass
+
+    with patch("newswatch.main.main", side_effect=fake_main):
+        cli()
+    events = json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+    assert any(e["name"] == "fetch" and e["ph"] == "X" for e in events)
+    assert f"Trace written to {path}" in capsys.readouterr().out
+
+
+def _loaded_after(code):
+    """Top-level packages and scraper modules a fresh interpreter has after ``code``."""
+    import subprocess
+
+    probe = (
+        code
+        + "\nimport json, sys\nprint(json.dumps(sorted(m for m in sys.modules"
+        " if '.' not in m or m.startswith('newswatch.scrapers.'))))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    ).stdout
+    return set(json.loads(out.splitlines()[-1]))
+
+
+def test_import_newswatch_loads_no_heavy_dependencies():
+    loaded = _loaded_after("import newswatch; newswatch.SCRAPERS")
+    assert not loaded & {"pandas", "playwright", "dateparser", "bs4", "aiohttp"}
+
+
+def test_list_scrapers_imports_no_scraper_module():
+    loaded = _loaded_after(
+        "import sys; sys.argv = ['newswatch', '--list_scrapers']\n"
+        "from newswatch.cli import cli; cli()"
+    )
+    assert not loaded & {"pandas", "playwright", "dateparser", "bs4", "aiohttp", "numpy"}
+    assert not any(m.startswith("newswatch.scrapers.") for m in loaded)
+
+
+def test_lazy_package_attributes_resolve():
+    import newswatch
+    from newswatch import api
+
+    assert newswatch.scrape is api.scrape
+    assert "scrape" in dir(newswatch)
+    with pytest.raises(AttributeError):
+        newswatch.no_such_function
@@ -0,0 +1,110 @@
+"""Tests for incremental crawl state: the store and how scrapers use it."""
+
+import asyncio
+import sys
+from datetime import datetime
+
+import pytest
+
+import newswatch.cli as cli_module
+from newswatch.crawlstate import CrawlState, CrawlStateStore
+
+
+def test_store_round_trips_and_resets_per_source(tmp_path):
+    path = tmp_path / "state.sqlite3"
+    with CrawlStateStore(path) as store:
+        store.put("kompas", "ihsg", "search", CrawlState(["https://a"], datetime(2026, 10, 1)))
+        store.put("kompas", "latest", "latest", CrawlState(["https://b"]))
+        store.put("detik", "ihsg", "search", CrawlState([]))
+
+    with CrawlStateStore(path) as store:
+        state = store.get("kompas", "ihsg", "search")
+        assert (state.links, state.covers_from) == (["https://a"], datetime(2026, 10, 1))
+        assert store.get("kompas", "ihsg", "latest") is None
+        assert store.reset(["kompas"]) == 2
+        assert len(store) == 1
+        assert store.reset() == 1
+
+
+async def test_second_run_fetches_only_new_links_and_stops_at_known_pages(tmp_path, listing_scraper):
+    with CrawlStateStore(tmp_path / "state.sqlite3") as store:
+        first = listing_scraper(pages=[["a9", "a8"], ["a7", "a6"], ["a5", "a4"]])
+        first.crawl_state = store.for_source("local")
+        await first.scrape()
+        assert first.listed_pages == {"ihsg": [1, 2, 3, 4]}
+
+        # two new articles pushed the listing down one slot each
+        second = listing_scraper(pages=[["a11", "a10"], ["a9", "a8"], ["a7", "a6"], ["a5", "a4"]])
+        second.crawl_state = store.for_source("local")
+        await second.scrape()
+        assert second.fetched == ["a11", "a10"]
+        assert second.listed_pages == {"ihsg": [1, 2]}
+
+        state = store.get("local", "ihsg", "search")
+        # the new links lead, the old frontier is kept behind them
+        assert [link.rsplit("/", 1)[-1] for link in state.links] == [
+            "a11", "a10", "a9", "a8", "a7", "a6", "a5", "a4",
+        ]
+
+
+async def test_a_backfill_past_the_covered_range_does_not_stop_at_known_pages(tmp_path, listing_scraper):
+    pages = [["a9", "a8"], ["a7", "a6"], ["a5", "a4"], ["a3", "a2"]]
+    with CrawlStateStore(tmp_path / "state.sqlite3") as store:
+        first = listing_scraper(pages=pages[:2], start_datetime=datetime(2026, 10, 6))
+        first.crawl_state = store.for_source("local")
+        await first.scrape()
+        assert store.get("local", "ihsg", "search").covers_from == datetime(2026, 10, 6)
+
+        # a daily run within the covered range stops at the frontier
+        daily = listing_scraper(pages=pages, start_datetime=datetime(2026, 10, 7))
+        daily.crawl_state = store.for_source("local")
+        await daily.scrape()
+        assert daily.listed_pages == {"ihsg": [1]}
+        assert store.get("local", "ihsg", "search").covers_from == datetime(2026, 10, 6)
+
+        # a backfill skips the known links but walks on to its start date
+        backfill = listing_scraper(pages=pages, start_datetime=datetime(2026, 10, 2))
+        backfill.crawl_state = store.for_source("local")
+        await backfill.scrape()
+        assert backfill.fetched == ["a5", "a4", "a3", "a2"]
+        assert store.get("local", "ihsg", "search").covers_from == datetime(2026, 10, 2)
+
+
+async def test_a_link_whose_article_failed_is_fetched_again(tmp_path, listing_scraper):
+    class _Failing(listing_scraper):
+        async def get_article(self, link, keyword):
+            # what a scraper does after logging a timeout or a parse error
+            if not link.endswith("/a8"):
+                await super().get_article(link, keyword)
+
+    pages = [["a9", "a8"], ["a7", "a6"]]
+    with CrawlStateStore(tmp_path / "state.sqlite3") as store:
+        first = _Failing(pages=pages)
+        first.crawl_state = store.for_source("local")
+        await first.scrape()
+        assert "https://example.com/a8" not in store.get("local", "ihsg", "search").links
+
+        second = listing_scraper(pages=pages)
+        second.crawl_state = store.for_source("local")
+        await second.scrape()
+        assert second.fetched == ["a8"]
+
+
+async def test_a_run_that_does_not_complete_leaves_the_state_alone(tmp_path, listing_scraper):
+    class _Slow(listing_scraper):
+        async def get_article(self, link, keyword):
+            await asyncio.sleep(10)
+
+    with CrawlStateStore(tmp_path / "state.sqlite3") as store:
+        scraper = _Slow(pages=[["a9", "a8"]])
+        scraper.crawl_state = store.for_source("local")
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(scraper.scrape(), timeout=0.05)
+        assert store.get("local", "ihsg", "search") is None
+
+
+def test_cli_reset_needs_a_state_path(monkeypatch):
+    monkeypatch.delenv("NEWSWATCH_CRAWL_STATE", raising=False)
+    monkeypatch.setattr(sys, "argv", ["newswatch", "--crawl-state-reset"])
+    with pytest.raises(SystemExit):
+        cli_module.cli()
@@ -0,0 +1,190 @@
+"""Tests for cross-run link deduplication."""
+
+import asyncio
+import json
+
+import pytest
+
+from newswatch.dedup import (
+    BloomFilter,
+    LinkSet,
+    SeenLinkStore,
+    canonicalize_url,
+    iter_output_links,
+    link_key,
+)
+from newswatch.main import _load_dedup_links, write_jsonl
+
+
+def test_link_key_is_stable_signed_64_bit():
+    key = link_key("https://example.com/a")
+    assert key == link_key("https://example.com/a")
+    assert key != link_key("https://example.com/b")
+    assert -(2**63) <= key < 2**63
+
+
+@pytest.mark.parametrize(
+    "variant",
+    [
+        "http://www.kompas.com/read/2026/01/01/a",
+        "https://WWW.KOMPAS.COM/read/2026/01/01/a/",
+        "https://www.kompas.com/read/2026/01/01/a?page=all",
+        "https://www.kompas.com:443/read/2026/01/01/a?utm_source=x&utm_medium=y",
+        "https://www.kompas.com/read/2026/01/01/a?fbclid=abc#comments",
+    ],
+)
+def test_equivalent_urls_share_a_canonical_form(variant):
+    assert canonicalize_url(variant) == "www.kompas.com/read/2026/01/01/a"
+    assert link_key(variant) == link_key("https://www.kompas.com/read/2026/01/01/a")
+
+
+def test_canonicalization_keeps_meaningful_query_and_path_case():
+    assert canonicalize_url("https://x.com/a?id=2&b=1&gclid=z") == "x.com/a?b=1&id=2"
+    assert canonicalize_url("https://x.com/A") != canonicalize_url("https://x.com/a")
+
+
+@pytest.mark.parametrize("bloom_error_rate", [None, 0.01])
+def test_link_set_membership_across_buffer_merges(bloom_error_rate):
+    links = LinkSet.from_links(
+        (f"https://example.com/{i}" for i in range(100)),
+        bloom_error_rate=bloom_error_rate,
+    )
+    for i in range(100, 10_000):
+        links.add(f"https://example.com/{i}")
+    assert len(links) == 10_000
+    assert "http://example.com/9999/" in links
+    assert "https://example.com/10000" not in links
+    assert "" not in links
+    assert links.contains_many(
+        ["https://example.com/5", "https://example.com/x", "", "https://example.com/9999"]
+    ) == [True, False, False, True]
+
+
+def test_link_set_is_far_smaller_than_a_string_set():
+    links = LinkSet.from_links(f"https://example.com/{i}" for i in range(10_000))
+    assert links.nbytes <= 8 * 10_000
+
+
+def test_load_dedup_links_returns_canonical_link_set(tmp_path):
+    path = tmp_path / "previous.jsonl"
+    path.write_text(
+        json.dumps({"link": "https://example.com/a/"}) + "\n", encoding="utf-8"
+    )
+    links = _load_dedup_links(str(path))
+    assert isinstance(links, LinkSet)
+    assert "http://example.com/a" in links
+
+
+def test_bloom_filter_has_no_false_negatives_and_round_trips():
+    bloom = BloomFilter(1000)
+    keys = [link_key(f"https://example.com/{i}") for i in range(1000)]
+    for key in keys:
+        bloom.add(key)
+    assert all(key in bloom for key in keys)
+
+    restored = BloomFilter.from_bytes(bloom.to_bytes())
+    assert all(key in restored for key in keys)
+    misses = sum(link_key(f"https://other.com/{i}") in restored for i in range(1000))
+    assert misses < 50
+
+
+def test_seen_store_persists_across_opens(tmp_path):
+    path = tmp_path / "seen.db"
+    with SeenLinkStore(path) as store:
+        assert store.add("https://example.com/a") is True
+        assert store.add("https://example.com/a") is False
+        assert "https://example.com/a" in store
+        assert "https://example.com/b" not in store
+
+    with SeenLinkStore(path) as store:
+        assert "https://example.com/a" in store
+        assert len(store) == 1
+
+
+@pytest.mark.parametrize("bloom", [False, True])
+def test_seen_store_membership_with_and_without_bloom(tmp_path, bloom):
+    path = tmp_path / "seen.db"
+    with SeenLinkStore(path, bloom=bloom) as store:
+        store.update(f"https://example.com/{i}" for i in range(50))
+    with SeenLinkStore(path, bloom=bloom) as store:
+        assert all(f"https://example.com/{i}" in store for i in range(50))
+        assert "https://example.com/50" not in store
+
+
+def test_bloom_sidecar_is_rebuilt_when_store_changed_without_it(tmp_path):
+    path = tmp_path / "seen.db"
+    with SeenLinkStore(path, bloom=True) as store:
+        store.add("https://example.com/a")
+    # written by a run that did not use the Bloom filter
+    with SeenLinkStore(path) as store:
+        store.add("https://example.com/b")
+    with SeenLinkStore(path, bloom=True) as store:
+        assert "https://example.com/b" in store
+
+
+def test_build_from_imports_every_supported_format(tmp_path):
+    (tmp_path / "a.jsonl").write_text(
+        json.dumps({"link": "https://example.com/1"}) + "\n", encoding="utf-8"
+    )
+    (tmp_path / "b.json").write_text(
+        json.dumps([{"link": "https://example.com/2"}, {"link": ""}]), encoding="utf-8"
+    )
+    (tmp_path / "c.csv").write_text(
+        "title,link\nt,https://example.com/3\nt,https://example.com/1\n",
+        encoding="utf-8",
+    )
+    with SeenLinkStore(tmp_path / "seen.db") as store:
+        added = store.build_from(
+            [tmp_path / "a.jsonl", tmp_path / "b.json", tmp_path / "c.csv"]
+        )
+        assert added == 3
+        assert len(store) == 3
+
+
+def test_iter_output_links_rejects_unknown_format(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported dedup file format"):
+        list(iter_output_links(tmp_path / "out.txt"))
+
+
+def test_compact_drops_entries_older_than_max_age(tmp_path):
+    with SeenLinkStore(tmp_path / "seen.db", bloom=True) as store:
+        store.add("https://example.com/old")
+        store._conn.execute("UPDATE seen_links SET seen_at = 0")
+        store.add("https://example.com/new")
+        removed = store.compact(max_age_days=30)
+        assert removed == 1
+        assert "https://example.com/old" not in store
+        assert "https://example.com/new" in store
+
+
+async def test_scraper_skips_links_in_seen_store_before_fetching(tmp_path, listing_scraper):
+    with SeenLinkStore(tmp_path / "seen.db") as store:
+        store.add("https://example.com/a")
+        scraper = listing_scraper(pages=[["a", "b"]], max_pages=1)
+        scraper.seen_store = store
+        await scraper.fetch_search_results("ihsg")
+    assert scraper.fetched == ["b"]
+
+
+async def test_scraper_filters_canonical_duplicates_from_dedup_set(listing_scraper):
+    scraper = listing_scraper(pages=[["a", "b"]], max_pages=1)
+    scraper.dedup_links = LinkSet.from_links(["http://example.com/a/"])
+    await scraper.fetch_search_results("ihsg")
+    assert scraper.fetched == ["b"]
+
+
+async def test_writer_skips_seen_links_and_records_new_ones(tmp_path):
+    row = {"title": "t", "publish_date": "2026-01-17 00:00:00", "link": ""}
+    queue = asyncio.Queue()
+    await queue.put({**row, "link": "https://example.com/a"})
+    await queue.put({**row, "link": "https://example.com/b"})
+    await queue.put(None)
+
+    out_path = tmp_path / "out.jsonl"
+    with SeenLinkStore(tmp_path / "seen.db") as store:
+        store.add("https://example.com/a")
+        await write_jsonl(queue, "test", str(out_path), seen_store=store)
+        assert "https://example.com/b" in store
+
+    lines = out_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["link"] for line in lines] == ["https://example.com/b"]
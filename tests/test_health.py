@@ -53,6 +53,13 @@ class TestHealthReportToDataFrame:
         assert "slug" in df.columns
         assert "status" in df.columns
 
+    def test_fetch_stat_columns_always_present(self):
+        df = health_report_to_dataframe([{"slug": "kompas", "status": "skipped"}])
+        for column in ("requests", "bytes_downloaded", "latency_p95_ms",
+                       "article_seconds", "fallback_playwright", "parse_cpu_seconds",
+                       "slow_steps", "loop_lag_p95_ms", "loop_stalls"):
+            assert column in df.columns
+
 
 class TestHealthReportToFile:
     """Test file output."""
@@ -219,3 +226,151 @@ class TestAppendHealthHistory:
         runs = {json.loads(line)["run_id"] for line in lines}
         assert runs == {"r1", "r2"}
 
+
+
+def _fake_sources(monkeypatch, delays, browser=()):
+    """Register fake stable sources whose scrape() sleeps for delays[slug]."""
+    import asyncio
+    import importlib
+    from types import SimpleNamespace
+
+    running = {"now": 0, "max": 0}
+
+    def make_class(delay):
+        class _Fake:
+            def __init__(self, keywords, queue_=None, **kwargs):
+                self.queue_ = queue_
+
+            async def scrape(self, method="latest"):
+                running["now"] += 1
+                running["max"] = max(running["max"], running["now"])
+                try:
+                    await asyncio.sleep(delay)
+                    await self.queue_.put({"title": "t", "link": "https://example.com/a"})
+                finally:
+                    running["now"] -= 1
+
+        return _Fake
+
+    classes = {slug: {"class": make_class(d), "params": {}} for slug, d in delays.items()}
+    entries = {
+        slug: SimpleNamespace(
+            name=slug.title(), browser_required=slug in browser, strict_search=False,
+            supports_search=True, supports_latest=True, smoke_keyword="ihsg",
+        )
+        for slug in delays
+    }
+    monkeypatch.setattr("newswatch.health.get_available_scrapers", lambda method="latest": classes)
+    # patch the module health's function-level import will resolve, which
+    # is not necessarily newswatch.registry as bound on the package
+    # (tests/test_generate_sources.py re-executes registry.py)
+    registry = importlib.import_module("newswatch.registry")
+    monkeypatch.setattr(registry, "get_stable_scrapers", lambda: entries)
+    return running
+
+
+class TestParallelProbes:
+    """Probes run concurrently under the general/browser pool split."""
+
+    def test_probes_overlap_and_keep_requested_order(self, monkeypatch):
+        import time
+
+        _fake_sources(monkeypatch, {f"s{i}": 0.2 for i in range(5)})
+        start = time.perf_counter()
+        report = health_report(scrapers="s4,s3,s2,s1,s0")
+        assert time.perf_counter() - start < 0.8
+        assert [r["slug"] for r in report] == ["s4", "s3", "s2", "s1", "s0"]
+        assert all(r["status"] == "ok" for r in report)
+
+    def test_browser_sources_use_smaller_pool(self, monkeypatch):
+        browser = {f"b{i}" for i in range(4)}
+        running = _fake_sources(monkeypatch, {slug: 0.05 for slug in browser}, browser=browser)
+        health_report(scrapers="all", max_concurrent_scrapers=6)
+        assert running["max"] <= 2
+
+    def test_elapsed_excludes_pool_wait(self, monkeypatch):
+        _fake_sources(monkeypatch, {f"s{i}": 0.1 for i in range(4)})
+        report = health_report(scrapers="all", max_concurrent_scrapers=1)
+        assert all(r["elapsed_seconds"] < 0.3 for r in report)
+
+    def test_total_budget_records_cut_off_probes(self, monkeypatch):
+        _fake_sources(monkeypatch, {"fast": 0.01, "slow": 5, "queued": 0.01})
+        report = health_report(
+            scrapers="fast,slow,queued", max_concurrent_scrapers=1, total_budget=0.3
+        )
+        by_slug = {r["slug"]: r for r in report}
+        assert by_slug["fast"]["status"] == "ok"
+        assert by_slug["slow"]["status"] == "timeout"
+        assert by_slug["slow"]["name"] == "Slow"
+        assert by_slug["queued"]["status"] == "skipped"
+
+    def test_history_is_streamed_in_completion_order(self, monkeypatch, tmp_path):
+        _fake_sources(monkeypatch, {"slow": 0.3, "fast": 0.01})
+        path = tmp_path / "history.jsonl"
+        report = health_report(scrapers="slow,fast", history_path=path)
+        assert [r["slug"] for r in report] == ["slow", "fast"]
+        lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        assert [line["source"] for line in lines] == ["fast", "slow"]
+        assert len({line["run_id"] for line in lines}) == 1
+
+    def test_records_carry_loop_lag_for_their_window(self, monkeypatch):
+        from newswatch.loopmonitor import LAG_COLUMNS
+
+        _fake_sources(monkeypatch, {"a": 0.2, "b": 0.2})
+        report = health_report(scrapers="a,b")
+        for record in report:
+            assert set(LAG_COLUMNS) <= set(record)
+            assert record["loop_lag_max_ms"] is not None
+
+    def test_records_are_written_to_store(self, monkeypatch, tmp_path):
+        from newswatch.healthstore import HealthHistoryStore
+
+        _fake_sources(monkeypatch, {"a": 0.01, "b": 0.01})
+        health_report(scrapers="a,b", store_path=tmp_path / "h.db")
+        with HealthHistoryStore(tmp_path / "h.db") as store:
+            trends = store.trends()
+        assert sorted(t["source"] for t in trends) == ["a", "b"]
+
+
+async def test_probe_record_carries_fetch_stats(local_site):
+    from types import SimpleNamespace
+
+    from newswatch.health import _probe_source
+    from newswatch.scrapers.basescraper import BaseScraper
+
+    base = await local_site({"/latest": (200, "listing"), "/a": (200, "article")})
+
+    class _Scraper(BaseScraper):
+        base_url = base
+
+        async def build_latest_url(self, page):
+            return await self.fetch(f"{base}/latest")
+
+        def parse_latest_article_links(self, response_text):
+            return [f"{base}/a"]
+
+        async def build_search_url(self, keyword, page):
+            return None
+
+        def parse_article_links(self, response_text):
+            return None
+
+        async def get_article(self, link, keyword):
+            body = await self.fetch(link)
+            await self.queue_.put({"title": body, "link": link})
+            self._articles_collected += 1
+
+    entry = SimpleNamespace(
+        name="Example", browser_required=False, strict_search=False,
+        supports_search=True, supports_latest=True, smoke_keyword="ihsg",
+    )
+    record = await _probe_source(
+        "example", entry, {"class": _Scraper, "params": {}}, "latest", 5, 1, 1
+    )
+    assert record["status"] == "ok"
+    assert record["requests"] == 2
+    assert record["bytes_downloaded"] == len("listing") + len("article")
+    assert record["listing_seconds"] > 0
+    assert record["article_seconds"] > 0
+    assert record["latency_max_ms"] >= record["latency_p50_ms"]
+    assert record["parse_cpu_seconds"] >= 0
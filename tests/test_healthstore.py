@@ -0,0 +1,121 @@
+"""Tests for the indexed health history store."""
+
+import json
+from datetime import datetime, timedelta
+
+from newswatch.health import append_health_history, health_trends
+from newswatch.healthstore import HealthHistoryStore
+
+NOW = datetime(2026, 7, 20, 12, 0, 0)
+
+
+def _record(source, status, hours_ago, elapsed=1.0, run_id=None):
+    ts = (NOW - timedelta(hours=hours_ago)).isoformat()
+    return {
+        "timestamp": ts,
+        "run_id": run_id or f"run-{hours_ago}",
+        "source": source,
+        "status": status,
+        "count": 1 if status == "ok" else 0,
+        "elapsed_seconds": elapsed,
+        "name": source.title(),
+    }
+
+
+def _trends_by_source(store, **kwargs):
+    return {t["source"]: t for t in store.trends(now=NOW, **kwargs)}
+
+
+def test_success_rate_and_percentiles(tmp_path):
+    with HealthHistoryStore(tmp_path / "h.db") as store:
+        store.add_records(
+            [_record("kompas", "ok", h, elapsed=float(h)) for h in range(1, 21)]
+            + [_record("kompas", "timeout", 21, elapsed=30.0)]
+        )
+        kompas = _trends_by_source(store)["kompas"]
+    assert kompas["runs"] == 21
+    assert kompas["ok"] == 20
+    assert kompas["success_rate"] == round(20 / 21, 4)
+    assert kompas["p50_elapsed"] == 11.0
+    assert kompas["p95_elapsed"] == 20.0
+    assert kompas["name"] == "Kompas"
+
+
+def test_first_failure_marks_start_of_current_streak(tmp_path):
+    with HealthHistoryStore(tmp_path / "h.db") as store:
+        store.add_records([
+            _record("tempo", "error", 5),
+            _record("tempo", "ok", 4),
+            _record("tempo", "timeout", 3),
+            _record("tempo", "error", 2),
+            _record("detik", "error", 2),
+            _record("detik", "ok", 1),
+        ])
+        trends = _trends_by_source(store)
+    assert trends["tempo"]["first_failure_at"] == (NOW - timedelta(hours=3)).isoformat()
+    assert trends["tempo"]["last_status"] == "error"
+    assert trends["detik"]["first_failure_at"] is None
+
+
+def test_flapping_counts_transitions(tmp_path):
+    statuses = ["ok", "error", "ok", "timeout", "ok"]
+    with HealthHistoryStore(tmp_path / "h.db") as store:
+        store.add_records(
+            [_record("viva", s, 10 - i) for i, s in enumerate(statuses)]
+            + [_record("antara", "ok", h) for h in range(1, 6)]
+        )
+        trends = _trends_by_source(store, flap_threshold=3)
+    assert trends["viva"]["transitions"] == 4
+    assert trends["viva"]["flapping"] is True
+    assert trends["antara"]["flapping"] is False
+
+
+def test_window_and_unprobed_statuses_are_excluded(tmp_path):
+    with HealthHistoryStore(tmp_path / "h.db") as store:
+        store.add_records([
+            _record("kompas", "ok", 1),
+            _record("kompas", "error", 24 * 30),
+            _record("kompas", "skipped", 2),
+            _record("tirto", "unsupported", 1),
+        ])
+        trends = _trends_by_source(store, window_days=7)
+    assert set(trends) == {"kompas"}
+    assert trends["kompas"]["runs"] == 1
+
+
+def test_sync_jsonl_imports_once_then_only_new_lines(tmp_path):
+    history = tmp_path / "h.jsonl"
+    report = [{"slug": "kompas", "status": "ok", "article_count": 1, "elapsed_seconds": 1.0}]
+    append_health_history(report, history, run_id="r1")
+    append_health_history(report, history, run_id="r2")
+
+    with HealthHistoryStore(tmp_path / "h.db") as store:
+        assert store.sync_jsonl(history) == 2
+        assert store.sync_jsonl(history) == 0
+        append_health_history(report, history, run_id="r3")
+        with open(history, "a", encoding="utf-8") as f:
+            f.write("not json\n")
+            f.write(json.dumps({"run_id": "r4", "source": "x"}))  # no newline yet
+        assert store.sync_jsonl(history) == 1
+        assert len(store) == 3
+
+
+def test_direct_records_and_history_import_do_not_duplicate(tmp_path):
+    history = tmp_path / "h.jsonl"
+    report = [{"slug": "kompas", "status": "ok", "article_count": 1}]
+    append_health_history(report, history, run_id="r1", timestamp=NOW.isoformat())
+    with HealthHistoryStore(tmp_path / "h.db") as store:
+        store.add_records([{**_record("kompas", "ok", 0), "run_id": "r1"}])
+        assert store.sync_jsonl(history) == 0
+        assert len(store) == 1
+
+
+def test_health_trends_syncs_history(tmp_path):
+    history = tmp_path / "h.jsonl"
+    append_health_history(
+        [{"slug": "kompas", "status": "ok", "article_count": 1, "elapsed_seconds": 2.0}],
+        history,
+    )
+    trends = health_trends(tmp_path / "h.db", history_path=history)
+    assert [t["source"] for t in trends] == ["kompas"]
+    assert trends[0]["success_rate"] == 1.0
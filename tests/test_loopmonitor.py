@@ -0,0 +1,123 @@
+"""Tests for the event-loop lag monitor and slow-step attribution."""
+
+import asyncio
+import time
+from argparse import Namespace
+from types import SimpleNamespace
+
+from newswatch import main as main_module
+from newswatch.loopmonitor import (
+    LAG_COLUMNS,
+    LoopMonitor,
+    format_loop_report,
+    slow_step_report,
+)
+from newswatch.main import main
+from newswatch.utils import SLOW_STEP_SECONDS, CpuTimed, FetchStats
+
+
+async def _blocking_article(seconds):
+    await asyncio.sleep(0)
+    time.sleep(seconds)  # parse work that never yields
+    await asyncio.sleep(0)
+    return "done"
+
+
+async def test_cpu_timed_records_slow_steps_against_their_phase():
+    stats = FetchStats()
+    assert await CpuTimed(_blocking_article(SLOW_STEP_SECONDS + 0.02), stats, "get_article") == "done"
+    await CpuTimed(_blocking_article(0), stats, "listing")
+
+    summary = stats.summary()
+    assert summary["slow_steps"] == 1
+    assert summary["slow_step_phase"] == "get_article"
+    assert summary["slow_step_max_ms"] >= SLOW_STEP_SECONDS * 1000
+    assert summary["slow_step_seconds"] >= SLOW_STEP_SECONDS
+
+
+def test_fetch_stats_without_slow_steps_has_no_phase():
+    summary = FetchStats().summary()
+    assert summary["slow_steps"] == 0
+    assert summary["slow_step_phase"] is None
+
+
+async def test_loop_monitor_measures_stalls_within_a_window():
+    loop = asyncio.get_running_loop()
+    async with LoopMonitor(interval=0.01, stall_seconds=0.05) as monitor:
+        await asyncio.sleep(0.03)
+        blocked_at = loop.time()
+        time.sleep(0.08)
+        await asyncio.sleep(0.03)
+
+    overall = monitor.summary()
+    assert set(overall) == set(LAG_COLUMNS)
+    assert overall["loop_stalls"] >= 1
+    assert overall["loop_lag_max_ms"] >= 50
+
+    before = monitor.summary(until=blocked_at - 0.011)
+    assert before["loop_stalls"] == 0
+
+
+def test_empty_monitor_summary_has_no_percentiles():
+    summary = LoopMonitor().summary()
+    assert summary == {
+        "loop_lag_p50_ms": None,
+        "loop_lag_p95_ms": None,
+        "loop_lag_max_ms": None,
+        "loop_stalls": 0,
+    }
+
+
+def test_slow_step_report_ranks_scrapers_by_time_held():
+    quick, slow, clean = FetchStats(), FetchStats(), FetchStats()
+    quick.record_slow_step("listing", 0.15)
+    slow.record_slow_step("get_article", 0.4)
+    slow.record_slow_step("get_article", 0.3)
+    slow.record_slow_step("listing", 0.12)
+
+    rows = slow_step_report([
+        ("quick", SimpleNamespace(fetch_stats=quick)),
+        ("clean", SimpleNamespace(fetch_stats=clean)),
+        ("stub", object()),
+        ("slow", SimpleNamespace(fetch_stats=slow)),
+    ])
+
+    assert [row["name"] for row in rows] == ["slow", "quick"]
+    assert rows[0]["slow_steps"] == 3
+    assert rows[0]["slow_step_phase"] == "get_article"
+    assert rows[0]["slow_step_max_ms"] == 400
+
+    report = format_loop_report(LoopMonitor().summary(), rows)
+    assert "stall(s)" in report
+    assert report.index("slow") < report.index("quick")
+
+
+async def test_main_prints_loop_report_when_enabled(tmp_path, monkeypatch, capsys):
+    class _Blocking:
+        def __init__(self, keywords, start_date=None, queue_=None, **kwargs):
+            self.fetch_stats = FetchStats()
+
+        async def scrape(self, method="search"):
+            await CpuTimed(_blocking_article(SLOW_STEP_SECONDS + 0.02), self.fetch_stats, "get_article")
+
+    monkeypatch.setattr(
+        main_module,
+        "get_available_scrapers",
+        lambda method="search": {"blocker": {"class": _Blocking, "params": {}}},
+    )
+    monkeypatch.setattr(
+        main_module, "get_scraper_by_slug", lambda slug: SimpleNamespace(browser_required=False)
+    )
+
+    await main(Namespace(
+        keywords="test",
+        start_date=None,
+        scrapers="all",
+        output_path=str(tmp_path / "out.csv"),
+        output_format="csv",
+        loop_monitor=True,
+    ))
+
+    out = capsys.readouterr().out
+    assert "Event loop lag:" in out
+    assert "blocker" in out and "get_article" in out
@@ -0,0 +1,172 @@
+"""Tests for the Prometheus-style metrics registry and exporters."""
+
+import asyncio
+import sys
+import time
+import urllib.error
+import urllib.request
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from newswatch import metrics
+from newswatch.loopmonitor import LoopMonitor
+from newswatch.utils import ArticleQueue, AsyncScraper
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry():
+    metrics.REGISTRY.clear()
+    yield
+    metrics.REGISTRY.clear()
+
+
+def _sample(text, line_prefix):
+    for line in text.splitlines():
+        if line.startswith(line_prefix + " "):
+            return float(line.rsplit(" ", 1)[1])
+    return None
+
+
+def test_render_counter_and_histogram_in_exposition_format():
+    registry = metrics.MetricsRegistry()
+    counter = registry.register(metrics.Counter("c_total", "A counter.", ("host",)))
+    histogram = registry.register(metrics.Histogram("h_seconds", "A histogram.", buckets=(0.1, 1)))
+    counter.labels('a"b').inc()
+    counter.labels('a"b').inc(2)
+    for value in (0.05, 0.5, 5):
+        histogram.observe(value)
+
+    text = registry.render()
+    assert "# TYPE c_total counter" in text
+    assert 'c_total{host="a\\"b"} 3' in text
+    assert 'h_seconds_bucket{le="0.1"} 1' in text
+    assert 'h_seconds_bucket{le="1"} 2' in text
+    assert 'h_seconds_bucket{le="+Inf"} 3' in text
+    assert "h_seconds_count 3" in text
+    assert _sample(text, "h_seconds_sum") == pytest.approx(5.55)
+
+
+def test_labels_must_match_label_names():
+    with pytest.raises(ValueError, match="expects labels"):
+        metrics.HTTP_REQUESTS.labels("example.com").inc()
+
+
+async def test_fetch_counts_requests_by_host_status_and_transport(local_site):
+    blocked = "<!doctype html><html><body>Just a moment...</body></html>"
+    base = await local_site({"/ok": (200, "ok"), "/blocked": (200, blocked)})
+    scraper = AsyncScraper()
+    with patch("newswatch.utils._rnet_get", AsyncMock(return_value=None)), patch(
+        "newswatch.utils._playwright_get", AsyncMock(return_value=None)
+    ):
+        async with scraper:
+            await scraper.fetch(f"{base}/ok")
+            await scraper.fetch(f"{base}/blocked")
+
+    text = metrics.render()
+    host = metrics.host_of(base)
+    assert _sample(text, f'newswatch_http_requests_total{{host="{host}",status="200",transport="aiohttp"}}') == 2
+    assert _sample(text, f'newswatch_http_requests_total{{host="{host}",status="failed",transport="rnet"}}') == 1
+    assert _sample(text, f'newswatch_blocked_pages_total{{host="{host}",transport="aiohttp"}}') == 1
+    assert _sample(text, f'newswatch_http_request_duration_seconds_count{{host="{host}",transport="aiohttp"}}') == 2
+
+
+async def test_retries_are_counted_per_host(local_site):
+    base = await local_site({"/a": [(503, ""), (200, "ok")]})
+    scraper = AsyncScraper(max_retries=1)
+    with patch("newswatch.utils.asyncio.sleep", AsyncMock()):
+        async with scraper:
+            await scraper.fetch(f"{base}/a")
+    text = metrics.render()
+    host = metrics.host_of(base)
+    assert _sample(text, f'newswatch_http_retries_total{{host="{host}"}}') == 1
+    assert _sample(text, f'newswatch_http_requests_total{{host="{host}",status="503",transport="aiohttp"}}') == 1
+
+
+async def test_queue_metrics_track_depth_lag_and_emitted_articles():
+    queue = ArticleQueue()
+    await queue.put({"source": "kompas", "link": "a"})
+    await queue.put({"source": "kompas", "link": "b"})
+    await queue.put(None)
+    await asyncio.sleep(0.02)
+
+    text = metrics.render()
+    assert _sample(text, 'newswatch_articles_emitted_total{source="kompas"}') == 2
+    assert _sample(text, "newswatch_queue_depth") >= 3
+    assert _sample(text, "newswatch_writer_lag_seconds") >= 0.02
+
+    while await queue.get() is not None:
+        pass
+    text = metrics.render()
+    assert _sample(text, "newswatch_queue_wait_seconds_count") == 2
+    del queue
+
+
+async def test_loop_monitor_feeds_event_loop_lag_histogram():
+    async with LoopMonitor(interval=0.01):
+        await asyncio.sleep(0.005)
+        time.sleep(0.05)  # block the loop
+        await asyncio.sleep(0.03)
+    text = metrics.render()
+    assert _sample(text, "newswatch_event_loop_lag_seconds_count") >= 1
+    assert _sample(text, "newswatch_event_loop_lag_seconds_sum") >= 0.03
+
+
+def test_loop_monitor_only_runs_for_a_run_while_exporting(tmp_path):
+    async def probe():
+        monitor = LoopMonitor.for_run()
+        if monitor is not None:
+            await monitor.stop()
+        return monitor
+
+    assert asyncio.run(probe()) is None
+    with metrics.TextfileExporter(tmp_path / "m.prom", interval=60):
+        assert metrics.is_exporting()
+        assert asyncio.run(probe()) is not None
+    assert not metrics.is_exporting()
+
+
+def test_textfile_exporter_writes_periodically_and_on_stop(tmp_path):
+    path = tmp_path / "newswatch.prom"
+    metrics.ARTICLES_EMITTED.labels("tempo").inc()
+    with metrics.TextfileExporter(path, interval=0.01):
+        for _ in range(200):
+            if path.exists():
+                break
+            time.sleep(0.01)
+        assert path.exists()
+        metrics.ARTICLES_EMITTED.labels("tempo").inc()
+    assert _sample(path.read_text(encoding="utf-8"), 'newswatch_articles_emitted_total{source="tempo"}') == 2
+    assert [p.name for p in tmp_path.iterdir()] == ["newswatch.prom"]
+
+
+def test_http_server_serves_metrics():
+    metrics.ARTICLES_EMITTED.labels("detik").inc()
+    server = metrics.start_http_server(0, addr="127.0.0.1")
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as resp:
+            assert resp.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            body = resp.read().decode("utf-8")
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/other", timeout=5)
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert 'newswatch_articles_emitted_total{source="detik"} 1' in body
+    assert not metrics.is_exporting()
+
+
+def test_cli_metrics_file_is_written_after_the_run(monkeypatch, tmp_path):
+    from newswatch.cli import cli
+
+    path = tmp_path / "newswatch.prom"
+    monkeypatch.setattr(sys, "argv", ["cli.py", "--keywords", "ihsg", "--metrics-file", str(path)])
+
+    async def fake_main(args):
+        assert metrics.is_exporting()
+        metrics.ARTICLES_EMITTED.labels("kompas").inc()
+
+    with patch("newswatch.main.main", side_effect=fake_main):
+        cli()
+    assert 'newswatch_articles_emitted_total{source="kompas"} 1' in path.read_text(encoding="utf-8")
@@ -0,0 +1,70 @@
+"""Tests for the DOM-free article metadata extractor."""
+
+import json
+from datetime import datetime
+
+from newswatch.pagemeta import page_metadata
+
+_BODY = "Paragraf pembuka berita yang cukup panjang untuk dianggap artikel utuh. " * 4
+
+
+def _page(ld, head="", body=""):
+    return (
+        "<!doctype html><html><head>"
+        f"{head}"
+        f'<script type="application/ld+json">{json.dumps(ld)}</script>'
+        f"</head><body>{body}</body></html>"
+    )
+
+
+def test_reads_the_article_node_of_a_graph():
+    page = _page({
+        "@context": "https://schema.org",
+        "@graph": [
+            {"@type": "WebSite", "name": "Situs"},
+            {
+                "@type": ["NewsArticle"],
+                "headline": "Judul &amp; berita",
+                "datePublished": "2026-07-12T03:00:00Z",
+                "author": [{"@type": "Person", "name": "Reporter A"}, {"name": "Reporter B"}],
+                "articleSection": ["Ekonomi", "Bisnis"],
+                "articleBody": f"<p>{_BODY}</p>",
+            },
+        ],
+    })
+    meta = page_metadata(page)
+    assert meta.title == "Judul & berita"
+    assert meta.published == datetime(2026, 7, 12, 10, 0)
+    assert meta.author == "Reporter A"
+    assert meta.section == "Ekonomi"
+    assert meta.body == _BODY.strip()
+    assert meta.has("title", "published", "author", "section", "body")
+
+
+def test_falls_back_to_head_meta_tags_and_ignores_body_ones():
+    page = _page(
+        {"@type": "Organization", "name": "Situs"},
+        head=(
+            "<meta property='og:title' content='Judul dari OG'>"
+            '<meta name="author" content="Redaksi">'
+            '<meta content="2026-07-12T10:00:00+07:00" property="article:published_time">'
+            '<meta property=article:section content=Hukum>'
+        ),
+        body='<meta property="og:title" content="bukan ini">',
+    )
+    meta = page_metadata(page)
+    assert (meta.title, meta.author, meta.section) == ("Judul dari OG", "Redaksi", "Hukum")
+    assert meta.published == datetime(2026, 7, 12, 10, 0)
+    assert meta.tag("missing", "og:title") == "Judul dari OG"
+
+
+def test_a_teaser_body_or_broken_json_counts_as_missing():
+    page = (
+        '<script type="application/ld+json">{"@type": "NewsArticle", oops}</script>'
+        + _page({"@type": "NewsArticle", "headline": "Judul", "articleBody": "Singkat."})
+    )
+    meta = page_metadata(page)
+    assert meta.title == "Judul"
+    assert meta.body == ""
+    assert not meta.has("title", "body")
+    assert page_metadata("").published is None
@@ -0,0 +1,117 @@
+"""Tests for per-scraper profiling."""
+
+import asyncio
+import json
+import pstats
+import sys
+from unittest.mock import patch
+
+from newswatch import profiling
+from newswatch.cli import cli
+from newswatch.utils import CpuTimed, FetchStats
+
+
+def parse_alpha(n):
+    return sum(i * i for i in range(n))
+
+
+def parse_beta(n):
+    return sorted(str(i) for i in range(n))
+
+
+async def _scrape(parse, rounds=5):
+    for _ in range(rounds):
+        parse(20_000)
+        await asyncio.sleep(0)
+
+
+def _functions(stats):
+    return {name for _, _, name in stats.stats}
+
+
+async def _interleaved():
+    await asyncio.gather(
+        CpuTimed(_scrape(parse_alpha), FetchStats("AlphaScraper")),
+        CpuTimed(_scrape(parse_beta), FetchStats("BetaScraper")),
+    )
+
+
+def test_interleaved_scrapers_get_separate_profiles(tmp_path):
+    with profiling.profile(tmp_path) as session:
+        asyncio.run(_interleaved())
+
+    alpha = session.profiles["AlphaScraper"].stats()
+    beta = session.profiles["BetaScraper"].stats()
+    assert "parse_alpha" in _functions(alpha) and "parse_alpha" not in _functions(beta)
+    assert "parse_beta" in _functions(beta) and "parse_beta" not in _functions(alpha)
+    # one step per round plus the final one that returns
+    assert session.profiles["AlphaScraper"].steps == 6
+
+    summary = session.summary()
+    assert {row["name"] for row in summary["scrapers"]} == {"AlphaScraper", "BetaScraper"}
+    assert all(row["cpu_seconds"] > 0 for row in summary["scrapers"])
+    assert len(summary["functions"]) <= session.top
+    assert "Profile by scraper" in session.summary_text
+
+
+def test_profile_writes_pstats_collapsed_and_speedscope(tmp_path):
+    with profiling.profile(tmp_path) as session:
+        asyncio.run(_interleaved())
+
+    suffixes = sorted("".join(path.suffixes[-2:]) for path in session.files)
+    assert all(path.exists() for path in session.files)
+    assert sum(s.endswith(".pstats") for s in suffixes) == 3  # combined + two scrapers
+
+    combined = pstats.Stats(str(session.files[0]))
+    assert {"parse_alpha", "parse_beta"} <= _functions(combined)
+
+    collapsed = next(p for p in session.files if p.suffix == ".collapsed").read_text()
+    lines = [line.rsplit(" ", 1) for line in collapsed.splitlines()]
+    assert all(int(weight) > 0 for _, weight in lines)
+    assert any(stack.startswith("AlphaScraper;") and "parse_alpha" in stack for stack, _ in lines)
+
+    speedscope = json.loads(next(p for p in session.files if p.name.endswith(".speedscope.json")).read_text())
+    assert [p["name"] for p in speedscope["profiles"]] == ["AlphaScraper", "BetaScraper"]
+    frames = speedscope["shared"]["frames"]
+    for prof in speedscope["profiles"]:
+        assert len(prof["samples"]) == len(prof["weights"])
+        assert all(0 <= i < len(frames) for sample in prof["samples"] for i in sample)
+
+
+async def test_nothing_is_profiled_outside_a_session():
+    stats = FetchStats("AlphaScraper")
+    await CpuTimed(_scrape(parse_alpha, rounds=1), stats)
+    assert profiling.profiler_for("AlphaScraper") is None
+    assert stats.parse_cpu_seconds > 0
+
+
+def test_collapsed_stacks_split_time_by_caller_share():
+    main = ("m.py", 1, "main")
+    a = ("m.py", 10, "a")
+    b = ("m.py", 20, "b")
+    leaf = ("m.py", 30, "leaf")
+    entries = {
+        main: (1, 1, 0.1, 1.1, {}),
+        a: (1, 1, 0.0, 0.3, {main: (1, 1, 0.0, 0.3)}),
+        b: (1, 1, 0.0, 0.9, {main: (1, 1, 0.0, 0.9)}),
+        # leaf: 0.3s from a, 0.6s from b
+        leaf: (3, 3, 0.9, 0.9, {a: (1, 1, 0.3, 0.3), b: (2, 2, 0.6, 0.6)}),
+    }
+    stacks = profiling.collapsed_stacks(entries, root="S")
+    assert stacks[("S", "main (m.py:1)")] == 0.1
+    assert round(stacks[("S", "main (m.py:1)", "a (m.py:10)", "leaf (m.py:30)")], 6) == 0.3
+    assert round(stacks[("S", "main (m.py:1)", "b (m.py:20)", "leaf (m.py:30)")], 6) == 0.6
+
+
+def test_cli_profile_prints_summary_and_writes_files(monkeypatch, capsys, tmp_path):
+    monkeypatch.setattr(sys, "argv", ["cli.py", "--keywords", "ihsg", "--profile", str(tmp_path)])
+
+    async def fake_main(args):
+        await _interleaved()
+
+    with patch("newswatch.main.main", side_effect=fake_main):
+        cli()
+    out = capsys.readouterr().out
+    assert "Profile by scraper" in out and "AlphaScraper" in out
+    assert f"Profiles written to {tmp_path}" in out
+    assert list(tmp_path.glob("profile-*.speedscope.json"))
@@ -7,6 +7,7 @@ from newswatch.registry import (
     build_registry,
     get_available_scrapers_from_registry,
     get_latest_scrapers,
+    get_method_slugs,
     get_search_scrapers,
     validate_registry,
 )
@@ -49,7 +50,7 @@ def test_search_false_requires_strict_false():
 
 def test_validate_registry_clean():
     """validate_registry must report no issues: every scraper file is registered and every class imports."""
-    issues = validate_registry()
+    issues = validate_registry(import_modules=True)
     assert not issues, "Registry validation issues:\n" + "\n".join(issues)
 
 
@@ -71,4 +72,56 @@ def test_available_scrapers_import_every_capability_entry(method):
 
     assert set(available) == set(entries)
     for slug, loaded in available.items():
-        assert loaded["class"].__name__ == entries[slug].class_name
\ No newline at end of file
+        assert loaded["class"].__name__ == entries[slug].class_name
+
+@pytest.mark.parametrize("method", ("search", "latest"))
+def test_method_slugs_match_loaded_scrapers_in_order(method):
+    assert get_method_slugs(method) == list(get_available_scrapers_from_registry(method))
+
+
+def test_validate_registry_finds_classes_without_importing(monkeypatch):
+    import importlib
+
+    registry = importlib.import_module("newswatch.registry")
+
+    monkeypatch.setattr(registry, "load_scraper_class", None)
+    assert registry.validate_registry() == []
+    manifest = registry.scraper_manifest()
+    assert "KompasScraper" in manifest["kompas"]
+    assert "build_search_url" in manifest["kompas"]["KompasScraper"]
+
+
+def test_scraper_classes_import_only_the_slugs_looked_up():
+    import subprocess
+    import sys
+
+    probe = (
+        "import sys\n"
+        "from newswatch.registry import get_available_scrapers_from_registry\n"
+        "classes = get_available_scrapers_from_registry('search')\n"
+        "assert 'kompas' in classes and len(classes) > 1\n"
+        "assert classes['kompas']['class'].__name__ == 'KompasScraper'\n"
+        "print(sorted(m for m in sys.modules if m.startswith('newswatch.scrapers.')))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    ).stdout
+    assert out.strip() == "['newswatch.scrapers.basescraper', 'newswatch.scrapers.kompas']"
+
+
+def test_scraper_classes_treat_a_broken_module_as_missing(monkeypatch):
+    import importlib
+    from unittest.mock import patch
+
+    # resolve through sys.modules: test_generate_sources re-executes registry.py
+    registry = importlib.import_module("newswatch.registry")
+
+    def broken(entry):
+        raise ImportError("no module named 'somedependency'")
+
+    monkeypatch.setattr(registry, "load_scraper_class", broken)
+    classes = registry.get_available_scrapers_from_registry("search")
+    with patch.object(registry.logging, "warning") as warning:
+        assert "kompas" in classes
+        assert classes.get("kompas") is None
+    assert "Failed to load scraper 'kompas'" in warning.call_args[0][0]
@@ -2468,6 +2468,21 @@ class TestGNFIFocus:
         await s.get_article(link, "bali")
         assert s.queue_.qsize() == 0
 
+    @pytest.mark.asyncio
+    async def test_article_before_start_date_is_dropped_without_a_soup(self, monkeypatch):
+        import newswatch.scrapers.gnfi as gnfi_module
+
+        def no_soup(*args, **kwargs):
+            raise AssertionError("soup built for an out-of-window article")
+
+        monkeypatch.setattr(gnfi_module, "BeautifulSoup", no_soup)
+        link = "https://www.goodnewsfromindonesia.id/2026/07/12/test-article"
+        s = GNFIScraper(keywords="bali", start_date=datetime(2026, 8, 1), queue_=asyncio.Queue())
+        _attach_fetch(s, {link: _gnfi_article_html()})
+        await s.get_article(link, "bali")
+        assert s.queue_.qsize() == 0
+        assert s.continue_scraping is False
+
 
 def _betahita_search_html() -> str:
     return """<!doctype html><html><body>
@@ -3087,6 +3102,41 @@ class TestHukumonlineFocus:
         # article:section meta wins because JSON-LD omitted articleSection.
         assert item["category"] == "Bisnis"
 
+    @pytest.mark.asyncio
+    async def test_complete_jsonld_is_taken_without_a_soup(self, monkeypatch):
+        import newswatch.scrapers.hukumonline as hukumonline_module
+
+        def no_soup(*args, **kwargs):
+            raise AssertionError("soup built although the JSON-LD had every field")
+
+        monkeypatch.setattr(hukumonline_module, "BeautifulSoup", no_soup)
+        body = "Paragraf berita Hukumonline yang dimuat utuh dalam articleBody. " * 5
+        ld_payload = json.dumps({
+            "@context": "https://schema.org",
+            "@type": "NewsArticle",
+            "datePublished": "2026-07-12T10:00:00+07:00",
+            "articleSection": "Hukum",
+            "author": {"@type": "Person", "name": "Hukumonline Reporter"},
+            "articleBody": body,
+        })
+        link = "https://www.hukumonline.com/berita/a/jsonld-only"
+        html = (
+            '<!doctype html><html><head>'
+            '<meta property="og:title" content="Hukumonline test headline">'
+            f'<script type="application/ld+json">{ld_payload}</script>'
+            '</head><body><article><p>DOM copy of the body.</p></article></body></html>'
+        )
+        s = HukumonlineScraper(keywords="hukum", queue_=asyncio.Queue())
+        _attach_fetch(s, {link: html})
+        await s.get_article(link, "hukum")
+
+        item = s.queue_.get_nowait()
+        assert (item["title"], item["author"], item["category"]) == (
+            "Hukumonline test headline", "Hukumonline Reporter", "Hukum",
+        )
+        assert item["publish_date"] == datetime(2026, 7, 12, 10, 0)
+        assert item["content"] == body.strip()
+
 
 def _independen_article_html() -> str:
     return """<!doctype html><html><head>
@@ -4037,7 +4087,7 @@ class TestABCNewsFocus:
     def test_search_applies_every_token_keyword_gate(self):
         s = self._scraper()
         s._current_keyword = "police reform"
-        assert s.parse_article_links(_abcnews_feed_xml()) == [
+        assert [link for link, _date in s.parse_article_links(_abcnews_feed_xml())] == [
             f"{self.BASE}/Politics/wireStory/police-reform-bill-advances-135112211"
         ]
         s._current_keyword = "marathon nonexistent"
@@ -4051,10 +4101,22 @@ class TestABCNewsFocus:
     def test_start_date_cutoff_applies_before_any_article_fetch(self):
         s = self._scraper(start_date=datetime(2026, 7, 27))
         s._current_keyword = ""
-        links = s.parse_latest_article_links(_abcnews_feed_xml())
+        links, past_start, _ = s._in_window(s.parse_latest_article_links(_abcnews_feed_xml()))
         assert links == [
             f"{self.BASE}/Politics/wireStory/police-reform-bill-advances-135112211"
         ]
+        assert past_start
+
+    def test_only_in_window_entries_count_toward_the_cap(self):
+        s = self._scraper()
+        s.end_datetime = datetime(2026, 7, 1)
+        s._current_keyword = ""
+        entries = [
+            (f"{self.BASE}/US/story/new-{i}", "", datetime(2026, 7, 20)) for i in range(30)
+        ] + [(f"{self.BASE}/US/story/old-{i}", "", datetime(2026, 6, 30)) for i in range(2)]
+        links, _, too_new = s._in_window(s.parse_latest_article_links(entries))
+        assert links == [f"{self.BASE}/US/story/old-0", f"{self.BASE}/US/story/old-1"]
+        assert len(too_new) == 30
 
     @pytest.mark.asyncio
     async def test_search_url_returns_feed_on_page_one_only(self):
@@ -4456,6 +4518,66 @@ class TestDetikIndexPage:
 
         assert any("capped at" in r.getMessage() for r in caplog.records)
 
+    @pytest.mark.asyncio
+    async def test_days_and_hosts_are_read_at_once_and_articles_overlap_the_index(self):
+        """Index pages of several channel-days are in flight together, and a
+        matched article is fetched while the index is still being read."""
+        scraper = DetikScraper(keywords="mbg", start_date=datetime(2026, 8, 1), queue_=asyncio.Queue())
+        scraper.index_newest_day = datetime(2026, 8, 4).date()
+        scraper.INDEX_CHUNK = 1
+        in_flight: set[str] = set()
+        peak = 0
+        index_pending_at_article: list[int] = []
+
+        async def fake_fetch(url, **kwargs):
+            nonlocal peak
+            in_flight.add(url)
+            peak = max(peak, len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.discard(url)
+            host = url.split("//")[1].split(".")[0]
+            day = url.rsplit("date=", 1)[1][3:5]
+            if "page=1&" not in url:
+                return None
+            return self._page([self._card(f"https://{host}.detik.com/berita/d-{day}/mbg-{host}/", "MBG")])
+
+        async def fake_article(link, keyword):
+            index_pending_at_article.append(len(in_flight))
+
+        scraper.fetch = fake_fetch
+        scraper.get_article = fake_article
+        await scraper._walk_indeks("mbg")
+
+        assert len(index_pending_at_article) == 12  # 4 days x 3 hosts
+        assert peak > len(scraper.INDEX_HOSTS)
+        assert any(index_pending_at_article)
+
+    @pytest.mark.asyncio
+    async def test_page_cap_is_counted_per_channel_day(self, caplog):
+        scraper = DetikScraper(keywords="mbg", start_date=datetime(2026, 8, 3), queue_=asyncio.Queue())
+        scraper.index_newest_day = datetime(2026, 8, 4).date()
+        scraper.MAX_INDEX_PAGES_PER_DAY = 3
+        _attach_fetch(scraper, {"indeks": self._page([self._card("https://news.detik.com/berita/d-1/x/", "X")])})
+        with caplog.at_level(logging.WARNING):
+            await scraper._walk_indeks("mbg")
+
+        assert any("on 6 channel-days" in r.getMessage() for r in caplog.records)
+
+    @pytest.mark.asyncio
+    async def test_finished_days_are_skipped_on_resume(self, tmp_path):
+        from newswatch.checkpoint import RunCheckpoint
+
+        scraper = DetikScraper(keywords="mbg", start_date=datetime(2026, 8, 3), queue_=asyncio.Queue())
+        scraper.index_newest_day = datetime(2026, 8, 4).date()
+        stub = _attach_fetch(scraper, {})
+        with RunCheckpoint(tmp_path, "run") as run:
+            run.for_source("detik").finish("mbg", "window:2026-08-04/2026-08-04")
+            scraper.checkpoint = run.for_source("detik")
+            await scraper._walk_indeks("mbg")
+            assert run.is_done("detik", "mbg", "window:2026-08-03/2026-08-03")
+
+        assert stub.calls and all("date=08/03/2026" in url for url, _, _ in stub.calls)
+
     def test_resume_knob_moves_the_starting_day(self, monkeypatch):
         monkeypatch.setenv("NEWSWATCH_DETIK_INDEX_NEWEST", "2025-08-11")
         assert self._scraper().index_newest_day == datetime(2025, 8, 11).date()
@@ -198,11 +198,9 @@ async def test_api_collector_keeps_row_with_aware_timestamp():
     queue = asyncio.Queue()
     await queue.put(dict(_AWARE_ITEM))
     await queue.put(None)
-    done = asyncio.Event()
-    done.set()
 
     results = await _collect_queue_results(
-        queue, done, time_range=_parse_time_range("2026-07-27/2026-07-27")
+        queue, time_range=_parse_time_range("2026-07-27/2026-07-27")
     )
     assert len(results) == 1
     assert results[0]["link"] == _AWARE_ITEM["link"]
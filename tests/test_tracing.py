@@ -0,0 +1,116 @@
+"""Tests for tracing spans and their exporters."""
+
+import asyncio
+import json
+
+from newswatch import tracing
+from newswatch.scrapers.basescraper import BaseScraper
+from newswatch.utils import ArticleQueue
+
+
+def test_span_is_a_noop_while_tracing_is_off():
+    assert tracing.get_tracer() is None
+    with tracing.span("fetch", url="https://example.com") as span:
+        span.set_attribute("status", 200)
+    assert span is tracing.NOOP_SPAN
+
+
+async def test_spans_nest_across_tasks():
+    with tracing.recording() as tracer:
+        with tracing.span("listing") as parent:
+
+            async def child():
+                with tracing.span("get_article"):
+                    await asyncio.sleep(0)
+
+            await asyncio.gather(child(), child())
+    assert tracing.get_tracer() is None
+    children = [s for s in tracer.spans if s.name == "get_article"]
+    assert len(children) == 2
+    assert all(s.parent_id == parent.span_id for s in children)
+    # each task draws on its own track
+    assert len({s.track for s in children}) == 2
+    assert parent.track not in {s.track for s in children}
+
+
+async def test_span_records_exception_type():
+    with tracing.recording() as tracer:
+        try:
+            with tracing.span("fetch"):
+                raise TimeoutError
+        except TimeoutError:
+            pass
+    assert tracer.spans[0].attributes["error"] == "TimeoutError"
+
+
+async def test_queue_records_wait_under_producing_span():
+    queue = ArticleQueue()
+    with tracing.recording() as tracer:
+        with tracing.span("get_article") as producer:
+            await queue.put({"link": "https://example.com/a"})
+        await queue.put(None)
+        assert (await queue.get())["link"] == "https://example.com/a"
+        assert await queue.get() is None
+    (wait,) = [s for s in tracer.spans if s.name == "queue.wait"]
+    assert wait.parent_id == producer.span_id
+    assert wait.attributes["link"] == "https://example.com/a"
+    assert wait.end_ns >= wait.start_ns
+
+
+async def test_queue_without_tracing_is_a_plain_fifo():
+    queue = ArticleQueue()
+    for item in ({"link": "a"}, {"link": "b"}, None):
+        queue.put_nowait(item)
+    assert queue.qsize() == 3
+    assert [queue.get_nowait() for _ in range(3)] == [{"link": "a"}, {"link": "b"}, None]
+
+
+class _Scraper(BaseScraper):
+    def __init__(self, base, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.base = base
+        self.base_url = base
+
+    async def build_search_url(self, keyword, page):
+        return await self.fetch(f"{self.base}/search")
+
+    def parse_article_links(self, response_text):
+        return [f"{self.base}/a", f"{self.base}/b"]
+
+    async def get_article(self, link, keyword):
+        await self.fetch(link)
+        await self.queue_.put({"title": "t", "link": link})
+
+
+async def test_article_lifecycle_exports(local_site, tmp_path):
+    base = await local_site({"/search": (200, "listing"), "/a": (200, "a"), "/b": (200, "b")})
+    queue = ArticleQueue()
+    scraper = _Scraper(base, "ihsg", queue_=queue, max_pages=1)
+    with tracing.recording(tmp_path / "run.json") as tracer:
+        await scraper.scrape()
+        await queue.put(None)
+        while await queue.get() is not None:
+            pass
+        tracer.export(tmp_path / "run.jsonl")
+
+    by_id = {s.span_id: s for s in tracer.spans}
+    (article,) = [
+        s for s in tracer.spans if s.name == "get_article" and s.attributes["url"] == f"{base}/a"
+    ]
+    assert by_id[article.parent_id].name == "listing"
+    fetch = next(s for s in tracer.spans if s.name == "fetch" and s.parent_id == article.span_id)
+    http = next(s for s in tracer.spans if s.name == "http" and s.parent_id == fetch.span_id)
+    assert http.attributes["status"] == 200
+    wait = next(s for s in tracer.spans if s.name == "queue.wait" and s.attributes["link"] == f"{base}/a")
+    assert wait.parent_id == article.span_id
+
+    chrome = json.loads((tmp_path / "run.json").read_text(encoding="utf-8"))
+    phases = {e["ph"] for e in chrome["traceEvents"]}
+    assert {"M", "X", "b", "e"} <= phases
+    names = {e["args"]["name"] for e in chrome["traceEvents"] if e["name"] == "thread_name"}
+    assert any(name.startswith("_Scraper ") for name in names)
+
+    lines = [json.loads(line) for line in (tmp_path / "run.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert len(lines) == len(tracer.spans)
+    assert {line["trace_id"] for line in lines} == {tracer.trace_id}
+    assert [line["start"] for line in lines] == sorted(line["start"] for line in lines)
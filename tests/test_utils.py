@@ -1,8 +1,15 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
 import pytest
 
 from newswatch.utils import (
     AsyncScraper,
+    CpuTimed,
+    FetchStats,
     _looks_blocked,
+    fetch_phase,
     keyword_matches_url,
     keyword_url_slug,
 )
@@ -101,3 +108,88 @@ class TestKeywordUrlSlug:
         url = "https://www.liputan6.com/news/read/1/harga-pangan-turun"
         assert not keyword_matches_url("makan bergizi gratis", url)
         assert not keyword_matches_url("mbg", url)
+
+
+class TestFetchStats:
+    """Offline tests for per-scraper request and phase statistics."""
+
+    async def test_successful_fetch_records_request_bytes_and_latency(self, local_site):
+        base = await local_site({"/a": (200, "hello")})
+        scraper = AsyncScraper()
+        async with scraper:
+            assert await scraper.fetch(f"{base}/a") == "hello"
+        summary = scraper.fetch_stats.summary()
+        assert summary["requests"] == 1
+        assert summary["failed_requests"] == 0
+        assert summary["bytes_downloaded"] == 5
+        assert summary["latency_p50_ms"] == summary["latency_max_ms"] >= 0
+        assert summary["listing_seconds"] > 0
+        assert summary["article_seconds"] == 0
+
+    async def test_failed_attempts_and_retries_are_counted(self, local_site):
+        base = await local_site({"/a": [(503, ""), (200, "ok")]})
+        scraper = AsyncScraper(max_retries=1)
+        with patch("newswatch.utils.asyncio.sleep", AsyncMock()):
+            async with scraper:
+                assert await scraper.fetch(f"{base}/a") == "ok"
+        stats = scraper.fetch_stats
+        assert (stats.requests, stats.failed_requests, stats.retries) == (2, 1, 1)
+
+    async def test_blocked_response_counts_fallbacks(self, local_site):
+        blocked = "<!doctype html><html><body>Just a moment...</body></html>"
+        base = await local_site({"/a": (200, blocked)})
+        scraper = AsyncScraper()
+        with patch("newswatch.utils._rnet_get", AsyncMock(return_value=None)), patch(
+            "newswatch.utils._playwright_get", AsyncMock(return_value="real")
+        ):
+            async with scraper:
+                assert await scraper.fetch(f"{base}/a") == "real"
+        summary = scraper.fetch_stats.summary()
+        assert summary["fallback_rnet"] == 1
+        assert summary["fallback_playwright"] == 1
+        assert summary["bytes_downloaded"] == len(blocked) + len("real")
+
+    async def test_phase_follows_context(self):
+        stats = FetchStats()
+        stats.record_request(0.5)
+        token = fetch_phase.set("article")
+        try:
+            stats.record_request(0.25)
+        finally:
+            fetch_phase.reset(token)
+        assert stats.phase_seconds["listing"] == 0.5
+        assert stats.phase_seconds["article"] == 0.25
+        assert stats.summary()["latency_p95_ms"] == 500.0
+
+    async def test_cpu_timed_counts_only_its_own_steps(self):
+        stats = FetchStats()
+
+        async def busy():
+            end = time.thread_time() + 0.05
+            while time.thread_time() < end:
+                pass
+            await asyncio.sleep(0.1)
+            return "done"
+
+        async def idle_neighbour():
+            await asyncio.sleep(0.1)
+
+        result, _ = await asyncio.gather(CpuTimed(busy(), stats), idle_neighbour())
+        assert result == "done"
+        assert 0.04 <= stats.parse_cpu_seconds < 0.1
+
+    async def test_cpu_timed_propagates_errors_and_cancellation(self):
+        stats = FetchStats()
+
+        async def fails():
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await CpuTimed(fails(), stats)
+
+        task = asyncio.ensure_future(CpuTimed(asyncio.sleep(10), stats))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
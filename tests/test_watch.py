@@ -0,0 +1,174 @@
+"""Tests for watch mode: adaptive polling, dedup across polls, rotating output."""
+
+import asyncio
+import json
+import sys
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+import newswatch.cli as cli_module
+import newswatch.watch as watch_module
+from newswatch.dedup import SeenLinkStore
+from newswatch.watch import PollSchedule, RotatingJsonlSink, Watcher
+
+
+def test_first_poll_does_not_set_a_rate():
+    schedule = PollSchedule(interval=120, min_interval=30, max_interval=1800)
+    assert schedule.update(40, None) == 120
+    assert schedule.rate is None
+
+
+def test_busy_source_converges_to_min_and_quiet_source_backs_off():
+    busy = PollSchedule(interval=120, min_interval=30, max_interval=1800, target_new=3)
+    for _ in range(5):
+        busy.update(30, busy.interval)
+    assert busy.interval == 30
+
+    quiet = PollSchedule(interval=120, min_interval=30, max_interval=1800)
+    intervals = [quiet.update(0, quiet.interval) for _ in range(12)]
+    assert intervals == sorted(intervals)
+    assert intervals[-1] == 1800
+
+
+def test_interval_targets_a_few_new_links_per_poll():
+    schedule = PollSchedule(interval=120, min_interval=10, max_interval=3600, target_new=3, smoothing=1)
+    # one new link a minute -> about three minutes between polls
+    assert schedule.update(2, 120) == pytest.approx(180)
+
+
+def test_invalid_bounds_are_rejected():
+    with pytest.raises(ValueError):
+        PollSchedule(min_interval=0)
+    with pytest.raises(ValueError):
+        PollSchedule(min_interval=60, max_interval=30)
+
+
+@pytest.fixture
+def listing_source(local_site, listing_scraper, monkeypatch):
+    """Register a ``local`` source whose latest listing serves ``listings`` in
+    turn; returns its base url and the scrapers the watcher builds."""
+
+    async def _make(listings):
+        base = await local_site({"/latest": [(200, body) for body in listings]})
+        scrapers = []
+
+        def _build(keywords, **kwargs):
+            scraper = listing_scraper(keywords, base_url=base, **kwargs)
+            scrapers.append(scraper)
+            return scraper
+
+        monkeypatch.setattr(
+            watch_module, "get_available_scrapers",
+            lambda method="latest": {"local": {"class": _build, "params": {}}},
+        )
+        monkeypatch.setattr(
+            watch_module, "get_scraper_by_slug", lambda slug: SimpleNamespace(browser_required=False)
+        )
+        return base, scrapers
+
+    return _make
+
+
+async def test_polls_emit_only_new_links_and_skip_listed_ones_before_fetching(listing_source):
+    base, scrapers = await listing_source(["a,b", "a,b", "c,a,b"])
+    watcher = Watcher("local", interval=0.01, min_interval=0.01, max_interval=0.02, max_polls=3)
+
+    items = [item async for item in watcher.articles()]
+
+    assert [item["link"] for item in items] == [f"{base}/a", f"{base}/b", f"{base}/c"]
+    assert [scraper.fetched for scraper in scrapers] == [["a", "b", "c"]]
+    assert items[0]["publish_date"] == "2026-10-19 09:30:00"
+    [row] = watcher.summary_rows()
+    assert row["polls"] == 3 and row["articles"] == 3 and row["errors"] == 0
+
+
+async def test_seen_store_links_are_not_fetched_and_new_ones_are_recorded(listing_source, tmp_path):
+    base, scrapers = await listing_source(["a,b"])
+    with SeenLinkStore(tmp_path / "seen.sqlite3") as store:
+        store.add(f"{base}/a")
+        watcher = Watcher("local", seen_store=store, min_interval=0.01, max_interval=0.01, max_polls=1)
+        items = [item async for item in watcher.articles()]
+        assert [item["link"] for item in items] == [f"{base}/b"]
+        assert [scraper.fetched for scraper in scrapers] == [["b"]]
+        assert f"{base}/b" in store
+
+
+async def test_closing_the_generator_stops_the_watch(listing_source):
+    _, scrapers = await listing_source(["a", "b", "c"])
+    watcher = Watcher("local", min_interval=0.01, max_interval=0.01)
+
+    articles = watcher.articles()
+    first = await articles.__anext__()
+    await articles.aclose()
+    await asyncio.sleep(0.05)
+
+    assert first["title"] == "a"
+    assert [scraper.fetched for scraper in scrapers] == [["a"]]
+
+
+async def test_a_watch_proxy_is_set_on_its_scrapers(listing_source):
+    await listing_source(["a"])
+    watcher = Watcher("local", proxy="http://proxy.example:8080")
+    [(_, scraper)] = watcher._select()
+    assert scraper.proxy == "http://proxy.example:8080"
+
+
+async def test_duration_ends_the_watch(listing_source):
+    await listing_source(["a"])
+    watcher = Watcher("local", min_interval=0.01, max_interval=0.01, duration=0.1)
+    items = [item async for item in watcher.articles()]
+    assert len(items) == 1
+    assert watcher.summary_rows()[0]["polls"] > 1
+
+
+def test_sink_rotates_by_period_and_appends(tmp_path, monkeypatch):
+    hours = iter([datetime(2026, 10, 19, 9, 59), datetime(2026, 10, 19, 10, 0), datetime(2026, 10, 19, 10, 5)])
+    sink = RotatingJsonlSink(tmp_path, rotate="hour")
+    monkeypatch.setattr(sink, "path_for", lambda when, f=sink.path_for: f(next(hours)))
+    with sink:
+        for title in ("a", "b", "c"):
+            sink.write({"title": title})
+
+    assert [p.name for p in sink.files] == [
+        "news-watch-latest-20261019_09.jsonl",
+        "news-watch-latest-20261019_10.jsonl",
+    ]
+    later = [json.loads(line)["title"] for line in sink.files[1].read_text().splitlines()]
+    assert later == ["b", "c"]
+
+    with RotatingJsonlSink(tmp_path, rotate="day") as daily:
+        daily.write({"title": "d"})
+    assert daily.files[0].name == f"news-watch-latest-{datetime.now():%Y%m%d}.jsonl"
+
+    with pytest.raises(ValueError):
+        RotatingJsonlSink(tmp_path, rotate="week")
+
+
+def test_cli_watch_runs_the_watcher_and_prints_a_summary(tmp_path, monkeypatch, capsys):
+    seen = {}
+
+    async def fake_run_watch(watcher, sink):
+        seen["watcher"] = watcher
+        sink.write({"title": "a", "link": "https://example.com/a"})
+
+    monkeypatch.setattr(watch_module, "run_watch", fake_run_watch)
+    monkeypatch.setattr(sys, "argv", [
+        "newswatch", "--watch", "--scrapers", "kompas", "--watch-dir", str(tmp_path),
+        "--watch-rotate", "day", "--watch-min-interval", "45", "--watch-duration", "600",
+    ])
+    cli_module.cli()
+
+    watcher = seen["watcher"]
+    assert (watcher.scrapers, watcher.min_interval, watcher.duration) == ("kompas", 45, 600)
+    assert "Wrote 1 article(s)" in capsys.readouterr().out
+    assert len(list(tmp_path.glob("news-watch-latest-*.jsonl"))) == 1
+
+
+def test_cli_watch_rejects_inverted_interval_bounds(monkeypatch):
+    monkeypatch.setattr(sys, "argv", [
+        "newswatch", "--watch", "--watch-min-interval", "600", "--watch-max-interval", "60",
+    ])
+    with pytest.raises(SystemExit):
+        cli_module.cli()